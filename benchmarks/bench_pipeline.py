@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+"""
+Benchmark the calendar and mapping pipeline stages as the span of years grows.
+
+Stages:
+  calendar   generate_liturgical_calendar_v2.generate_full_calendar, year by year
+  normalize  normalize_ordo_csvs.normalize_ordo_csv over one Ordo CSV per year
+  mapping    generate_ordo_lectionary_mapping.generate_mappings over a normalized Ordo
+
+Ordo inputs are synthetic: data/source/2025.csv and 2026.csv (and the
+normalized Ordo built from them) are relabelled to consecutive years from 2025,
+alternating between the two. Input files are written before timing starts.
+
+Each stage/size records wall time (best of --repeat untraced runs), days per
+second, and tracemalloc peak memory (one separate traced run). Runs are
+appended to a JSON history file; --compare flags regressions between two runs.
+
+By default calendar and normalize run at 1/10/100/500 years and mapping at
+1/10/50 (it runs at ~100 days/s, so 500 years takes hours); --sizes applies
+the given sizes to every selected stage.
+
+Run from the repo root:
+  python benchmarks/bench_pipeline.py                              # All stages at their default sizes
+  python benchmarks/bench_pipeline.py --stages mapping --sizes 500 # Hours: only when asked for
+  python benchmarks/bench_pipeline.py --stages calendar normalize --sizes 1 10 100
+  python benchmarks/bench_pipeline.py --output /tmp/run.json       # Also write this run on its own
+  python benchmarks/bench_pipeline.py --compare base.json new.json # Exit 1 on regression
+"""
+
+import argparse
+import contextlib
+import csv
+import datetime
+import io
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'scripts'))
+
+import generate_liturgical_calendar_v2 as calendar_v2
+import generate_ordo_lectionary_mapping as mapping
+import normalize_ordo_csvs
+import ordo_source
+
+HISTORY_JSON = 'benchmarks/history.json'
+SIZES = [1, 10, 100, 500]
+STAGE_SIZES = {'mapping': [1, 10, 50]}  # Default sizes for stages too slow for SIZES
+STAGES = ['calendar', 'normalize', 'mapping']
+FIRST_YEAR = 2025
+ORDO_SOURCES = {2025: 'data/source/2025.csv', 2026: 'data/source/2026.csv'}
+THRESHOLD = 0.10  # Relative slowdown / memory growth reported as a regression
+NOISE_SECONDS = 0.02  # Smaller wall-time differences are timer noise, never regressions
+
+
+def _source_year(year):
+    """Real Ordo year a synthetic year is derived from (alternating 2025, 2026)"""
+    return FIRST_YEAR + (year - FIRST_YEAR) % 2
+
+
+def _years(size):
+    return range(FIRST_YEAR, FIRST_YEAR + size)
+
+
+def prepare_calendar(size, workdir):
+    lectionary = calendar_v2.load_lectionary()
+    years = _years(size)
+
+    def run():
+        # Fresh dict each run so the per-lectionary override cache starts cold
+        fresh = dict(lectionary)
+        return sum(len(calendar_v2.generate_full_calendar(year, fresh)) for year in years)
+    return run
+
+
+def prepare_normalize(size, workdir):
+    sources = {}
+    for year, path in ORDO_SOURCES.items():
+        with open(path, 'r', encoding='utf-8') as f:
+            sources[year] = f.read().split('\n', 1)  # Year header line, body
+    inputs = []
+    for year in _years(size):
+        header, body = sources[_source_year(year)]
+        path = os.path.join(workdir, f"{year}.csv")
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(header.replace(str(_source_year(year)), str(year), 1) + '\n' + body)
+        inputs.append((path, year))
+
+    def run():
+        # Measure parsing itself, not the parse-once caches
+        ordo_source.clear_parsed_cache()
+        return sum(len(normalize_ordo_csvs.normalize_ordo_csv(path, year, cache_dir=None)) for path, year in inputs)
+    return run
+
+
+def prepare_mapping(size, workdir):
+    source_rows = {year: normalize_ordo_csvs.normalize_ordo_csv(path, year, cache_dir=None)
+                   for year, path in ORDO_SOURCES.items()}
+    ordo_csv = os.path.join(workdir, 'ordo_normalized.csv')
+    with open(ordo_csv, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=['calendar_date', 'year', 'liturgical_season', 'liturgical_week',
+                                               'liturgical_name', 'liturgical_rank'])
+        writer.writeheader()
+        for year in _years(size):
+            for entry in source_rows[_source_year(year)]:
+                writer.writerow(dict(entry, year=year, calendar_date=f"{year}{entry['calendar_date'][4:]}"))
+
+    def run():
+        previous, mapping.ORDO_CSV = mapping.ORDO_CSV, ordo_csv
+        try:
+            with contextlib.redirect_stdout(io.StringIO()):  # generate_mappings prints statistics
+                return len(mapping.generate_mappings())
+        finally:
+            mapping.ORDO_CSV = previous
+    return run
+
+
+PREPARE = {'calendar': prepare_calendar, 'normalize': prepare_normalize, 'mapping': prepare_mapping}
+
+
+def measure(run, repeat=1):
+    """(best wall seconds, days processed, tracemalloc peak bytes)"""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        days = run()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+
+    tracemalloc.start()
+    try:
+        run()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return best, days, peak
+
+
+def run_suite(stages, sizes=None, repeat=1):
+    """Results for each stage over sizes (default: the stage's STAGE_SIZES or SIZES)"""
+    results = []
+    for stage in stages:
+        for size in sizes or STAGE_SIZES.get(stage, SIZES):
+            with tempfile.TemporaryDirectory() as workdir:
+                run = PREPARE[stage](size, workdir)
+                seconds, days, peak = measure(run, repeat)
+            result = {
+                'stage': stage,
+                'years': size,
+                'days': days,
+                'wall_seconds': round(seconds, 4),
+                'days_per_second': round(days / seconds, 1) if seconds else None,
+                'peak_memory_bytes': peak,
+            }
+            results.append(result)
+            print(f"  {stage:<10} {size:>4} years  {days:>7,} days  {seconds:>9.3f}s  "
+                  f"{result['days_per_second'] or 0:>10,.0f} days/s  {peak / 2**20:>8.1f} MiB peak")
+    return results
+
+
+def _git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def load_history(filename=HISTORY_JSON):
+    if not os.path.exists(filename):
+        return []
+    with open(filename, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def append_history(run, filename=HISTORY_JSON):
+    history = load_history(filename)
+    history.append(run)
+    with open(filename, 'w', encoding='utf-8') as f:
+        json.dump(history, f, indent=2)
+        f.write('\n')
+
+
+def load_run(filename):
+    """A run from a file holding one run, or the latest run of a history file"""
+    with open(filename, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    return data[-1] if isinstance(data, list) else data
+
+
+def compare_runs(base, new, threshold=THRESHOLD):
+    """[(stage, years, metric, base, new, change)] where new is worse than base by more than threshold"""
+    base_results = {(r['stage'], r['years']): r for r in base['results']}
+    regressions = []
+    for result in new['results']:
+        before = base_results.get((result['stage'], result['years']))
+        if not before:
+            continue
+        for metric in ('wall_seconds', 'peak_memory_bytes'):
+            if metric == 'wall_seconds' and result[metric] - before[metric] < NOISE_SECONDS:
+                continue
+            if before[metric] and result[metric] > before[metric] * (1 + threshold):
+                change = result[metric] / before[metric] - 1
+                regressions.append((result['stage'], result['years'], metric, before[metric], result[metric], change))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark calendar and mapping generation')
+    parser.add_argument('--stages', nargs='+', choices=STAGES, default=STAGES, help='Stages to run (default: all)')
+    parser.add_argument('--sizes', nargs='+', type=int,
+                        help='Year spans for every stage (default: 1 10 100 500; mapping 1 10 50)')
+    parser.add_argument('--repeat', type=int, default=1, help='Timed runs per measurement, best kept (default 1)')
+    parser.add_argument('--history', default=HISTORY_JSON, help=f'History file to append to (default {HISTORY_JSON})')
+    parser.add_argument('--output', help='Also write this run alone to a JSON file')
+    parser.add_argument('--compare', nargs=2, metavar=('BASE', 'NEW'),
+                        help='Compare two result files (run or history) instead of running')
+    parser.add_argument('--threshold', type=float, default=THRESHOLD,
+                        help=f'Relative change counted as a regression (default {THRESHOLD})')
+    args = parser.parse_args()
+
+    if args.compare:
+        base, new = (load_run(f) for f in args.compare)
+        regressions = compare_runs(base, new, args.threshold)
+        print(f"Base: {base['timestamp']} ({base.get('commit')})  New: {new['timestamp']} ({new.get('commit')})")
+        for stage, years, metric, before, after, change in regressions:
+            print(f"  ❌ {stage} {years} years: {metric} {before:,} -> {after:,} (+{change:.0%})")
+        if regressions:
+            raise SystemExit(1)
+        print(f"✅ No regressions over {args.threshold:.0%}")
+        return
+
+    sizes = ', '.join(map(str, args.sizes)) if args.sizes else 'default sizes'
+    print(f"Benchmarking {', '.join(args.stages)} over {sizes} years...")
+    run = {
+        'timestamp': datetime.datetime.now().isoformat(timespec='seconds'),
+        'commit': _git_commit(),
+        'python': platform.python_version(),
+        'machine': platform.machine(),
+        'cpu_count': os.cpu_count(),
+        'results': run_suite(args.stages, args.sizes, args.repeat),
+    }
+
+    append_history(run, args.history)
+    print(f"\nAppended to {args.history}")
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(run, f, indent=2)
+            f.write('\n')
+        print(f"Saved to: {args.output}")
+
+
+if __name__ == '__main__':
+    main()
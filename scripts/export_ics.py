@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+"""
+Export the liturgical calendar with its readings as subscribable iCalendar feeds.
+
+Streams the generated calendar (or the normalized Ordo) merged by date with the
+Ordo-to-Lectionary mapping into RFC 5545 files, one all-day event per day:
+
+  static/calendar/2026.ics                  # One per year
+  static/calendar/liturgical-calendar.ics   # Rolling: 30 days back to a year ahead
+  static/calendar/manifest.json             # Source hash per year
+
+Rows flow through generators one year at a time, so memory stays bounded
+however many years the input covers. A year is only re-encoded when the hash
+of its input rows differs from the manifest; unchanged files keep their mtimes.
+Every event carries the same DTSTAMP (ICS_DTSTAMP, when the current event
+layout was introduced) so that re-encoding unchanged days is byte-identical.
+
+Usage:
+  python scripts/export_ics.py                                  # From liturgical_calendar_full.csv
+  python scripts/export_ics.py --source data/generated/ordo_normalized.csv
+  python scripts/export_ics.py --output-dir build/calendar --rolling-days 60 730
+"""
+
+import argparse
+import csv
+import datetime
+import hashlib
+import json
+import os
+from itertools import groupby
+
+from file_cache import write_atomic
+from generate_liturgical_calendar_v2 import OUTPUT_CSV as CALENDAR_CSV
+from generate_ordo_lectionary_mapping import OUTPUT_CSV as MAPPING_CSV
+
+ICS_DIR = 'static/calendar'
+MANIFEST_FILE = 'manifest.json'
+ROLLING_FILE = 'liturgical-calendar.ics'
+ROLLING_DAYS = (30, 365)  # Days before / after today in the rolling feed
+ICS_FORMAT_VERSION = 2  # Bump when the event layout changes so every year is re-encoded
+ICS_DTSTAMP = '20261019T000000Z'  # Build timestamp of every event; update with ICS_FORMAT_VERSION
+
+PRODID = '-//Archdiocesan Ministries//Liturgical Calendar//EN'
+UID_DOMAIN = 'archdiocesanministries.org.au'
+READING_FIELDS = [('first_reading', 'First Reading'), ('psalm', 'Psalm'),
+                  ('second_reading', 'Second Reading'), ('gospel', 'Gospel')]
+
+
+def escape_text(value):
+    """RFC 5545 TEXT escaping (section 3.3.11)."""
+    return (value.replace('\\', '\\\\').replace(';', '\\;').replace(',', '\\,')
+            .replace('\r\n', '\\n').replace('\n', '\\n'))
+
+
+def fold_line(line):
+    """Fold a content line at 75 octets without splitting a UTF-8 character (section 3.1)."""
+    data = line.encode('utf-8')
+    if len(data) <= 75:
+        return line + '\r\n'
+    parts = []
+    limit = 75
+    while len(data) > limit:
+        cut = limit
+        while cut and (data[cut] & 0xC0) == 0x80:  # Continuation byte: back up to a character start
+            cut -= 1
+        parts.append(data[:cut].decode('utf-8'))
+        data = data[cut:]
+        limit = 74  # Continuation lines start with a space
+    parts.append(data.decode('utf-8'))
+    return '\r\n '.join(parts) + '\r\n'
+
+
+def read_rows(path):
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        yield from csv.DictReader(f)
+
+
+def join_readings(days, mappings):
+    """Merge date-sorted day rows with date-sorted mapping rows: yields (day, mapping or None)."""
+    mappings = iter(mappings)
+    mapping = next(mappings, None)
+    for day in days:
+        date = day['calendar_date']
+        while mapping is not None and mapping['calendar_date'] < date:
+            mapping = next(mappings, None)
+        if mapping is not None and mapping['calendar_date'] == date and mapping.get('lectionary_id'):
+            yield day, mapping
+        else:
+            yield day, None
+
+
+def encode_event(day, mapping):
+    """One all-day VEVENT for a (day, mapping) pair, as folded content lines."""
+    date = day['calendar_date']
+    start = datetime.date.fromisoformat(date)
+    stamp = start.strftime('%Y%m%d')
+
+    details = [day.get('liturgical_rank') or '']
+    season = day.get('liturgical_season') or ''
+    if season:
+        week = day.get('liturgical_week')
+        details.append(f"{season}, Week {week}" if week and week.isdigit() else season)
+    description = ' - '.join(d for d in details if d)
+    if mapping:
+        readings = [f"{label}: {mapping[field]}" for field, label in READING_FIELDS if mapping.get(field)]
+        description = '\n'.join([description, ''] + readings) if description else '\n'.join(readings)
+
+    lines = [
+        'BEGIN:VEVENT',
+        f"UID:{date}@{UID_DOMAIN}",
+        f"DTSTAMP:{ICS_DTSTAMP}",
+        f"DTSTART;VALUE=DATE:{stamp}",
+        f"DTEND;VALUE=DATE:{(start + datetime.timedelta(days=1)):%Y%m%d}",
+        f"SUMMARY:{escape_text(day['liturgical_name'])}",
+    ]
+    if description:
+        lines.append(f"DESCRIPTION:{escape_text(description)}")
+    if season:
+        lines.append(f"CATEGORIES:{escape_text(season)}")
+    lines += ['TRANSP:TRANSPARENT', 'END:VEVENT']
+    return ''.join(fold_line(line) for line in lines)
+
+
+def calendar_header(name):
+    lines = ['BEGIN:VCALENDAR', 'VERSION:2.0', f"PRODID:{PRODID}", 'CALSCALE:GREGORIAN',
+             'METHOD:PUBLISH', f"X-WR-CALNAME:{escape_text(name)}", 'X-WR-TIMEZONE:Australia/Brisbane']
+    return ''.join(fold_line(line) for line in lines)
+
+
+CALENDAR_FOOTER = 'END:VCALENDAR\r\n'
+
+
+def source_hash(pairs):
+    """Digest of a year's input rows (and the format version) that decides re-encoding."""
+    digest = hashlib.sha256(f"v{ICS_FORMAT_VERSION}".encode('utf-8'))
+    for day, mapping in pairs:
+        digest.update(json.dumps([day, mapping], sort_keys=True, ensure_ascii=False).encode('utf-8'))
+    return digest.hexdigest()
+
+
+def load_manifest(output_dir):
+    path = os.path.join(output_dir, MANIFEST_FILE)
+    if not os.path.exists(path):
+        return {}
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f).get('files', {})
+
+
+def _read_text(path):
+    if not os.path.exists(path):
+        return None
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        return f.read()
+
+
+def export_ics(source=CALENDAR_CSV, mapping_file=MAPPING_CSV, output_dir=ICS_DIR,
+               rolling_days=ROLLING_DAYS, today=None):
+    """Write changed year feeds, the rolling feed and the manifest. Returns stats dict."""
+    os.makedirs(output_dir, exist_ok=True)
+    previous = load_manifest(output_dir)
+    today = today or datetime.date.today()
+    window = ((today - datetime.timedelta(days=rolling_days[0])).isoformat(),
+              (today + datetime.timedelta(days=rolling_days[1])).isoformat())
+
+    mappings = read_rows(mapping_file) if os.path.exists(mapping_file) else iter(())
+    pairs = join_readings(read_rows(source), mappings)
+
+    manifest = {}
+    rolling = []  # Encoded events inside the window (about a year of them)
+    stats = {'written': 0, 'unchanged': 0, 'removed': 0, 'events': 0}
+
+    for year, year_pairs in groupby(pairs, key=lambda pair: pair[0]['calendar_date'][:4]):
+        year_pairs = list(year_pairs)  # One year at a time
+        name = f"{year}.ics"
+        digest = source_hash(year_pairs)
+        manifest[name] = {'source_sha256': digest, 'count': len(year_pairs),
+                          'from': year_pairs[0][0]['calendar_date'], 'to': year_pairs[-1][0]['calendar_date']}
+        stats['events'] += len(year_pairs)
+
+        in_window = [pair for pair in year_pairs if window[0] <= pair[0]['calendar_date'] <= window[1]]
+        rolling.extend(encode_event(*pair) for pair in in_window)
+
+        path = os.path.join(output_dir, name)
+        if previous.get(name, {}).get('source_sha256') == digest and os.path.exists(path):
+            stats['unchanged'] += 1
+            continue
+        write_atomic(path, (calendar_header(f"Liturgical Calendar {year}"),
+                             *(encode_event(*pair) for pair in year_pairs), CALENDAR_FOOTER))
+        stats['written'] += 1
+
+    # Drop feeds for years no longer in the source
+    for name in sorted(set(previous) - set(manifest)):
+        path = os.path.join(output_dir, name)
+        if os.path.exists(path):
+            os.remove(path)
+        stats['removed'] += 1
+
+    rolling_data = calendar_header('Liturgical Calendar') + ''.join(rolling) + CALENDAR_FOOTER
+    rolling_path = os.path.join(output_dir, ROLLING_FILE)
+    if _read_text(rolling_path) != rolling_data:
+        write_atomic(rolling_path, rolling_data)
+
+    manifest_data = json.dumps({'version': ICS_FORMAT_VERSION, 'files': manifest}, indent=2, sort_keys=True)
+    manifest_path = os.path.join(output_dir, MANIFEST_FILE)
+    if _read_text(manifest_path) != manifest_data:
+        write_atomic(manifest_path, manifest_data)
+
+    print(f"\n✅ iCalendar feeds in {output_dir}/: {stats['written']} written, "
+          f"{stats['unchanged']} unchanged, {stats['removed']} removed "
+          f"({stats['events']:,} days, {len(rolling)} in {ROLLING_FILE})")
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Export the liturgical calendar as iCalendar (.ics) feeds')
+    parser.add_argument('--source', default=CALENDAR_CSV,
+                        help=f'Calendar or normalized Ordo CSV (default {CALENDAR_CSV})')
+    parser.add_argument('--mapping', default=MAPPING_CSV, help=f'Readings mapping CSV (default {MAPPING_CSV})')
+    parser.add_argument('--output-dir', default=ICS_DIR, help=f'Feed directory (default {ICS_DIR})')
+    parser.add_argument('--rolling-days', nargs=2, type=int, metavar=('BEFORE', 'AFTER'), default=ROLLING_DAYS,
+                        help='Rolling feed window around today (default 30 365)')
+    args = parser.parse_args()
+
+    export_ics(args.source, args.mapping, args.output_dir, tuple(args.rolling_days))
+
+
+if __name__ == '__main__':
+    main()
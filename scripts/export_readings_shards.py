@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Export precomputed readings as static JSON shards for CDN serving.
+
+Writes one shard per year and one per month, plus a manifest of content hashes:
+
+  static/readings/manifest.json
+  static/readings/2025.json
+  static/readings/2025-12.json
+
+Each day carries the date, Ordo name, rank, season, week and all four readings
+(the /api/v1/readings shape). Shards whose content hash is unchanged are not
+rewritten, so their mtimes and CDN caches stay valid.
+
+Usage:
+  python scripts/export_readings_shards.py                       # From the generated mapping CSV
+  python scripts/export_readings_shards.py --output-dir build/readings
+  python scripts/generate_ordo_lectionary_mapping.py --export-shards
+"""
+
+import argparse
+import csv
+import hashlib
+import json
+import os
+
+from file_cache import write_atomic
+from generate_ordo_lectionary_mapping import OUTPUT_CSV, load_lectionary, load_ordo
+from readings_server import build_reading_record
+
+SHARDS_DIR = 'static/readings'
+MANIFEST_FILE = 'manifest.json'
+SHARD_FORMAT_VERSION = 1
+
+
+def build_days(mappings):
+    """Join mappings with Ordo and Lectionary into date-sorted readings records."""
+    ordo = load_ordo()
+    lectionary = {row['Admin Order']: row for row in load_lectionary()}
+
+    days = []
+    for m in sorted(mappings, key=lambda m: m['calendar_date']):
+        lect_entry = lectionary.get(m['lectionary_id'])
+        if not lect_entry:
+            continue
+        date = m['calendar_date']
+        days.append(build_reading_record(date, ordo.get(date), lect_entry))
+    return days
+
+
+def group_shards(days):
+    """Return {shard_name: [records]} for every year and month present."""
+    shards = {}
+    for record in days:
+        date = record['date']
+        shards.setdefault(f"{date[:4]}.json", []).append(record)
+        shards.setdefault(f"{date[:7]}.json", []).append(record)
+    return shards
+
+
+def encode_shard(name, records):
+    """Serialize a shard deterministically so equal content gives equal bytes."""
+    payload = {
+        'version': SHARD_FORMAT_VERSION,
+        'shard': name[:-len('.json')],
+        'from': records[0]['date'],
+        'to': records[-1]['date'],
+        'count': len(records),
+        'days': records,
+    }
+    return json.dumps(payload, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def load_manifest(output_dir):
+    path = os.path.join(output_dir, MANIFEST_FILE)
+    if not os.path.exists(path):
+        return {}
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f).get('shards', {})
+
+
+def _read_bytes(path):
+    if not os.path.exists(path):
+        return None
+    with open(path, 'rb') as f:
+        return f.read()
+
+
+def export_shards(mappings, output_dir=SHARDS_DIR):
+    """Write changed shards and the manifest. Returns stats dict."""
+    os.makedirs(output_dir, exist_ok=True)
+    previous = load_manifest(output_dir)
+    shards = group_shards(build_days(mappings))
+
+    manifest = {}
+    stats = {'written': 0, 'unchanged': 0, 'removed': 0}
+
+    for name in sorted(shards):
+        records = shards[name]
+        data = encode_shard(name, records)
+        digest = hashlib.sha256(data).hexdigest()
+        manifest[name] = {
+            'sha256': digest,
+            'bytes': len(data),
+            'from': records[0]['date'],
+            'to': records[-1]['date'],
+            'count': len(records),
+        }
+
+        path = os.path.join(output_dir, name)
+        if previous.get(name, {}).get('sha256') == digest and os.path.exists(path):
+            stats['unchanged'] += 1
+            continue
+        write_atomic(path, data, binary=True)
+        stats['written'] += 1
+
+    # Drop shards that no longer have any dates (e.g. a year removed from the Ordo)
+    for name in sorted(set(previous) - set(manifest)):
+        path = os.path.join(output_dir, name)
+        if os.path.exists(path):
+            os.remove(path)
+        stats['removed'] += 1
+
+    manifest_data = json.dumps({'version': SHARD_FORMAT_VERSION, 'shards': manifest},
+                               indent=2, sort_keys=True).encode('utf-8')
+    manifest_path = os.path.join(output_dir, MANIFEST_FILE)
+    if _read_bytes(manifest_path) != manifest_data:
+        write_atomic(manifest_path, manifest_data, binary=True)
+
+    print(f"\n✅ Readings shards in {output_dir}/: {stats['written']} written, "
+          f"{stats['unchanged']} unchanged, {stats['removed']} removed")
+    return stats
+
+
+def load_mappings(mapping_file=OUTPUT_CSV):
+    with open(mapping_file, 'r', encoding='utf-8') as f:
+        return list(csv.DictReader(f))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Export static readings shards from the generated mapping')
+    parser.add_argument('--output-dir', default=SHARDS_DIR, help=f'Shard directory (default {SHARDS_DIR})')
+    parser.add_argument('--mapping', default=OUTPUT_CSV, help='Mapping CSV to export')
+    args = parser.parse_args()
+
+    export_shards(load_mappings(args.mapping), args.output_dir)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,70 @@
+"""
+Hash-keyed file caches and atomic writes shared by the pipeline scripts.
+
+Derived artifacts (the classified lectionary, scripture verse ranges, parsed
+Ordo years) are pickled together with a format version and the sha256 of the
+source they were built from, and rebuilt when either changes:
+
+  digest = file_hash('data/source/Lectionary.csv')
+  payload = load_pickle(cache_file, VERSION, digest)   # None on any miss
+  if payload is None:
+      payload = build()
+      save_pickle(cache_file, VERSION, digest, payload)
+
+Every write goes to a per-process tmp file and is moved into place with
+os.replace(), so concurrent writers (e.g. pool workers) never collide on the
+tmp file and readers never see a half-written file.
+"""
+
+import hashlib
+import os
+import pickle
+
+
+def file_hash(path):
+    """sha256 hex digest of a file's bytes"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def write_atomic(path, chunks, binary=False):
+    """Write chunks (a str, or bytes if binary, or an iterable of them) to path atomically"""
+    if isinstance(chunks, (str, bytes)):
+        chunks = (chunks,)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with (open(tmp_path, 'wb') if binary else open(tmp_path, 'w', encoding='utf-8', newline='')) as f:
+            for chunk in chunks:
+                f.write(chunk)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def load_pickle(path, version, source_hash):
+    """Payload cached at path for (version, source_hash), or None if missing, stale or unreadable"""
+    try:
+        with open(path, 'rb') as f:
+            cached = pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except (pickle.UnpicklingError, EOFError, AttributeError, ImportError, IndexError, TypeError, ValueError):
+        return None  # Truncated, corrupt or written by an incompatible script: rebuild
+    if not isinstance(cached, dict):
+        return None
+    if cached.get('version') != version or cached.get('source_sha256') != source_hash:
+        return None
+    return cached.get('payload')
+
+
+def save_pickle(path, version, source_hash, payload):
+    """Cache payload at path for (version, source_hash)"""
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    data = pickle.dumps({'version': version, 'source_sha256': source_hash, 'payload': payload},
+                        protocol=pickle.HIGHEST_PROTOCOL)
+    write_atomic(path, data, binary=True)
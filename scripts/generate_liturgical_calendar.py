@@ -7,42 +7,23 @@ Uses Easter calculation to determine all moveable dates
 from datetime import datetime, timedelta
 import csv
 
-def calculate_easter(year):
-    """Calculate Easter Sunday using Computus algorithm"""
-    a = year % 19
-    b = year // 100
-    c = year % 100
-    d = b // 4
-    e = b % 4
-    f = (b + 8) // 25
-    g = (b - f + 1) // 3
-    h = (19 * a + b - d - g + 15) % 30
-    i = c // 4
-    k = c % 4
-    l = (32 + 2 * e + 2 * i - h - k) % 7
-    m = (a + 11 * h + 22 * l) // 451
-    month = (h + l - 7 * m + 114) // 31
-    day = ((h + l - 7 * m + 114) % 31) + 1
-    return datetime(year, month, day)
+from key_dates import key_dates
 
 def generate_full_calendar(year):
     """Generate complete liturgical calendar for a year"""
     entries = []
 
-    # Calculate key dates
-    easter = calculate_easter(year)
-    ash_wednesday = easter - timedelta(days=46)
-    palm_sunday = easter - timedelta(days=7)
-    pentecost = easter + timedelta(days=49)
-    trinity_sunday = easter + timedelta(days=56)
-    corpus_christi = easter + timedelta(days=60)
-    sacred_heart = easter + timedelta(days=68)
-
-    # First Sunday of Advent
-    christmas = datetime(year, 12, 25)
-    days_to_subtract = christmas.weekday() + 1
-    first_advent = christmas - timedelta(days=days_to_subtract + 21)
-    christ_the_king = first_advent - timedelta(days=7)
+    # Key dates from the shared table
+    year_dates = key_dates(year)
+    easter = year_dates['easter']
+    ash_wednesday = year_dates['ash_wednesday']
+    palm_sunday = year_dates['palm_sunday']
+    pentecost = year_dates['pentecost']
+    trinity_sunday = year_dates['trinity_sunday']
+    corpus_christi = easter + timedelta(days=60)  # Thursday (this generator predates the AU Sunday rule)
+    sacred_heart = year_dates['sacred_heart']
+    first_advent = year_dates['first_advent']
+    christ_the_king = year_dates['christ_the_king']
 
     # Baptism of the Lord (Sunday after Epiphany, Jan 6)
     epiphany = datetime(year, 1, 6)
@@ -5,29 +5,31 @@ Uses Easter calculation to determine all moveable dates
 Incorporates ALL entries from Lectionary.csv including 248 fixed feast days
 """
 
+from collections import OrderedDict, deque
+from collections.abc import Mapping
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
+from functools import lru_cache
+from itertools import islice
+import argparse
 import csv
+import hashlib
+import io
+import json
+import os
+import re
 
-def calculate_easter(year):
-    """Calculate Easter Sunday using Computus algorithm"""
-    a = year % 19
-    b = year // 100
-    c = year % 100
-    d = b // 4
-    e = b % 4
-    f = (b + 8) // 25
-    g = (b - f + 1) // 3
-    h = (19 * a + b - d - g + 15) % 30
-    i = c // 4
-    k = c % 4
-    l = (32 + 2 * e + 2 * i - h - k) % 7
-    m = (a + 11 * h + 22 * l) // 451
-    month = (h + l - 7 * m + 114) // 31
-    day = ((h + l - 7 * m + 114) % 31) + 1
-    return datetime(year, month, day)
+from file_cache import file_hash, load_pickle, save_pickle, write_atomic
+from key_dates import key_dates, ordinary_time_week
 
-def load_lectionary():
-    """Load the Lectionary.csv and organize by type"""
+LECTIONARY_CSV = 'data/source/Lectionary.csv'
+LECTIONARY_SNAPSHOT = 'data/generated/lectionary_classified.pickle'
+
+# Bump when classify_lectionary's rules change so snapshots are rebuilt
+CLASSIFIER_VERSION = 1
+
+def classify_lectionary(lectionary_file=LECTIONARY_CSV):
+    """Read Lectionary.csv and organize its rows by type"""
     lectionary = {
         'sundays': {},  # Key: (Year, Week, Season) -> entry
         'weekdays': {},  # Key: (Year, Week, Day, Season) -> entry
@@ -47,7 +49,7 @@ def load_lectionary():
         'September': 9, 'October': 10, 'November': 11, 'December': 12
     }
 
-    with open('data/source/Lectionary.csv', 'r', encoding='utf-8-sig') as f:
+    with open(lectionary_file, 'r', encoding='utf-8-sig') as f:
         reader = csv.DictReader(f)
         for row in reader:
             day_type = row['Day'].strip()
@@ -134,6 +136,57 @@ def load_lectionary():
 
     return lectionary
 
+def load_lectionary_snapshot(lectionary_file=LECTIONARY_CSV, snapshot_file=LECTIONARY_SNAPSHOT, rebuild=False):
+    """Classified lectionary from the snapshot, reclassifying only when the CSV or rules changed"""
+    source_hash = file_hash(lectionary_file)
+    cached = None if rebuild else load_pickle(snapshot_file, CLASSIFIER_VERSION, source_hash)
+    if cached is not None:
+        return cached
+
+    lectionary = classify_lectionary(lectionary_file)
+    save_pickle(snapshot_file, CLASSIFIER_VERSION, source_hash, lectionary)
+    return lectionary
+
+class LazyLectionary(Mapping):
+    """
+    The classified lectionary (fixed_feasts, sundays, weekdays, ...), read from
+    its snapshot on first access, i.e. only once name assignment needs it.
+    """
+
+    def __init__(self, lectionary_file=LECTIONARY_CSV, snapshot_file=LECTIONARY_SNAPSHOT):
+        self.lectionary_file = lectionary_file
+        self.snapshot_file = snapshot_file
+        self._buckets = None
+        self._source_digest = None
+
+    def source_digest(self):
+        """Hash of Lectionary.csv and the classifier rules, without loading the snapshot"""
+        if self._source_digest is None:
+            self._source_digest = f"{CLASSIFIER_VERSION}:{file_hash(self.lectionary_file)}"
+        return self._source_digest
+
+    @property
+    def loaded(self):
+        return self._buckets is not None
+
+    def _load(self):
+        if self._buckets is None:
+            self._buckets = load_lectionary_snapshot(self.lectionary_file, self.snapshot_file)
+        return self._buckets
+
+    def __getitem__(self, key):
+        return self._load()[key]
+
+    def __iter__(self):
+        return iter(self._load())
+
+    def __len__(self):
+        return len(self._load())
+
+def load_lectionary():
+    """The Lectionary.csv organized by type, loaded lazily from its snapshot"""
+    return LazyLectionary()
+
 def get_liturgical_year(date):
     """Determine which liturgical year cycle (A, B, C) for a given date"""
     # Liturgical year starts on First Sunday of Advent
@@ -142,9 +195,7 @@ def get_liturgical_year(date):
     # Year B: 2026-2027, 2029-2030, 2032-2033 etc (year % 3 == 2)
 
     year = date.year
-    christmas = datetime(year, 12, 25)
-    days_to_subtract = christmas.weekday() + 1
-    first_advent = christmas - timedelta(days=days_to_subtract + 21)
+    first_advent = key_dates(year)['first_advent']
 
     # If we're before Advent of this year, we're in previous liturgical year
     if date < first_advent:
@@ -161,14 +212,12 @@ def get_liturgical_year(date):
     else:
         return 'B'
 
-def determine_season(current_date, year_dates, ordinary_weeks):
+def determine_season(current_date, year_dates):
     """
     PHASE 1: Determine liturgical season based ONLY on date ranges.
     This season assignment is IMMUTABLE - it can never be overridden.
     Returns: (season, week_number)
     """
-    date_str = current_date.strftime('%Y-%m-%d')
-
     # Christmas Season (Dec 25 - Baptism of Lord)
     if current_date >= datetime(current_date.year, 12, 25) or current_date < year_dates['baptism_lord']:
         return ('Christmas', None)
@@ -200,264 +249,302 @@ def determine_season(current_date, year_dates, ordinary_weeks):
         easter_week = (days_since_easter // 7) + 1
         return ('Easter', easter_week)
 
-    # Ordinary Time (everything else)
+    # Ordinary Time (everything else) - week from Baptism / Christ the King (Week 34)
     else:
-        week_number = ordinary_weeks.get(date_str)
+        week_number = ordinary_time_week(current_date, year_dates)
         return ('Ordinary Time', week_number)
 
+# Name/rank rules as data. resolve_year_celebrations() turns them into one
+# event per candidate celebration and settles collisions by precedence class.
+
+# Precedence classes (Table of Liturgical Days, General Norms 59; lower wins)
+TRIDUUM = 1               # Paschal Triduum, Easter Sunday
+PRINCIPAL = 2             # Christmas, Epiphany, Ascension, Pentecost, Ash Wednesday,
+                          # Sundays of Advent/Lent/Easter, Holy Week, Easter Octave
+SOLEMNITY = 3             # Solemnities of the General Calendar
+FEAST_OF_THE_LORD = 5
+SUNDAY_CLASS = 6          # Sundays of Christmas and Ordinary Time
+FEAST = 7
+PRIVILEGED_WEEKDAY = 9    # Advent 17-24 December, Christmas Octave, Lent weekdays
+WEEKDAY = 13
+TRANSFER_FREE_FROM = 9    # Transferred solemnities go to the nearest day of class >= 9 ...
+TRANSFER_DISPLACES = FEAST  # ... and may displace a Lectionary fixed day (it does not
+                            # tell feasts from memorials, and most are memorials)
+
+# PRIORITY 1: Fixed Date Solemnities (override name/rank, but NOT season!)
+FIXED_SOLEMNITIES = {
+    (3, 19): '19 March – St Joseph',
+    (3, 25): '25 March – Annunciation',
+    (6, 24): '24 June – Birth of John the Baptist',
+    (6, 29): '29 June – Ss Peter and Paul',
+    (8, 15): '15 August – Assumption',
+    (11, 1): '1 November – All Saints',
+    (12, 8): '8 December – Immaculate Conception',
+}
+# Impeded in this season, or by this celebration -> anticipated to the nearest
+# earlier free day instead (otherwise, e.g. under Corpus Christi, transferred as usual)
+ANTICIPATE_IF_IMPEDED_BY = {
+    (3, 19): 'Holy Week',              # St Joseph: Saturday before Palm Sunday
+    (6, 24): 'Sacred Heart of Jesus',  # John the Baptist: Thursday 23 June, as in 2022
+                                       # (keeps Saturday for the Immaculate Heart)
+}
+
+# PRIORITY 2: Moveable Solemnities (key date -> (name, precedence class))
+MOVEABLE_SOLEMNITIES = {
+    'easter': ('Easter Sunday', TRIDUUM),
+    'ascension': ('Ascension of the Lord', PRINCIPAL),
+    'pentecost': ('Pentecost Sunday', PRINCIPAL),
+    'trinity_sunday': ('Trinity Sunday', SOLEMNITY),
+    'corpus_christi': ('THE BODY AND BLOOD OF CHRIST', SOLEMNITY),
+    'sacred_heart': ('Sacred Heart of Jesus', SOLEMNITY),
+    'christ_the_king': ('Our Lord Jesus Christ, King of the Universe', SOLEMNITY),
+}
+
+# PRIORITY 3: Fixed Feasts from the Lectionary. Feasts of the Lord replace
+# Sundays in Ordinary Time; other fixed days only fall on weekdays.
+FEASTS_OF_THE_LORD = ('Presentation of the Lord', 'Transfiguration', 'Exaltation of the Cross',
+                      'Dedication of St John Lateran')
+
+# PRIORITY 4: Special days within their seasons
+FIXED_SEASON_DAYS = {
+    (12, 25): ('Christmas Day', 'Solemnity', PRINCIPAL),
+    (1, 1): ('Mary, Mother of God', 'Solemnity', SOLEMNITY),
+}
+# (key date, days after it, name, rank, precedence class); name may use {dow_name}
+MOVEABLE_SEASON_DAYS = [
+    ('epiphany', 0, 'Epiphany of the Lord', 'Solemnity', PRINCIPAL),
+    ('baptism_lord', 0, 'Baptism of the Lord', 'Feast', FEAST_OF_THE_LORD),
+    ('ash_wednesday', 0, 'Ash Wednesday', 'Ash Wednesday', PRINCIPAL),
+    ('ash_wednesday', 1, '{dow_name} after Ash Wednesday', 'Feria', PRIVILEGED_WEEKDAY),
+    ('ash_wednesday', 2, '{dow_name} after Ash Wednesday', 'Feria', PRIVILEGED_WEEKDAY),
+    ('ash_wednesday', 3, '{dow_name} after Ash Wednesday', 'Feria', PRIVILEGED_WEEKDAY),
+    ('palm_sunday', 0, 'Palm Sunday', 'Sunday', PRINCIPAL),
+    ('easter', -3, 'Holy Thursday', 'Triduum', TRIDUUM),
+    ('easter', -2, 'Good Friday', 'Triduum', TRIDUUM),
+    ('easter', -1, 'Holy Saturday', 'Triduum', TRIDUUM),
+]
+
+# Seasonal defaults: season -> (Sunday (name, rank), weekday (name, rank))
+SEASONAL_DEFAULTS = {
+    'Christmas': (('{dow_name} of Christmas Season', 'Feria'), ('{dow_name} of Christmas Season', 'Feria')),
+    'Advent': (('{ordinal} Sunday of Advent', 'Sunday'), ('{dow_name} of {ordinal} week of Advent', 'Feria')),
+    'Lent': (('{ordinal} Sunday of Lent', 'Sunday'), ('{dow_name} of {ordinal} week of Lent', 'Feria')),
+    'Holy Week': (('{dow_name} of Holy Week', 'Feria'), ('{dow_name} of Holy Week', 'Feria')),
+    'Easter': (('{ordinal} Sunday of Easter', 'Sunday'), ('{dow_name} of {ordinal} week of Easter', 'Feria')),
+    'Ordinary Time': (('{ordinal} Sunday in Ordinary Time', 'Sunday'),
+                      ('{dow_name} of Week {week} in Ordinary Time', 'Feria')),
+}
+DAY_NAMES = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
+
+def seasonal_precedence(current_date, season, year_dates):
+    """Precedence class of the seasonal day itself (before any celebration)"""
+    sunday = current_date.weekday() == 6
+    if season == 'Holy Week' or year_dates['easter'] <= current_date <= year_dates['easter'] + timedelta(days=7):
+        return PRINCIPAL
+    if sunday:
+        return PRINCIPAL if season in ('Advent', 'Lent', 'Easter') else SUNDAY_CLASS
+    if season == 'Lent' or (current_date.month == 12 and current_date.day >= 17):
+        return PRIVILEGED_WEEKDAY
+    return WEEKDAY
+
+def _fixed_feast_precedence(month, day, name):
+    if any(lord in name for lord in FEASTS_OF_THE_LORD):
+        return FEAST_OF_THE_LORD
+    # "17th December" / "2nd January" entries are the proper weekday readings
+    if not any(c in name for c in '–—-'):
+        return PRIVILEGED_WEEKDAY if month == 12 else WEEKDAY
+    return FEAST
+
+_feast_candidates = (None, [])  # (fixed_feasts it was built from, candidates)
+
+def _fixed_feast_candidates(fixed_feasts):
+    """[(month, day, name, precedence)] for the Lectionary's fixed days (year-independent)"""
+    global _feast_candidates
+    if _feast_candidates[0] is not fixed_feasts:
+        candidates = []
+        for (month, day), feast in sorted(fixed_feasts.items()):
+            if (month, day) in FIXED_SOLEMNITIES or (month, day) in FIXED_SEASON_DAYS:
+                continue  # Same celebration as the solemnity
+            name = feast['Liturgical Day']
+            candidates.append((month, day, name, _fixed_feast_precedence(month, day, name)))
+        _feast_candidates = (fixed_feasts, candidates)
+    return _feast_candidates[1]
+
+def resolve_year_celebrations(year, year_dates, fixed_feasts):
+    """
+    Build every candidate celebration of a year as an event, then settle
+    collisions in one pass over the date-sorted events: on each day the lowest
+    precedence class wins unless the seasonal day itself outranks it; impeded
+    solemnities are transferred to the nearest following free day (or
+    anticipated, see ANTICIPATE_IF_IMPEDED_BY); everything else that loses
+    is omitted.
+
+    fixed_feasts: lectionary['fixed_feasts'], keyed by (month, day).
+    Returns (overrides {day ordinal: (name, rank)}, transfers [(name, from, to)]).
+    """
+    # (ordinal, precedence, order, name, rank, transferable (month, day) or None)
+    events = []
+
+    def add(day, name, rank, precedence, order=0, transferable=None):
+        events.append((day.toordinal(), precedence, order,
+                       name.format(dow_name=DAY_NAMES[day.weekday()]), rank, transferable))
+
+    for key, offset, name, rank, precedence in MOVEABLE_SEASON_DAYS:
+        add(year_dates[key] + timedelta(days=offset), name, rank, precedence)
+    for (month, day), (name, rank, precedence) in FIXED_SEASON_DAYS.items():
+        add(datetime(year, month, day), name, rank, precedence)
+    for key, (name, precedence) in MOVEABLE_SOLEMNITIES.items():
+        add(year_dates[key], name, 'Solemnity', precedence)
+    for (month, day), name in FIXED_SOLEMNITIES.items():
+        # Solemnities of the Lord outrank saints' solemnities of the same class
+        add(datetime(year, month, day), name, 'Solemnity', SOLEMNITY, order=1, transferable=(month, day))
+    for month, day, name, precedence in _fixed_feast_candidates(fixed_feasts):
+        try:
+            feast_date = datetime(year, month, day)
+        except ValueError:
+            continue  # 29 February in a common year
+        events.append((feast_date.toordinal(), precedence, 2, name, 'Feast', None))
+
+    events.sort()
+
+    # One pass: the first event of each day is its strongest candidate
+    overrides = {}
+    occupied = {}  # ordinal -> precedence of what now holds the day
+    impeded = []
+    previous = None
+    for ordinal, precedence, order, name, rank, transferable in events:
+        if ordinal != previous:
+            previous = ordinal
+            current_date = datetime.fromordinal(ordinal)
+            day_class = seasonal_precedence(current_date, determine_season(current_date, year_dates)[0], year_dates)
+            if precedence <= day_class:
+                overrides[ordinal] = (name, rank)
+                occupied[ordinal] = precedence
+                continue
+        if transferable:
+            impeded.append((ordinal, precedence, name, rank, transferable))
+
+    # Transfers: nearest free day after (or before) the impeded date
+    transfers = []
+    for ordinal, precedence, name, rank, (month, day) in impeded:
+        original = datetime.fromordinal(ordinal)
+        season = determine_season(original, year_dates)[0]
+        holder = overrides[ordinal][0] if ordinal in overrides else season  # Celebration or seasonal day
+        step = -1 if ANTICIPATE_IF_IMPEDED_BY.get((month, day)) in (season, holder) else 1
+        target = ordinal + step
+        while True:
+            target_date = datetime.fromordinal(target)
+            target_season = determine_season(target_date, year_dates)[0]
+            if (occupied.get(target, WEEKDAY) >= TRANSFER_DISPLACES
+                    and seasonal_precedence(target_date, target_season, year_dates) >= TRANSFER_FREE_FROM):
+                break
+            target += step
+        overrides[target] = (name, rank)
+        occupied[target] = precedence
+        transfers.append((name, original, target_date))
+
+    return overrides, transfers
+
+def compile_day_overrides(year, year_dates, fixed_feasts):
+    """Every date-specific name/rank for a year as {day ordinal: (name, rank)}"""
+    return resolve_year_celebrations(year, year_dates, fixed_feasts)[0]
+
+_override_tables = OrderedDict()  # year -> (lectionary, overrides), least recently used first
+_OVERRIDE_TABLES_MAX = 64
+
+def year_overrides(year, year_dates, lectionary):
+    """Compiled overrides for a year, cached per lectionary (LRU of _OVERRIDE_TABLES_MAX years)"""
+    cached = _override_tables.get(year)
+    if cached and cached[0] is lectionary:
+        _override_tables.move_to_end(year)
+        return cached[1]
+    overrides = compile_day_overrides(year, year_dates, lectionary['fixed_feasts'])
+    _override_tables[year] = (lectionary, overrides)
+    _override_tables.move_to_end(year)
+    if len(_override_tables) > _OVERRIDE_TABLES_MAX:
+        _override_tables.popitem(last=False)
+    return overrides
+
+@lru_cache(maxsize=None)
+def seasonal_default(season, week_number, dow):
+    """Name and rank for a day with no date-specific rule"""
+    sunday, weekday = SEASONAL_DEFAULTS.get(season, (('{dow_name}', 'Feria'),) * 2)
+    name, rank = sunday if dow == 6 else weekday
+    return (name.format(dow_name=DAY_NAMES[dow], ordinal=self_ordinal(week_number), week=week_number), rank)
+
 def determine_name_and_rank(current_date, season, week_number, dow, dow_name, year_dates, lectionary):
     """
     PHASE 2: Determine liturgical_name and liturgical_rank.
     Season is READ-ONLY - must not be modified!
+    One lookup in the year's compiled overrides, else the seasonal default.
     Returns: (liturgical_name, liturgical_rank)
     """
-    month = current_date.month
-    day = current_date.day
-
-    # PRIORITY 1: Fixed Date Solemnities (override name/rank, but NOT season!)
-    if month == 3 and day == 19:
-        return ('19 March – St Joseph', 'Solemnity')
-    elif month == 3 and day == 25:
-        return ('25 March – Annunciation', 'Solemnity')
-    elif month == 6 and day == 24:
-        return ('24 June – Birth of John the Baptist', 'Solemnity')
-    elif month == 6 and day == 29:
-        return ('29 June – Ss Peter and Paul', 'Solemnity')
-    elif month == 8 and day == 15:
-        return ('15 August – Assumption', 'Solemnity')
-    elif month == 11 and day == 1:
-        return ('1 November – All Saints', 'Solemnity')
-    elif month == 12 and day == 8:
-        return ('8 December – Immaculate Conception', 'Solemnity')
-
-    # PRIORITY 2: Moveable Solemnities
-    if current_date == year_dates['easter']:
-        return ('Easter Sunday', 'Solemnity')
-    elif current_date == year_dates['ascension']:
-        return ('Ascension of the Lord', 'Solemnity')
-    elif current_date == year_dates['pentecost']:
-        return ('Pentecost Sunday', 'Solemnity')
-    elif current_date == year_dates['trinity_sunday']:
-        return ('Trinity Sunday', 'Solemnity')
-    elif current_date == year_dates['corpus_christi']:
-        return ('THE BODY AND BLOOD OF CHRIST', 'Solemnity')
-    elif current_date == year_dates['sacred_heart']:
-        return ('Sacred Heart of Jesus', 'Solemnity')
-    elif current_date == year_dates['christ_the_king']:
-        return ('Our Lord Jesus Christ, King of the Universe', 'Solemnity')
-
-    # PRIORITY 3: Fixed Feasts (only on weekdays, not Sundays)
-    if dow != 6:  # Not Sunday
-        fixed_feast = lectionary['fixed_feasts'].get((month, day))
-        if fixed_feast:
-            return (fixed_feast['Liturgical Day'], 'Feast')
-
-    # PRIORITY 4: Seasonal defaults based on READ-ONLY season parameter
-    if season == 'Christmas':
-        if current_date == datetime(current_date.year, 12, 25):
-            return ('Christmas Day', 'Solemnity')
-        elif current_date == datetime(current_date.year, 1, 1):
-            return ('Mary, Mother of God', 'Solemnity')
-        elif current_date == year_dates['epiphany']:
-            return ('Epiphany of the Lord', 'Solemnity')
-        elif current_date == year_dates['baptism_lord']:
-            return ('Baptism of the Lord', 'Feast')
-        else:
-            return (f"{dow_name} of Christmas Season", 'Feria')
-
-    elif season == 'Advent':
-        if dow == 6:  # Sunday
-            return (f"{self_ordinal(week_number)} Sunday of Advent", 'Sunday')
-        else:
-            return (f"{dow_name} of {self_ordinal(week_number)} week of Advent", 'Feria')
-
-    elif season == 'Lent':
-        if current_date == year_dates['ash_wednesday']:
-            return ('Ash Wednesday', 'Ash Wednesday')
-        elif current_date < year_dates['ash_wednesday'] + timedelta(days=(6 - year_dates['ash_wednesday'].weekday())):
-            return (f"{dow_name} after Ash Wednesday", 'Feria')
-        elif dow == 6:  # Sunday
-            return (f"{self_ordinal(week_number)} Sunday of Lent", 'Sunday')
-        else:
-            return (f"{dow_name} of {self_ordinal(week_number)} week of Lent", 'Feria')
-
-    elif season == 'Holy Week':
-        if current_date == year_dates['palm_sunday']:
-            return ('Palm Sunday', 'Sunday')
-        elif current_date == year_dates['easter'] - timedelta(days=3):
-            return ('Holy Thursday', 'Triduum')
-        elif current_date == year_dates['easter'] - timedelta(days=2):
-            return ('Good Friday', 'Triduum')
-        elif current_date == year_dates['easter'] - timedelta(days=1):
-            return ('Holy Saturday', 'Triduum')
-        else:
-            return (f"{dow_name} of Holy Week", 'Feria')
-
-    elif season == 'Easter':
-        if dow == 6:  # Sunday
-            return (f"{self_ordinal(week_number)} Sunday of Easter", 'Sunday')
-        else:
-            return (f"{dow_name} of {self_ordinal(week_number)} week of Easter", 'Feria')
-
-    elif season == 'Ordinary Time':
-        if dow == 6:  # Sunday
-            if current_date == year_dates['baptism_lord']:
-                return ('Baptism of the Lord', 'Feast')
-            else:
-                return (f"{self_ordinal(week_number)} Sunday in Ordinary Time", 'Sunday')
-        else:
-            return (f"{dow_name} of Week {week_number} in Ordinary Time", 'Feria')
-
-    # Fallback
-    return (f"{dow_name}", 'Feria')
-
-def generate_full_calendar(year, lectionary):
-    """Generate complete liturgical calendar for a year with lectionary data"""
-    entries = []
-
-    # Calculate key dates
-    easter = calculate_easter(year)
-    ash_wednesday = easter - timedelta(days=46)
-    palm_sunday = easter - timedelta(days=7)
-    pentecost = easter + timedelta(days=49)
-    trinity_sunday = easter + timedelta(days=56)
-
-    # AUSTRALIA: Ascension moved to Sunday (42 days, not Thursday at 39)
-    ascension = easter + timedelta(days=42)  # 7th Sunday of Easter
-
-    # AUSTRALIA: Corpus Christi moved to Sunday (63 days, not Thursday at 60)
-    corpus_christi = easter + timedelta(days=63)  # Sunday after Trinity
-
-    sacred_heart = easter + timedelta(days=68)  # Friday after Corpus Christi
-
-    # First Sunday of Advent
-    christmas = datetime(year, 12, 25)
-    days_to_subtract = christmas.weekday() + 1
-    first_advent = christmas - timedelta(days=days_to_subtract + 21)
-    christ_the_king = first_advent - timedelta(days=7)
-
-    # AUSTRALIA: Epiphany celebrated on Sunday between Jan 2-8 (not fixed Jan 6)
-    jan_2 = datetime(year, 1, 2)
-    days_until_sunday = (6 - jan_2.weekday()) % 7  # Days until next Sunday
-    if days_until_sunday == 0:  # Jan 2 is Sunday
-        epiphany = jan_2
-    else:
-        epiphany = jan_2 + timedelta(days=days_until_sunday)
-
-    # Baptism of the Lord - Sunday after Epiphany
-    baptism_lord = epiphany + timedelta(days=7)
-
-    # Start of Ordinary Time after Baptism
-    ordinary_time_1_start = baptism_lord
-    ordinary_time_1_end = ash_wednesday - timedelta(days=1)
-
-    # Ordinary Time after Pentecost
-    ordinary_time_2_start = pentecost + timedelta(days=1)
-    ordinary_time_2_end = first_advent - timedelta(days=1)
-
-    # Week counting for Ordinary Time
-    # IMPORTANT: Sunday (weekday() == 6) is Day 1 of the liturgical week
-    # A new week starts ON Sunday and runs through Saturday
-    ordinary_weeks = {}
-
-    # PERIOD 1: Baptism of Lord through day before Ash Wednesday
-    # Count forward from Week 1
-    current_date = baptism_lord
-    week_num = 1
-    while current_date <= ordinary_time_1_end:
-        ordinary_weeks[current_date.strftime('%Y-%m-%d')] = week_num
-        current_date += timedelta(days=1)
-        # New week starts when we reach the NEXT Sunday
-        if current_date <= ordinary_time_1_end and current_date.weekday() == 6:
-            week_num += 1
-
-    # PERIOD 2: Day after Pentecost through day before First Advent
-    # Christ the King (last Sunday) is always Week 34
-    # Count backwards to determine starting week for Pentecost + 1
+    override = year_overrides(current_date.year, year_dates, lectionary).get(current_date.toordinal())
+    if override:
+        return override
+    return seasonal_default(season, week_number, dow)
+
+@lru_cache(maxsize=1)
+def _shared_lectionary():
+    """Lectionary loaded on first use by get_liturgical_day() when none is passed"""
+    return load_lectionary()
+
+@lru_cache(maxsize=32)
+def _year_context(year):
+    """Per-year context for single-day lookups: key dates (read-only)"""
+    return key_dates(year)
+
+def liturgical_day_row(current_date, lectionary):
+    """
+    One calendar row as a tuple in FIELDNAMES order (compact form for streaming).
+    current_date: datetime at midnight.
+    """
+    year_dates = _year_context(current_date.year)
+    dow = current_date.weekday()  # 0=Monday, 6=Sunday
+    dow_name = current_date.strftime('%A')
 
-    # Count how many complete weeks from ordinary_time_2_start to christ_the_king
-    days_in_period_2 = (christ_the_king - ordinary_time_2_start).days
+    # PHASE 1: Determine season (immutable)
+    season, week_number = determine_season(current_date, year_dates)
 
-    # Find the first Sunday in Period 2 (or use the start date if it's already Sunday)
-    current_date = ordinary_time_2_start
-    while current_date.weekday() != 6:  # Find first Sunday
-        current_date += timedelta(days=1)
-    first_sunday_period_2 = current_date
-
-    # Count Sundays from first Sunday to Christ the King (inclusive)
-    num_sundays = 0
-    temp_date = first_sunday_period_2
-    while temp_date <= christ_the_king:
-        num_sundays += 1
-        temp_date += timedelta(days=7)
-
-    # The last Sunday (Christ the King) is Week 34
-    # So the first Sunday should be Week (34 - num_sundays + 1)
-    # And days before the first Sunday are (first_sunday_week - 1)
-    first_sunday_week = 34 - num_sundays + 1
-
-    # Now assign weeks for entire Period 2
-    current_date = ordinary_time_2_start
-    # Days before first Sunday belong to the week before it
-    week_num = first_sunday_week - 1 if ordinary_time_2_start < first_sunday_period_2 else first_sunday_week
-
-    while current_date <= ordinary_time_2_end:
-        # Check if THIS day is Sunday (start of new week)
-        if current_date.weekday() == 6:
-            week_num += 1
-
-        ordinary_weeks[current_date.strftime('%Y-%m-%d')] = week_num
-        current_date += timedelta(days=1)
+    # PHASE 2: Determine name and rank (season stays the same!)
+    liturgical_name, rank = determine_name_and_rank(
+        current_date, season, week_number, dow, dow_name, year_dates, lectionary
+    )
 
-    # Get liturgical year cycle
-    liturgical_year_cycle = get_liturgical_year(datetime(year, 1, 1))
-
-    # Store all year dates for easy access
-    year_dates = {
-        'easter': easter,
-        'ash_wednesday': ash_wednesday,
-        'palm_sunday': palm_sunday,
-        'pentecost': pentecost,
-        'trinity_sunday': trinity_sunday,
-        'ascension': ascension,
-        'corpus_christi': corpus_christi,
-        'sacred_heart': sacred_heart,
-        'first_advent': first_advent,
-        'christ_the_king': christ_the_king,
-        'epiphany': epiphany,
-        'baptism_lord': baptism_lord
-    }
+    return (current_date.strftime('%Y-%m-%d'), current_date.year, season, week_number,
+            dow_name, liturgical_name, rank)
 
-    # Generate every day of the year
+def get_liturgical_day(date, lectionary=None):
+    """
+    Season, week, name and rank for a single date, without generating its year.
+    date: datetime, date or 'YYYY-MM-DD'. Returns the same dict as one
+    generate_full_calendar() entry.
+    """
+    if isinstance(date, str):
+        date = datetime.strptime(date, '%Y-%m-%d')
+    current_date = datetime(date.year, date.month, date.day)
+    row = liturgical_day_row(current_date, lectionary if lectionary is not None else _shared_lectionary())
+    return dict(zip(FIELDNAMES, row))
+
+def iter_year_rows(year, lectionary):
+    """Yield every day of a year as row tuples (see liturgical_day_row)"""
     current_date = datetime(year, 1, 1)
     end_date = datetime(year, 12, 31)
-
     while current_date <= end_date:
-        date_str = current_date.strftime('%Y-%m-%d')
-        dow = current_date.weekday()  # 0=Monday, 6=Sunday
-        dow_name = current_date.strftime('%A')
-
-        # PHASE 1: Determine season (immutable)
-        season, week_number = determine_season(current_date, year_dates, ordinary_weeks)
-
-        # PHASE 2: Determine name and rank (season stays the same!)
-        liturgical_name, rank = determine_name_and_rank(
-            current_date, season, week_number, dow, dow_name, year_dates, lectionary
-        )
-
-        entries.append({
-            'calendar_date': date_str,
-            'year': year,
-            'liturgical_season': season,
-            'liturgical_week': week_number,
-            'day_of_week': dow_name,
-            'liturgical_name': liturgical_name,
-            'liturgical_rank': rank
-        })
-
+        yield liturgical_day_row(current_date, lectionary)
         current_date += timedelta(days=1)
 
-    return entries
+def generate_full_calendar(year, lectionary):
+    """Generate complete liturgical calendar for a year with lectionary data"""
+    return [dict(zip(FIELDNAMES, row)) for row in iter_year_rows(year, lectionary)]
+
+OUTPUT_CSV = 'data/generated/liturgical_calendar_full.csv'
+FIELDNAMES = ['calendar_date', 'year', 'liturgical_season', 'liturgical_week',
+              'day_of_week', 'liturgical_name', 'liturgical_rank']
+WRITE_BUFFER_BYTES = 1 << 16
+CACHE_DIR = 'data/generated/calendar_cache'  # <year>.csv chunks + manifest.json of their cache keys
+CACHE_MANIFEST = 'manifest.json'
+CACHE_CHUNK_RE = re.compile(r'^\d+\.csv$')
 
 def self_ordinal(n):
     """Convert number to ordinal (1st, 2nd, 3rd, etc.)"""
@@ -478,50 +565,271 @@ def self_ordinal(n):
     else:
         return str(n)
 
+# Lectionary for pool workers, set once per process by _init_worker (read-only)
+_worker_lectionary = None
+
+def _init_worker(lectionary):
+    global _worker_lectionary
+    _worker_lectionary = lectionary
+
+def _generate_year_rows(year):
+    return list(iter_year_rows(year, _worker_lectionary))
+
+@lru_cache(maxsize=1)
+def generator_version():
+    """Digest of the generator and key-date sources: any rule or code change invalidates every chunk"""
+    digest = hashlib.sha256()
+    here = os.path.dirname(os.path.abspath(__file__))
+    for module in ('generate_liturgical_calendar_v2.py', 'key_dates.py'):
+        with open(os.path.join(here, module), 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+_feast_digests = (None, {})  # (fixed_feasts they were built from, {leap year?: digest})
+
+def _fixed_feasts_digest(fixed_feasts, leap):
+    """Digest of the Lectionary fixed days a year consults (29 February only in leap years)"""
+    global _feast_digests
+    if _feast_digests[0] is not fixed_feasts:
+        _feast_digests = (fixed_feasts, {})
+    digests = _feast_digests[1]
+    if leap not in digests:
+        digest = hashlib.sha256()
+        for candidate in _fixed_feast_candidates(fixed_feasts):
+            if leap or candidate[:2] != (2, 29):
+                digest.update(repr(candidate).encode('utf-8'))
+        digests[leap] = digest.hexdigest()
+    return digests[leap]
+
+def year_cache_key(year, lectionary):
+    """
+    Content address of a generated year: (generator version, key dates, Lectionary).
+    A LazyLectionary contributes the hash of its CSV so that cached years never
+    load the snapshot; an already-built mapping contributes the fixed days consulted.
+    """
+    year_dates = key_dates(year)
+    parts = [generator_version(), str(year)]
+    parts += [f"{name}={year_dates[name]:%Y-%m-%d}" for name in sorted(year_dates)]
+    if isinstance(lectionary, LazyLectionary):
+        parts.append(lectionary.source_digest())
+    else:
+        leap = year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)
+        parts.append(_fixed_feasts_digest(lectionary['fixed_feasts'], leap))
+    return hashlib.sha256('\n'.join(parts).encode('utf-8')).hexdigest()
+
+def _chunk_path(cache_dir, year):
+    return os.path.join(cache_dir, f"{year}.csv")
+
+def _copy_year_lines(lines, out, samples):
+    """Copy a year's CSV lines to out, keeping the first 20 rows as dicts in samples. Returns the line count."""
+    count = 0
+    for line in lines:
+        out.write(line)
+        count += 1
+        if len(samples) < 20:
+            samples.extend(dict(zip(FIELDNAMES, row)) for row in csv.reader([line]))
+    return count
+
+def _load_cache_manifest(cache_dir):
+    """{year (str): cache key} of the chunks in cache_dir"""
+    try:
+        with open(os.path.join(cache_dir, CACHE_MANIFEST), 'r', encoding='utf-8') as f:
+            return json.load(f).get('years', {})
+    except (FileNotFoundError, ValueError):
+        return {}
+
+def _prune_cache(cache_dir, manifest):
+    """Remove files that are not a year chunk listed in the manifest (e.g. older key-named chunks)"""
+    for name in os.listdir(cache_dir):
+        if name == CACHE_MANIFEST:
+            continue
+        if not CACHE_CHUNK_RE.match(name) or name[:-4] not in manifest:
+            os.remove(os.path.join(cache_dir, name))
+
+def _iter_uncached_years(years, lectionary, workers):
+    """(year, rows) for the given years in order, serially or across a process pool"""
+    if workers <= 1 or len(years) <= 1:
+        for year in years:
+            yield year, iter_year_rows(year, lectionary)
+        return
+
+    workers = min(workers, len(years))
+    # Load (or build) the snapshot once here and hand workers the buckets, so a
+    # cold run doesn't have every worker reclassifying Lectionary.csv at once
+    buckets = dict(lectionary)
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(buckets,)) as pool:
+        pending = deque()
+        next_years = iter(years)
+        for year in islice(next_years, 2 * workers):
+            pending.append((year, pool.submit(_generate_year_rows, year)))
+        while pending:
+            year, future = pending.popleft()
+            for queued in islice(next_years, 1):
+                pending.append((queued, pool.submit(_generate_year_rows, queued)))
+            yield year, future.result()
+
+def iter_calendar_years(start_year, end_year, lectionary, workers=1):
+    """
+    Yield (year, rows) for start_year..end_year in order.
+
+    Serially, rows is a lazy generator. With workers > 1 years are generated
+    in a process pool with at most 2 * workers years in flight, so memory stays
+    bounded however long the span is.
+    """
+    return _iter_uncached_years(range(start_year, end_year + 1), lectionary, workers)
+
+def write_calendar_years(start_year, end_year, lectionary, filename=OUTPUT_CSV, workers=1,
+                         cache_dir=CACHE_DIR):
+    """
+    Stream start_year..end_year to filename as row tuples through a buffered
+    writer, flushing after each year so rows reach disk as soon as they exist.
+
+    Each year is also kept in cache_dir as <year>.csv, with its year_cache_key()
+    in the cache manifest; years whose key is unchanged are copied from their
+    chunk and only the others are generated (overwriting the stale chunk).
+    cache_dir=None disables the cache.
+    Returns (total days, first 20 entries as dicts, cache hits).
+    """
+    total = 0
+    samples = []
+    years = range(start_year, end_year + 1)
+
+    # Only decide which years are cached up front; chunks are read one at a time below
+    keys, manifest, cached = {}, {}, set()
+    if cache_dir:
+        os.makedirs(cache_dir, exist_ok=True)
+        manifest = _load_cache_manifest(cache_dir)
+        for year in years:
+            keys[year] = year_cache_key(year, lectionary)
+            if manifest.get(str(year)) == keys[year] and os.path.exists(_chunk_path(cache_dir, year)):
+                cached.add(year)
+    generated = _iter_uncached_years([y for y in years if y not in cached], lectionary, workers)
+
+    with open(filename, 'w', newline='', encoding='utf-8', buffering=WRITE_BUFFER_BYTES) as f:
+        writer = csv.writer(f)
+        writer.writerow(FIELDNAMES)
+
+        for year in years:
+            if year in cached:
+                with open(_chunk_path(cache_dir, year), 'r', newline='', encoding='utf-8') as chunk:
+                    total += _copy_year_lines(chunk, f, samples)
+            else:
+                _, rows = next(generated)
+                buffer = io.StringIO(newline='')
+                csv.writer(buffer).writerows(rows)
+                if cache_dir:
+                    write_atomic(_chunk_path(cache_dir, year), buffer.getvalue())
+                    manifest[str(year)] = keys[year]
+                buffer.seek(0)
+                total += _copy_year_lines(buffer, f, samples)
+            f.flush()
+
+    if cache_dir:
+        write_atomic(os.path.join(cache_dir, CACHE_MANIFEST), json.dumps({'years': manifest}, indent=2, sort_keys=True))
+        _prune_cache(cache_dir, manifest)
+
+    return total, samples, len(cached)
+
+# Expected outcomes of the precedence rules: (year, solemnity, date it is celebrated)
+TRANSFER_CHECKS = [
+    (2027, '25 March – Annunciation', '2027-04-05'),            # Holy Week + Easter Octave
+    (2035, '19 March – St Joseph', '2035-03-17'),                # Anticipated out of Holy Week
+    (2030, '8 December – Immaculate Conception', '2030-12-09'),  # Second Sunday of Advent
+    (2033, '24 June – Birth of John the Baptist', '2033-06-23'), # Sacred Heart, 2022 precedent
+    (2057, '24 June – Birth of John the Baptist', '2057-06-25'), # Corpus Christi (Easter 22 April)
+]
+# (date, rank) of days that must keep their rank
+RANK_CHECKS = [(f"{year}-01-01", 'Solemnity') for year in (2025, 2026, 2027, 2033)]
+
+def check_precedence(lectionary):
+    """[failure message] for TRANSFER_CHECKS and RANK_CHECKS (empty when all pass)"""
+    failures = []
+    for year, name, expected in TRANSFER_CHECKS:
+        overrides, _ = resolve_year_celebrations(year, key_dates(year), lectionary['fixed_feasts'])
+        dates = sorted(datetime.fromordinal(o).strftime('%Y-%m-%d') for o, (n, _) in overrides.items() if n == name)
+        if dates != [expected]:
+            failures.append(f"{name} {year}: expected {expected}, got {', '.join(dates) or 'omitted'}")
+    for date, rank in RANK_CHECKS:
+        entry = get_liturgical_day(date, lectionary)
+        if entry['liturgical_rank'] != rank:
+            failures.append(f"{date}: expected {rank}, got {entry['liturgical_name']} ({entry['liturgical_rank']})")
+    return failures
+
 def main():
+    parser = argparse.ArgumentParser(description='Generate the full liturgical calendar')
+    parser.add_argument('--date', nargs='+', metavar='YYYY-MM-DD',
+                        help='Print the liturgical day for specific dates instead of generating')
+    parser.add_argument('--start', type=int, default=2025, help='First year (default 2025)')
+    parser.add_argument('--end', type=int, default=2030, help='Last year, inclusive (default 2030)')
+    parser.add_argument('--workers', type=int, help='Worker processes (default: all cores, 1 = serial)')
+    parser.add_argument('--no-cache', action='store_true',
+                        help=f'Regenerate every year without reading or writing {CACHE_DIR}')
+    parser.add_argument('--transfers', action='store_true',
+                        help='List solemnities transferred by precedence between --start and --end')
+    parser.add_argument('--check', action='store_true',
+                        help='Check known transfers and ranks against the precedence rules')
+    args = parser.parse_args()
+
+    if args.check:
+        failures = check_precedence(load_lectionary())
+        for failure in failures:
+            print(f"  ❌ {failure}")
+        if failures:
+            raise SystemExit(1)
+        print(f"✅ {len(TRANSFER_CHECKS)} transfers and {len(RANK_CHECKS)} ranks as expected")
+        return
+
+    if args.transfers:
+        lectionary = load_lectionary()
+        for year in range(args.start, args.end + 1):
+            _, transfers = resolve_year_celebrations(year, key_dates(year), lectionary['fixed_feasts'])
+            for name, original, target in transfers:
+                print(f"{year}: {name}: {original:%a %d %b} -> {target:%a %d %b}")
+        return
+
+    if args.date:
+        for date in args.date:
+            entry = get_liturgical_day(date)
+            week = f" (Week {entry['liturgical_week']})" if entry['liturgical_week'] else ""
+            print(f"{entry['calendar_date']} ({entry['day_of_week']}): {entry['liturgical_name']} "
+                  f"[{entry['liturgical_rank']}] - {entry['liturgical_season']}{week}")
+        return
+
     print("=" * 80)
     print("GENERATING COMPREHENSIVE LITURGICAL CALENDAR (V2)")
     print("=" * 80)
 
-    print("\nLoading Lectionary.csv...")
     lectionary = load_lectionary()
-    print(f"  Fixed feasts loaded: {len(lectionary['fixed_feasts'])}")
-    print(f"  Christmas special Masses: {len(lectionary['christmas_special'])}")
-    print(f"  Christmas entries: {len(lectionary['christmas'])}")
-    print(f"  Easter entries: {len(lectionary['easter'])}")
-    print(f"  Holy Week entries: {len(lectionary['holy_week'])}")
-    print(f"  Solemnities: {len(lectionary['solemnities'])}")
-    print(f"  Total entries loaded: {sum([len(lectionary[k]) if isinstance(lectionary[k], (list, dict)) else 0 for k in lectionary])}")
-
-    all_entries = []
-
-    for year in range(2025, 2031):
-        print(f"\nGenerating {year}...")
-        entries = generate_full_calendar(year, lectionary)
-        print(f"  {len(entries)} days generated")
-        all_entries.extend(entries)
-
-    # Save to CSV
-    filename = 'data/generated/liturgical_calendar_full.csv'
-    fieldnames = ['calendar_date', 'year', 'liturgical_season', 'liturgical_week',
-                  'day_of_week', 'liturgical_name', 'liturgical_rank']
-
-    with open(filename, 'w', newline='', encoding='utf-8') as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(all_entries)
+
+    workers = args.workers or os.cpu_count() or 1
+    print(f"\nGenerating {args.start}-{args.end} with {workers} worker(s)...")
+    total, samples, hits = write_calendar_years(args.start, args.end, lectionary, OUTPUT_CSV, workers,
+                                                None if args.no_cache else CACHE_DIR)
+    years = args.end - args.start + 1
+    if not args.no_cache:
+        print(f"  Cache: {hits}/{years} years reused, {years - hits} generated ({CACHE_DIR})")
+
+    if lectionary.loaded:
+        print(f"\nLectionary ({LECTIONARY_SNAPSHOT}):")
+        print(f"  Fixed feasts loaded: {len(lectionary['fixed_feasts'])}")
+        print(f"  Christmas special Masses: {len(lectionary['christmas_special'])}")
+        print(f"  Christmas entries: {len(lectionary['christmas'])}")
+        print(f"  Easter entries: {len(lectionary['easter'])}")
+        print(f"  Holy Week entries: {len(lectionary['holy_week'])}")
+        print(f"  Solemnities: {len(lectionary['solemnities'])}")
+        print(f"  Total entries loaded: {sum([len(lectionary[k]) if isinstance(lectionary[k], (list, dict)) else 0 for k in lectionary])}")
 
     print(f"\n{'='*80}")
-    print(f"COMPLETE! Generated {len(all_entries)} days")
-    print(f"Saved to: {filename}")
+    print(f"COMPLETE! Generated {total} days")
+    print(f"Saved to: {OUTPUT_CSV}")
     print(f"{'='*80}")
 
     # Show samples
-    print("\nSample entries from 2025:")
-    for entry in all_entries[:20]:
-        if entry['year'] == 2025:
-            week = f"Week {entry['liturgical_week']}" if entry['liturgical_week'] else ""
-            print(f"  {entry['calendar_date']} ({entry['day_of_week']}): {entry['liturgical_name']} {week}")
+    print(f"\nSample entries from {args.start}:")
+    for entry in samples:
+        week = f"Week {entry['liturgical_week']}" if entry['liturgical_week'] else ""
+        print(f"  {entry['calendar_date']} ({entry['day_of_week']}): {entry['liturgical_name']} {week}")
 
 if __name__ == '__main__':
     main()
@@ -10,6 +10,9 @@ Usage:
   python scripts/generate_ordo_lectionary_mapping.py --list-apostles      # Show apostles list
   python scripts/generate_ordo_lectionary_mapping.py --list-aliases       # Show name alias mappings
   python scripts/generate_ordo_lectionary_mapping.py --push               # Push to production table
+  python scripts/generate_ordo_lectionary_mapping.py --serve              # Serve readings locally over HTTP
+  python scripts/generate_ordo_lectionary_mapping.py --export-shards      # Also write static JSON shards
+  python scripts/generate_ordo_lectionary_mapping.py --find-passage "John 6"  # Dates that read a passage
 """
 
 import csv
@@ -22,6 +25,8 @@ import sys
 # Add parent dir to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from key_dates import ordinary_time_week
+
 # File paths
 ORDO_CSV = 'data/generated/ordo_normalized.csv'
 LECTIONARY_CSV = 'data/source/Lectionary.csv'
@@ -298,6 +303,11 @@ def infer_season_and_week(ordo_date, ordo_data):
     """
     dt = datetime.datetime.strptime(ordo_date, '%Y-%m-%d')
 
+    # Ordinary Time weeks are pure arithmetic from Baptism / Christ the King
+    week = ordinary_time_week(dt)
+    if week is not None:
+        return 'Ordinary Time', str(week)
+
     # Look back up to 7 days
     for days_back in range(1, 8):
         check_dt = dt - datetime.timedelta(days=days_back)
@@ -1107,6 +1117,9 @@ Examples:
   %(prog)s --edit-ordo 2026-05-26 --rank Feast --season "Ordinary Time" --week 8
   %(prog)s --edit-lectionary 586 --gospel "John 19:25-27"
   %(prog)s --push                               Regenerate and push to database
+  %(prog)s --serve --port 8787                  Serve /readings from the generated mapping
+  %(prog)s --export-shards                      Write static/readings/ year and month shards
+  %(prog)s --find-passage "Isaiah 42" --from 2026-01-01 --to 2026-12-31
         """
     )
     parser.add_argument('--dry-run', action='store_true', help='Push to temp table for testing')
@@ -1135,6 +1148,20 @@ Examples:
     parser.add_argument('--second-reading', type=str, help='Set second reading (for --edit-lectionary)')
     parser.add_argument('--gospel', type=str, help='Set gospel (for --edit-lectionary)')
 
+    # Local readings service
+    parser.add_argument('--serve', action='store_true', help='Serve /readings from the generated mapping (no database)')
+    parser.add_argument('--port', type=int, default=8787, help='Port for --serve (default 8787)')
+
+    # Static readings shards
+    parser.add_argument('--export-shards', nargs='?', const='static/readings', metavar='DIR',
+                        help='After writing the CSV, export changed year/month JSON shards (default static/readings)')
+
+    # Reverse passage lookup
+    parser.add_argument('--find-passage', type=str, metavar='REF', help='List dates whose readings overlap a passage (e.g. "John 6")')
+    parser.add_argument('--from', dest='date_from', type=str, help='Earliest date for --find-passage (YYYY-MM-DD)')
+    parser.add_argument('--to', dest='date_to', type=str, help='Latest date for --find-passage (YYYY-MM-DD)')
+    parser.add_argument('--next', action='store_true', help='Only the next date on or after --from/today (for --find-passage)')
+
     args = parser.parse_args()
 
     # Handle list commands
@@ -1171,12 +1198,29 @@ Examples:
         check_specific_date(args.check_date)
         return
 
+    if args.find_passage:
+        from passage_index import run_passage_query
+        run_passage_query(args.find_passage, args.date_from, args.date_to, next_only=args.next)
+        return
+
+    if args.serve:
+        if not os.path.exists(OUTPUT_CSV):
+            print("Generating Ordo-to-Lectionary mapping...")
+            write_csv(generate_mappings())
+        from readings_server import serve
+        serve(port=args.port)
+        return
+
     print("Generating Ordo-to-Lectionary mapping...")
     mappings = generate_mappings()
 
     # Always write CSV
     write_csv(mappings)
 
+    if args.export_shards:
+        from export_readings_shards import export_shards
+        export_shards(mappings, args.export_shards)
+
     # Compare against baseline if requested
     if args.compare:
         compare_with_baseline(mappings)
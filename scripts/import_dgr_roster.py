@@ -21,6 +21,8 @@ from datetime import date
 from dotenv import load_dotenv
 from supabase import create_client
 
+from key_dates import key_dates
+
 # Load environment
 load_dotenv()
 
@@ -216,24 +218,26 @@ def import_schedule(assignments, contributors, dry_run=False):
     return created
 
 
+def month_day(d):
+    """'February 18' (no zero padding)"""
+    return f"{d:%B} {d.day}"
+
+
 def show_blocked_dates():
     """Show which dates are blocked (Lent, Advent, Christmas)."""
     print("\n--- Blocked Date Ranges (No Assignments) ---")
 
-    # Based on 2026 liturgical calendar:
-    # Lent: Ash Wednesday (Feb 18) - Easter Sunday (Apr 5)
-    # Advent: First Sunday (Nov 29) - Dec 24
-    # Christmas: Dec 25 - ?
+    dates = key_dates(YEAR)
 
-    print("""
-Based on the blank spots in schedule.csv, these periods are blocked:
-- January 1-4: End of Christmas season
-- March (entire month): Lent season
-- April 1-5: Holy Week / Easter Triduum
-- November 28-30: Start of Advent
-- December: Advent and Christmas season
+    print(f"""
+From the {YEAR} key dates (scripts/key_dates.py), these liturgical periods are blocked:
+- January 1 - {month_day(dates['baptism_lord'])}: End of Christmas season (until Baptism of the Lord)
+- {month_day(dates['ash_wednesday'])} - {month_day(dates['palm_sunday'])}: Lent season (Ash Wednesday to Palm Sunday)
+- {month_day(dates['palm_sunday'])} - {month_day(dates['easter'])}: Holy Week / Easter Triduum
+- {month_day(dates['first_advent'])} - December 24: Advent
+- December 25-31: Christmas season
 
-These align with the liturgical calendar for 2026.
+Check these against the blank spots in schedule.csv before importing.
 """)
 
 
@@ -0,0 +1,353 @@
+#!/usr/bin/env python3
+"""
+Key liturgical dates for whole year ranges, computed once.
+
+Easter (Computus) and every date derived from it, the First Sunday of Advent,
+Christ the King, and the Australian Epiphany (Sunday between 2 and 8 January)
+and Baptism of the Lord. Years listed in data/source/lectionary-years.csv take
+Easter, Ash Wednesday, Pentecost and Advent 1 from that table instead.
+
+Generators and scripts look single years up here rather than recomputing them
+(plain Python, memoized per year):
+
+  from key_dates import key_dates
+  dates = key_dates(2026)          # {'easter': datetime(2026, 4, 5), ...}
+
+Whole year ranges are computed at once as NumPy datetime64[D] arrays by
+key_dates_table() (KeyDates). NumPy is imported only there, so scripts that
+need single years do not depend on it.
+
+Usage:
+  python scripts/key_dates.py 2025 2026        # Print key dates
+  python scripts/key_dates.py --check          # Compare lectionary-years.csv with Computus, and
+                                               # key_dates() with KeyDates for 1583-4099
+"""
+
+import argparse
+import csv
+import datetime
+import os
+from functools import lru_cache
+
+LECTIONARY_YEARS_CSV = 'data/source/lectionary-years.csv'
+
+# Gregorian Computus is valid from 1583; 4099 is the usual upper bound of the tables
+FIRST_YEAR = 1583
+LAST_YEAR = 4099
+
+# Offsets from Easter Sunday (Ascension and Corpus Christi on Sunday in Australia)
+EASTER_OFFSETS = {
+    'ash_wednesday': -46,
+    'palm_sunday': -7,
+    'ascension': 42,
+    'pentecost': 49,
+    'trinity_sunday': 56,
+    'corpus_christi': 63,
+    'sacred_heart': 68,
+}
+
+KEY_DATE_NAMES = ('easter', 'ash_wednesday', 'palm_sunday', 'pentecost', 'trinity_sunday',
+                  'ascension', 'corpus_christi', 'sacred_heart', 'first_advent',
+                  'christ_the_king', 'epiphany', 'baptism_lord')
+
+# lectionary-years.csv column -> key date it seeds
+_SEED_COLUMNS = {
+    'Easter Sunday': 'easter',
+    'Ash Wednesday': 'ash_wednesday',
+    'Pentecost': 'pentecost',
+    'Advent Sunday 1': 'first_advent',
+}
+_MONTHS = {m: i for i, m in enumerate(
+    ['jan', 'feb', 'mar', 'apr', 'may', 'jun', 'jul', 'aug', 'sep', 'oct', 'nov', 'dec'], 1)}
+
+
+def weekday(dates):
+    """Python weekday (Monday=0) for datetime64[D] values; 1970-01-01 was a Thursday."""
+    return (dates.astype('int64') + 3) % 7
+
+
+def _is_leap(years):
+    return ((years % 4 == 0) & (years % 100 != 0)) | (years % 400 == 0)
+
+
+def _easter_month_day(year):
+    """Computus (anonymous Gregorian algorithm): Easter's (month, day).
+
+    Integer arithmetic only, so it works on an int or an int64 array of years alike.
+    """
+    a = year % 19
+    b = year // 100
+    c = year % 100
+    d = b // 4
+    e = b % 4
+    f = (b + 8) // 25
+    g = (b - f + 1) // 3
+    h = (19 * a + b - d - g + 15) % 30
+    i = c // 4
+    k = c % 4
+    l = (32 + 2 * e + 2 * i - h - k) % 7
+    m = (a + 11 * h + 22 * l) // 451
+    month = (h + l - 7 * m + 114) // 31
+    day = ((h + l - 7 * m + 114) % 31) + 1
+    return month, day
+
+
+def easter_date(year):
+    """Easter Sunday of one year as a date."""
+    return datetime.date(year, *_easter_month_day(year))
+
+
+def compute_easter(years):
+    """Vectorized Computus: Easter Sunday as datetime64[D] for an int array of years."""
+    import numpy as np
+    years = np.asarray(years, dtype='int64')
+    month, day = _easter_month_day(years)
+    month_starts = ((years - 1970) * 12 + (month - 1)).astype('datetime64[M]').astype('datetime64[D]')
+    return month_starts + (day - 1)
+
+
+def compute_key_dates(years, easter=None, first_advent=None):
+    """Vectorized key dates for an int array of years, as datetime64[D] arrays.
+
+    easter / first_advent may be supplied (e.g. seeded from a table) instead of computed.
+    Also returns 'year_start' (1 January) and 'christmas' for callers that need them.
+    """
+    import numpy as np
+    years = np.asarray(years, dtype='int64')
+    year_start = (years - 1970).astype('datetime64[Y]').astype('datetime64[D]')
+    christmas = year_start + 358 + _is_leap(years).astype('int64')
+
+    if easter is None:
+        easter = compute_easter(years)
+    if first_advent is None:
+        # Fourth Sunday before Christmas
+        first_advent = christmas - (weekday(christmas) + 1 + 21)
+
+    # AUSTRALIA: Epiphany on the Sunday between 2 and 8 January; Baptism the Sunday after
+    jan_2 = year_start + 1
+    epiphany = jan_2 + (6 - weekday(jan_2)) % 7
+
+    dates = {
+        'year_start': year_start,
+        'christmas': christmas,
+        'easter': easter,
+        'first_advent': first_advent,
+        'christ_the_king': first_advent - 7,
+        'epiphany': epiphany,
+        'baptism_lord': epiphany + 7,
+    }
+    for name, offset in EASTER_OFFSETS.items():
+        dates[name] = easter + offset
+    return dates
+
+
+def _parse_table_date(value, year):
+    """'26 Feb' / '1 June' -> date."""
+    day, month = value.split()[:2]
+    return datetime.date(year, _MONTHS[month[:3].lower()], int(day))
+
+
+def load_lectionary_years(filename=LECTIONARY_YEARS_CSV):
+    """Read lectionary-years.csv into {year: {key_date: date}} (empty if absent)."""
+    if not os.path.exists(filename):
+        return {}
+
+    table = {}
+    with open(filename, 'r', encoding='utf-8-sig') as f:
+        rows = csv.reader(f)
+        next(rows, None)  # Group header ("lectionary cycle", "before season of Lent", ...)
+        header = next(rows, None)
+        if not header:
+            return {}
+        columns = {name: header.index(name) for name in _SEED_COLUMNS if name in header}
+        for row in rows:
+            if not row or not row[0].strip().isdigit():
+                continue
+            year = int(row[0])
+            try:
+                table[year] = {_SEED_COLUMNS[name]: _parse_table_date(row[i], year)
+                               for name, i in columns.items()}
+            except (KeyError, ValueError, IndexError):
+                continue  # Incomplete row: fall back to Computus for that year
+    return table
+
+
+class KeyDates:
+    """Key dates for years first_year..last_year (inclusive) as datetime64[D] columns."""
+
+    def __init__(self, first_year, last_year, seed_file=LECTIONARY_YEARS_CSV):
+        import numpy as np
+        self.first_year = first_year
+        self.last_year = last_year
+        self.years = np.arange(first_year, last_year + 1, dtype='int64')
+
+        self.seeded_years = set()
+        self.columns = compute_key_dates(self.years)
+
+        seeds = {}
+        for year, seeded in (load_lectionary_years(seed_file) if seed_file else {}).items():
+            if first_year <= year <= last_year:
+                seeds[year - first_year] = {name: np.datetime64(value, 'D') for name, value in seeded.items()}
+                self.seeded_years.add(year)
+        if not seeds:
+            return
+
+        # Re-derive from the table's Easter and Advent 1; its Ash Wednesday / Pentecost win too
+        easter = self.columns['easter'].copy()
+        first_advent = self.columns['first_advent'].copy()
+        for i, seeded in seeds.items():
+            easter[i] = seeded.get('easter', easter[i])
+            first_advent[i] = seeded.get('first_advent', first_advent[i])
+        self.columns = compute_key_dates(self.years, easter, first_advent)
+        for i, seeded in seeds.items():
+            for name in ('ash_wednesday', 'pentecost'):
+                if name in seeded:
+                    self.columns[name][i] = seeded[name]
+
+    def __contains__(self, year):
+        return self.first_year <= year <= self.last_year
+
+    def column(self, name, years=None):
+        """datetime64[D] array of one key date, for all years or an int array of years."""
+        import numpy as np
+        values = self.columns[name]
+        if years is None:
+            return values
+        return values[np.asarray(years, dtype='int64') - self.first_year]
+
+    def for_year(self, year):
+        """{key_date: datetime} for one year (same shape generators have always used)."""
+        if year not in self:
+            raise ValueError(f"{year} is outside {self.first_year}-{self.last_year}")
+        i = year - self.first_year
+        return {name: datetime.datetime.combine(self.columns[name][i].astype(datetime.date), datetime.time())
+                for name in KEY_DATE_NAMES}
+
+    def seed_mismatches(self):
+        """[(year, key_date, table, computed)] where lectionary-years.csv disagrees with Computus."""
+        import numpy as np
+        seeded = sorted(self.seeded_years)
+        computed = compute_key_dates(np.array(seeded, dtype='int64'))
+        mismatches = []
+        for j, year in enumerate(seeded):
+            i = year - self.first_year
+            for name in _SEED_COLUMNS.values():
+                if self.columns[name][i] != computed[name][j]:
+                    mismatches.append((year, name, self.columns[name][i], computed[name][j]))
+        return mismatches
+
+
+@lru_cache(maxsize=None)
+def key_dates_table(first_year=FIRST_YEAR, last_year=LAST_YEAR):
+    """Memoized KeyDates for a year range (default: the whole supported range)."""
+    return KeyDates(first_year, last_year)
+
+
+@lru_cache(maxsize=1)
+def _seed_table():
+    return load_lectionary_years()
+
+
+@lru_cache(maxsize=None)
+def _year_dates(year):
+    """Scalar twin of KeyDates.for_year: same rules, plain date arithmetic for one year."""
+    seeded = _seed_table().get(year, {})
+    christmas = datetime.date(year, 12, 25)
+    easter = seeded.get('easter') or easter_date(year)
+    # Fourth Sunday before Christmas
+    first_advent = seeded.get('first_advent') or christmas - datetime.timedelta(days=christmas.weekday() + 1 + 21)
+    # AUSTRALIA: Epiphany on the Sunday between 2 and 8 January; Baptism the Sunday after
+    jan_2 = datetime.date(year, 1, 2)
+    epiphany = jan_2 + datetime.timedelta(days=(6 - jan_2.weekday()) % 7)
+
+    dates = {
+        'easter': easter,
+        'first_advent': first_advent,
+        'christ_the_king': first_advent - datetime.timedelta(days=7),
+        'epiphany': epiphany,
+        'baptism_lord': epiphany + datetime.timedelta(days=7),
+    }
+    for name, offset in EASTER_OFFSETS.items():
+        dates[name] = easter + datetime.timedelta(days=offset)
+    for name in ('ash_wednesday', 'pentecost'):
+        if name in seeded:
+            dates[name] = seeded[name]
+    return {name: datetime.datetime.combine(dates[name], datetime.time()) for name in KEY_DATE_NAMES}
+
+
+def key_dates(year):
+    """{key_date: datetime} for a year, looked up from the memoized table."""
+    return dict(_year_dates(year))
+
+
+def scalar_mismatches(first_year=FIRST_YEAR, last_year=LAST_YEAR):
+    """[(year, key_date, scalar, vectorized)] where key_dates() and KeyDates disagree."""
+    table = key_dates_table(first_year, last_year)
+    mismatches = []
+    for year in range(first_year, last_year + 1):
+        vectorized = table.for_year(year)
+        for name, scalar in key_dates(year).items():
+            if scalar != vectorized[name]:
+                mismatches.append((year, name, scalar, vectorized[name]))
+    return mismatches
+
+
+def ordinary_time_week(date, year_dates=None):
+    """Ordinary Time week of a date or datetime, or None outside Ordinary Time.
+
+    Closed form on day ordinals: Week 1 starts on Baptism of the Lord, and after
+    Pentecost weeks count back from Christ the King (always Week 34). Weeks
+    start on Sunday.
+    """
+    dates = year_dates or _year_dates(date.year)
+    day = date.toordinal()
+    if dates['baptism_lord'].toordinal() <= day < dates['ash_wednesday'].toordinal():
+        return (day - dates['baptism_lord'].toordinal()) // 7 + 1
+    if dates['pentecost'].toordinal() < day < dates['first_advent'].toordinal():
+        return 34 + (day - dates['christ_the_king'].toordinal()) // 7
+    return None
+
+
+def calculate_easter(year):
+    """Easter Sunday as a datetime."""
+    return key_dates(year)['easter']
+
+
+def first_sunday_of_advent(year):
+    return key_dates(year)['first_advent']
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Print key liturgical dates')
+    parser.add_argument('years', nargs='*', type=int, help='Years to print (default: current year)')
+    parser.add_argument('--check', action='store_true',
+                        help=f'Compare {LECTIONARY_YEARS_CSV} with the computed dates, and the '
+                             f'single-year path with the vectorized one for {FIRST_YEAR}-{LAST_YEAR}')
+    args = parser.parse_args()
+
+    if args.check:
+        table = key_dates_table()
+        mismatches = table.seed_mismatches()
+        print(f"{len(table.seeded_years)} years seeded from {LECTIONARY_YEARS_CSV}")
+        for year, name, seeded, computed in mismatches:
+            print(f"  ❌ {year} {name}: table {seeded}, computed {computed}")
+        if not mismatches:
+            print("✅ Table agrees with Computus")
+
+        drift = scalar_mismatches()
+        for year, name, scalar, vectorized in drift[:20]:
+            print(f"  ❌ {year} {name}: key_dates() {scalar:%Y-%m-%d}, KeyDates {vectorized:%Y-%m-%d}")
+        if drift:
+            print(f"❌ {len(drift)} single-year dates differ from KeyDates")
+            raise SystemExit(1)
+        print(f"✅ key_dates() matches KeyDates for {FIRST_YEAR}-{LAST_YEAR}")
+        return
+
+    for year in args.years or [datetime.date.today().year]:
+        print(f"\n{year}:")
+        for name, value in key_dates(year).items():
+            print(f"  {name:<16} {value:%a %d %b %Y}")
+
+
+if __name__ == '__main__':
+    main()
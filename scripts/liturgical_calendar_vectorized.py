@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+Vectorized liturgical calendar generation for arbitrary year spans.
+
+Produces exactly the rows of generate_liturgical_calendar_v2.generate_full_calendar,
+but computes every year at once with NumPy:
+
+1. Key dates (Easter, Ash Wednesday, Pentecost, Advent, Epiphany, Baptism...) for
+   all requested years as datetime64[D] arrays from the key_dates table
+2. Season and week for every day via array comparisons and closed-form week
+   arithmetic (no per-day loops, no strftime)
+3. Name and rank via lookups: a (season, week, weekday) table of seasonal
+   defaults, overridden by each year's celebrations as resolved by v2's
+   precedence engine (a few hundred events per year, not one per day)
+
+Usage:
+  python scripts/liturgical_calendar_vectorized.py --start 2025 --end 2030
+  python scripts/liturgical_calendar_vectorized.py --start 1583 --end 4099 --output /tmp/calendar.csv
+  python scripts/liturgical_calendar_vectorized.py --start 2000 --end 2100 --verify   # Diff against v2
+"""
+
+import argparse
+import csv
+import datetime
+import time
+
+import numpy as np
+
+from generate_liturgical_calendar_v2 import generate_full_calendar, load_lectionary, seasonal_default, year_overrides
+from key_dates import key_dates, key_dates_table, weekday
+
+OUTPUT_CSV = 'data/generated/liturgical_calendar_full.csv'
+FIELDNAMES = ['calendar_date', 'year', 'liturgical_season', 'liturgical_week',
+              'day_of_week', 'liturgical_name', 'liturgical_rank']
+
+DAY_NAMES = np.array(['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday'], dtype=object)
+
+# Season codes (index into SEASONS)
+CHRISTMAS, ADVENT, LENT, HOLY_WEEK, EASTER, ORDINARY = range(6)
+SEASONS = np.array(['Christmas', 'Advent', 'Lent', 'Holy Week', 'Easter', 'Ordinary Time'], dtype=object)
+MAX_WEEK = 35  # weeks are 1..34, index 0 means "no week"
+
+
+def _seasonal_name_table():
+    """(season, week, weekday) -> (name, rank) from the v2 seasonal defaults."""
+    names = np.empty((len(SEASONS), MAX_WEEK + 1, 7), dtype=object)
+    ranks = np.empty_like(names)
+    for season, season_name in enumerate(SEASONS):
+        for week in range(MAX_WEEK + 1):
+            for dow in range(7):
+                names[season, week, dow], ranks[season, week, dow] = seasonal_default(season_name, week, dow)
+    return names, ranks
+
+
+SEASONAL_NAMES, SEASONAL_RANKS = _seasonal_name_table()
+
+
+def generate_calendar_years(start_year, end_year, lectionary):
+    """Generate every day from start_year to end_year (inclusive) as column arrays.
+
+    Returns dict of NumPy arrays keyed by FIELDNAMES; 'liturgical_week' is 0 where
+    the row has no week.
+    """
+    years = np.arange(start_year, end_year + 1, dtype='int64')
+    table = key_dates_table()
+    if start_year not in table or end_year not in table:
+        table = key_dates_table(start_year, end_year)
+    keys = {name: table.column(name, years) for name in table.columns}
+
+    first_day = np.datetime64(f"{start_year:04d}-01-01", 'D')
+    last_day = np.datetime64(f"{end_year + 1:04d}-01-01", 'D')
+    dates = np.arange(first_day, last_day, dtype='datetime64[D]')
+
+    # Broadcast each year's key dates onto its days
+    year_index = dates.astype('datetime64[Y]').astype('int64') - (start_year - 1970)
+    k = {name: values[year_index] for name, values in keys.items()}
+
+    dow = weekday(dates)
+
+    # PHASE 1: season (same order of tests as determine_season)
+    is_christmas = (dates >= k['christmas']) | (dates < k['baptism_lord'])
+    is_advent = (dates >= k['first_advent']) & (dates < k['christmas'])
+    is_lent_or_holy = (dates >= k['ash_wednesday']) & (dates < k['easter'])
+    is_holy_week = is_lent_or_holy & (dates >= k['palm_sunday'])
+    is_easter = (dates >= k['easter']) & (dates <= k['pentecost'])
+    season = np.select(
+        [is_christmas, is_advent, is_holy_week, is_lent_or_holy, is_easter],
+        [CHRISTMAS, ADVENT, HOLY_WEEK, LENT, EASTER],
+        default=ORDINARY
+    )
+
+    # Weeks: closed-form offsets from each season's anchor
+    first_sunday_lent = k['ash_wednesday'] + 4
+    days_from = lambda anchor: (dates - anchor).astype('int64')
+    lent_week = np.where(dates < first_sunday_lent, 1, days_from(first_sunday_lent) // 7 + 1)
+    ordinary_week = np.where(
+        dates < k['ash_wednesday'],
+        days_from(k['baptism_lord']) // 7 + 1,       # Week 1 starts on Baptism of the Lord
+        34 + days_from(k['christ_the_king']) // 7    # Christ the King is always Week 34
+    )
+    week = np.select(
+        [season == ADVENT, season == LENT, season == EASTER, season == ORDINARY],
+        [days_from(k['first_advent']) // 7 + 1, lent_week, days_from(k['easter']) // 7 + 1, ordinary_week],
+        default=0
+    )
+
+    # PHASE 2: name and rank - seasonal defaults by lookup
+    names = SEASONAL_NAMES[season, week, dow]
+    ranks = SEASONAL_RANKS[season, week, dow]
+
+    # Date-specific celebrations: the v2 precedence engine resolves each year's
+    # events (including transfers); apply them over the seasonal defaults
+    epoch_ordinal = datetime.date(1970, 1, 1).toordinal() + int(first_day.astype('int64'))
+    positions, override_names, override_ranks = [], [], []
+    for year in range(start_year, end_year + 1):
+        for ordinal, (name, rank) in year_overrides(year, key_dates(year), lectionary).items():
+            positions.append(ordinal - epoch_ordinal)
+            override_names.append(name)
+            override_ranks.append(rank)
+    positions = np.array(positions, dtype='int64')
+    inside = (positions >= 0) & (positions < len(dates))  # Transfers can cross a span edge
+    names[positions[inside]] = np.array(override_names, dtype=object)[inside]
+    ranks[positions[inside]] = np.array(override_ranks, dtype=object)[inside]
+
+    return {
+        'calendar_date': np.datetime_as_string(dates, unit='D'),
+        'year': years[year_index],
+        'liturgical_season': SEASONS[season],
+        'liturgical_week': week,
+        'day_of_week': DAY_NAMES[dow],
+        'liturgical_name': names,
+        'liturgical_rank': ranks,
+    }
+
+
+def iter_rows(columns):
+    """Yield CSV rows (tuples in FIELDNAMES order) from generate_calendar_years output."""
+    weeks = [str(w) if w else '' for w in columns['liturgical_week'].tolist()]
+    return zip(columns['calendar_date'].tolist(), columns['year'].tolist(),
+               columns['liturgical_season'].tolist(), weeks, columns['day_of_week'].tolist(),
+               columns['liturgical_name'].tolist(), columns['liturgical_rank'].tolist())
+
+
+def write_calendar(columns, filename=OUTPUT_CSV):
+    with open(filename, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(FIELDNAMES)
+        writer.writerows(iter_rows(columns))
+
+
+def verify_against_v2(columns, start_year, end_year, lectionary):
+    """Compare vectorized rows with generate_full_calendar. Returns mismatch count."""
+    mismatches = 0
+    rows = iter_rows(columns)
+    for year in range(start_year, end_year + 1):
+        for entry in generate_full_calendar(year, lectionary):
+            expected = tuple('' if entry[f] is None else str(entry[f]) for f in FIELDNAMES)
+            actual = tuple(str(v) for v in next(rows))
+            if expected != actual:
+                mismatches += 1
+                if mismatches <= 10:
+                    print(f"  ❌ {expected[0]}:\n     v2:         {expected[2:]}\n     vectorized: {actual[2:]}")
+    return mismatches
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Vectorized liturgical calendar generation')
+    parser.add_argument('--start', type=int, default=2025, help='First year (default 2025)')
+    parser.add_argument('--end', type=int, default=2030, help='Last year, inclusive (default 2030)')
+    parser.add_argument('--output', default=OUTPUT_CSV, help=f'Output CSV (default {OUTPUT_CSV})')
+    parser.add_argument('--verify', action='store_true', help='Check output matches generate_full_calendar')
+    args = parser.parse_args()
+
+    lectionary = load_lectionary()
+
+    start = time.perf_counter()
+    columns = generate_calendar_years(args.start, args.end, lectionary)
+    generated = time.perf_counter()
+    write_calendar(columns, args.output)
+    written = time.perf_counter()
+
+    days = len(columns['calendar_date'])
+    print(f"Generated {days:,} days ({args.start}-{args.end}) in {generated - start:.2f}s, "
+          f"wrote {args.output} in {written - generated:.2f}s")
+
+    if args.verify:
+        print(f"\nVerifying against generate_full_calendar...")
+        mismatches = verify_against_v2(columns, args.start, args.end, lectionary)
+        if mismatches:
+            print(f"\n❌ {mismatches} rows differ")
+            raise SystemExit(1)
+        print("✅ Output identical to generate_full_calendar")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Load-test the local readings service (scripts/readings_server.py).
+
+Each worker thread holds one keep-alive connection and fires GET requests for
+dates drawn from the generated mapping, then latency percentiles and
+throughput are reported.
+
+Usage:
+  python scripts/loadtest_readings_server.py                          # 5000 requests, 8 workers
+  python scripts/loadtest_readings_server.py --requests 20000 --concurrency 16
+  python scripts/loadtest_readings_server.py --hot 7                  # Only the 7 hottest dates
+  python scripts/loadtest_readings_server.py --range 31               # Month-range queries
+  python scripts/loadtest_readings_server.py --revalidate             # Send If-None-Match (304s)
+"""
+
+import argparse
+import csv
+import datetime
+import http.client
+import random
+import statistics
+import threading
+import time
+
+from generate_ordo_lectionary_mapping import OUTPUT_CSV
+from readings_server import DEFAULT_HOST, DEFAULT_PORT
+
+
+def load_dates(mapping_file=OUTPUT_CSV):
+    with open(mapping_file, 'r', encoding='utf-8') as f:
+        return [row['calendar_date'] for row in csv.DictReader(f) if row['lectionary_id']]
+
+
+def build_paths(dates, count, hot=None, range_days=None, seed=0):
+    """Pre-build request paths so path construction is not part of the timing."""
+    rng = random.Random(seed)
+    pool = dates[:hot] if hot else dates
+    paths = []
+    for _ in range(count):
+        date = rng.choice(pool)
+        if range_days:
+            end = datetime.date.fromisoformat(date) + datetime.timedelta(days=range_days - 1)
+            paths.append(f"/readings?from={date}&to={end.isoformat()}")
+        else:
+            paths.append(f"/readings?date={date}")
+    return paths
+
+
+def worker(host, port, paths, latencies, statuses, revalidate):
+    conn = http.client.HTTPConnection(host, port)
+    etags = {}
+    for path in paths:
+        headers = {}
+        if revalidate and path in etags:
+            headers['If-None-Match'] = etags[path]
+        start = time.perf_counter()
+        conn.request('GET', path, headers=headers)
+        response = conn.getresponse()
+        response.read()
+        latencies.append(time.perf_counter() - start)
+        statuses[response.status] = statuses.get(response.status, 0) + 1
+        etag = response.getheader('ETag')
+        if etag:
+            etags[path] = etag
+    conn.close()
+
+
+def percentile(sorted_values, pct):
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(pct / 100 * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def run(host, port, paths, concurrency, revalidate=False):
+    """Split paths across worker threads and return (latencies, statuses, elapsed)."""
+    chunks = [paths[i::concurrency] for i in range(concurrency)]
+    latencies_per_worker = [[] for _ in chunks]
+    statuses_per_worker = [{} for _ in chunks]
+    threads = [
+        threading.Thread(target=worker, args=(host, port, chunk, lat, st, revalidate))
+        for chunk, lat, st in zip(chunks, latencies_per_worker, statuses_per_worker)
+    ]
+
+    start = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - start
+
+    latencies = sorted(l for lat in latencies_per_worker for l in lat)
+    statuses = {}
+    for st in statuses_per_worker:
+        for code, n in st.items():
+            statuses[code] = statuses.get(code, 0) + n
+    return latencies, statuses, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Load-test the local readings service')
+    parser.add_argument('--host', default=DEFAULT_HOST)
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT)
+    parser.add_argument('--requests', type=int, default=5000, help='Total requests (default 5000)')
+    parser.add_argument('--concurrency', type=int, default=8, help='Worker threads (default 8)')
+    parser.add_argument('--hot', type=int, help='Only request the first N dates (cache-hot workload)')
+    parser.add_argument('--range', type=int, metavar='DAYS', help='Request from/to ranges of DAYS days')
+    parser.add_argument('--revalidate', action='store_true', help='Send If-None-Match after the first hit')
+    parser.add_argument('--warmup', type=int, default=200, help='Untimed warmup requests (default 200)')
+    args = parser.parse_args()
+
+    dates = load_dates()
+    print(f"Loaded {len(dates)} dates from {OUTPUT_CSV}")
+
+    if args.warmup:
+        run(args.host, args.port, build_paths(dates, args.warmup, args.hot, args.range, seed=1), 1)
+
+    paths = build_paths(dates, args.requests, args.hot, args.range)
+    latencies, statuses, elapsed = run(args.host, args.port, paths, args.concurrency, args.revalidate)
+
+    ms = [l * 1000 for l in latencies]
+    print(f"\n{'='*60}")
+    print(f"LOAD TEST: {len(ms)} requests, {args.concurrency} workers")
+    print(f"{'='*60}")
+    print(f"  Throughput: {len(ms) / elapsed:,.0f} req/s ({elapsed:.2f}s)")
+    print(f"  Latency mean: {statistics.mean(ms):.3f}ms")
+    for pct in (50, 90, 95, 99):
+        print(f"  Latency p{pct}: {percentile(ms, pct):.3f}ms")
+    print(f"  Latency max: {ms[-1]:.3f}ms")
+    print(f"  Status codes: {', '.join(f'{code}={n}' for code, n in sorted(statuses.items()))}")
+
+
+if __name__ == '__main__':
+    main()
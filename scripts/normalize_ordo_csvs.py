@@ -1,173 +1,303 @@
 #!/usr/bin/env python3
 """
-Normalize 2025.csv and 2026.csv to extract PRIMARY liturgical days only.
+Normalize every data/source/<year>.csv Ordo file to extract PRIMARY liturgical days only.
 This creates a clean mapping of date -> primary liturgical celebration.
 
 Rules:
 1. For each date, only the FIRST row is the primary celebration
 2. Subsequent rows (starting with comma) are optional memorials/alternatives
 3. Empty description rows are skipped
+
+Subsequent rows are kept too, in a compact side table (SecondaryCelebrations:
+day ordinals + interned names) written to ordo_secondary.csv in the same pass,
+so downstream tools never need to re-read the raw Ordo files.
+
+Normalization is incremental: each year's output is kept as a chunk in
+data/generated/ordo_chunks/, and manifest.json records the source file hash
+it came from. Only changed years are re-normalized; the output files are
+reassembled from the chunks and left untouched (mtime included) when their
+content is unchanged, so downstream caches stay warm.
+
+Ordo XML exports in the source directory (or passed with --xml) feed the same
+pipeline: their days are streamed (ordo_source.iter_ordo_xml), split by
+calendar year and normalized like CSV days. A year with a <year>.csv keeps the
+CSV; XML days fill the years that have none.
 """
 
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date
+from functools import lru_cache
+from itertools import groupby
+import argparse
 import csv
-import re
-from datetime import datetime
+import hashlib
+import heapq
+import io
+import json
+import os
+import sys
+
+from file_cache import write_atomic
+from ordo_source import (ORDO_XML_RE, PARSED_DIR, PARSER_VERSION, SOURCE_DIR, find_ordo_sources,
+                         find_ordo_xml_sources, iter_ordo_xml, load_ordo_source, source_hash)
+
+OUTPUT_CSV = 'data/generated/ordo_normalized.csv'
+SECONDARY_CSV = 'data/generated/ordo_secondary.csv'
+CHUNK_DIR = 'data/generated/ordo_chunks'  # <year>.csv / <year>.secondary.csv + manifest.json
+MANIFEST_FILE = 'manifest.json'
+FIELDNAMES = ['calendar_date', 'year', 'liturgical_season', 'liturgical_week',
+              'liturgical_name', 'liturgical_rank']
 
-def normalize_ordo_csv(input_file, year):
+class SecondaryCelebrations:
     """
-    Parse authoritative Ordo CSV and extract only primary celebrations.
-    Returns list of normalized entries.
+    Optional memorials and alternatives listed under a date's primary
+    celebration, as parallel columns: day ordinals and interned names.
     """
-    entries = []
-    current_date = None
 
-    month_map = {
-        'January': 1, 'February': 2, 'March': 3, 'April': 4,
-        'May': 5, 'June': 6, 'July': 7, 'August': 8,
-        'September': 9, 'October': 10, 'November': 11, 'December': 12
-    }
+    def __init__(self):
+        self.ordinals = array('i')
+        self.names = []
+
+    def __len__(self):
+        return len(self.ordinals)
+
+    def add(self, ordinal, name):
+        self.ordinals.append(ordinal)
+        self.names.append(sys.intern(name))
+
+    def extend(self, other):
+        for ordinal, name in zip(other.ordinals, other.names):
+            self.add(ordinal, name)  # Re-interned: names pickled from workers arrive as copies
 
-    with open(input_file, 'r', encoding='utf-8') as f:
-        reader = csv.reader(f)
-
-        for row in reader:
-            if len(row) < 2:
-                continue
-
-            date_str = row[0].strip()
-            description = row[1].strip() if len(row) > 1 else ''
-
-            # Skip empty descriptions and header rows
-            if not description or 'YEAR' in date_str:
-                continue
-
-            # Check if this is a new date (not starting with comma)
-            if date_str:
-                # Parse date: "7 August" format
-                match = re.match(r'(\d+)\s+(\w+)', date_str)
-                if match:
-                    day = int(match.group(1))
-                    month_name = match.group(2)
-
-                    if month_name in month_map:
-                        month = month_map[month_name]
-                        current_date = f"{year}-{month:02d}-{day:02d}"
-
-                        # Detect liturgical week and season from description
-                        week = None
-                        season = None
-                        rank = None
-
-                        # Week markers: "2 ORDINARY", "3 LENT", etc.
-                        week_match = re.match(r'^(\d+)\s+(ORDINARY|LENT|ADVENT|EASTER)', description)
-                        if week_match:
-                            week = int(week_match.group(1))
-                            season_raw = week_match.group(2)
-                            season = 'Ordinary Time' if season_raw == 'ORDINARY' else season_raw.title()
-                            rank = 'Sunday'
-
-                        # Detect rank from formatting
-                        elif description.isupper():
-                            # ALL CAPS = Solemnity or major feast
-                            rank = 'Solemnity'
-                        elif description[0].isupper() and not 'of the' in description.lower():
-                            # Title Case (but not "Monday of the...") = Feast or Memorial
-                            if 'Saint' in description or 'Blessed' in description:
-                                rank = 'Memorial'  # Could be Memorial or Feast - would need more data
-                            else:
-                                rank = 'Feast'
-                        else:
-                            # Lowercase or "day of the week" = Feria
-                            rank = 'Feria'
-
-                        # Extract season from description for ferial days
-                        if not season:
-                            if 'Ordinary Time' in description:
-                                season = 'Ordinary Time'
-                                # Extract week: "Thursday of the eighteenth week in Ordinary Time"
-                                week_match = re.search(r'of the (\w+(?:-\w+)?) week in Ordinary Time', description, re.IGNORECASE)
-                                if week_match:
-                                    week_word = week_match.group(1)
-                                    week = parse_week_word(week_word)
-                            elif 'Lent' in description:
-                                season = 'Lent'
-                                week_match = re.search(r'of the (\w+(?:-\w+)?) week of Lent', description, re.IGNORECASE)
-                                if week_match:
-                                    week = parse_week_word(week_match.group(1))
-                            elif 'Advent' in description:
-                                season = 'Advent'
-                                week_match = re.search(r'of the (\w+(?:-\w+)?) week of Advent', description, re.IGNORECASE)
-                                if week_match:
-                                    week = parse_week_word(week_match.group(1))
-                            elif 'Easter' in description:
-                                season = 'Easter'
-                                week_match = re.search(r'of the (\w+(?:-\w+)?) week of Easter', description, re.IGNORECASE)
-                                if week_match:
-                                    week = parse_week_word(week_match.group(1))
-                            elif 'Christmas' in description or 'Epiphany' in description or 'before Epiphany' in description or 'after Epiphany' in description:
-                                season = 'Christmas'
-                            elif 'Holy Week' in description:
-                                season = 'Holy Week'
-
-                        # Store the primary entry
-                        entries.append({
-                            'calendar_date': current_date,
-                            'year': year,
-                            'liturgical_season': season,
-                            'liturgical_week': week,
-                            'liturgical_name': description,
-                            'liturgical_rank': rank
-                        })
+    def names_by_date(self):
+        """{'YYYY-MM-DD': [names in Ordo order]}"""
+        by_date = {}
+        for ordinal, name in zip(self.ordinals, self.names):
+            by_date.setdefault(date.fromordinal(ordinal).isoformat(), []).append(name)
+        return by_date
 
+    def write_csv(self, filename=SECONDARY_CSV):
+        with open(filename, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(['calendar_date', 'liturgical_name'])
+            writer.writerows(self.rows())
+
+    def rows(self):
+        for ordinal, name in zip(self.ordinals, self.names):
+            yield date.fromordinal(ordinal).isoformat(), name
+
+    @classmethod
+    def load_csv(cls, filename=SECONDARY_CSV, year=None):
+        """Read ordo_secondary.csv back (optionally one year only)"""
+        table = cls()
+        prefix = f"{year}-" if year is not None else ''
+        with open(filename, 'r', encoding='utf-8') as f:
+            reader = csv.reader(f)
+            next(reader, None)
+            for calendar_date, name in reader:
+                if calendar_date.startswith(prefix):
+                    table.add(date.fromisoformat(calendar_date).toordinal(), name)
+        return table
+
+def normalize_ordo_csv(input_file, year, secondary=None, cache_dir=PARSED_DIR):
+    """
+    Extract only primary celebrations from an authoritative Ordo CSV (parsed
+    once by ordo_source). Returns list of normalized entries. If a
+    SecondaryCelebrations is passed, the other celebrations of each date are
+    added to it in the same pass.
+    """
+    return normalize_ordo_days(load_ordo_source(input_file, year, cache_dir), secondary)
+
+def normalize_ordo_days(days, secondary=None):
+    """Normalized entries for OrdoDay records (from a CSV or XML source), secondary rows as above"""
+    entries = []
+    for day in days:
+        entries.append({
+            'calendar_date': day.date,
+            'year': int(day.date[:4]),
+            'liturgical_season': day.season,
+            'liturgical_week': day.week,
+            'liturgical_name': day.celebrations[0],
+            'liturgical_rank': day.rank
+        })
+        if secondary is not None and day.ordinal is not None:
+            for name in day.celebrations[1:]:
+                secondary.add(day.ordinal, name)
     return entries
 
-def parse_week_word(word):
-    """Convert week word to number"""
-    week_map = {
-        'first': 1, 'second': 2, 'third': 3, 'fourth': 4, 'fifth': 5,
-        'sixth': 6, 'seventh': 7, 'eighth': 8, 'ninth': 9, 'tenth': 10,
-        'eleventh': 11, 'twelfth': 12, 'thirteenth': 13, 'fourteenth': 14,
-        'fifteenth': 15, 'sixteenth': 16, 'seventeenth': 17, 'eighteenth': 18,
-        'nineteenth': 19, 'twentieth': 20, 'twenty-first': 21, 'twenty-second': 22,
-        'twenty-third': 23, 'twenty-fourth': 24, 'twenty-fifth': 25, 'twenty-sixth': 26,
-        'twenty-seventh': 27, 'twenty-eighth': 28, 'twenty-ninth': 29, 'thirtieth': 30,
-        'thirty-first': 31, 'thirty-second': 32, 'thirty-third': 33, 'thirty-fourth': 34
+def _normalize_source(source):
+    year, path = source
+    secondary = SecondaryCelebrations()
+    return year, normalize_ordo_csv(path, year, secondary), secondary
+
+def normalize_ordo_sources(sources, workers=1):
+    """Yield (year, entries, secondary) in year order, normalizing files in a process pool"""
+    if workers <= 1 or len(sources) <= 1:
+        yield from map(_normalize_source, sources)
+        return
+    with ProcessPoolExecutor(max_workers=min(workers, len(sources))) as pool:
+        yield from pool.map(_normalize_source, sources)
+
+def normalize_ordo_xml(xml_sources):
+    """
+    Yield (year, entries, secondary) per calendar year from Ordo XML files
+    [(liturgical year, path)]. The files are streamed and merged by date (a
+    later file wins a date both list), holding one calendar year at a time.
+    """
+    streams = [iter_ordo_xml(path, year - 1) for year, path in xml_sources]
+    merged = heapq.merge(*streams, key=lambda day: day.date)
+    for year, days in groupby(merged, key=lambda day: int(day.date[:4])):
+        by_date = {day.date: day for day in days}
+        secondary = SecondaryCelebrations()
+        yield year, normalize_ordo_days(by_date.values(), secondary), secondary
+
+@lru_cache(maxsize=1)
+def normalizer_version():
+    """Digest of this module's source: any rule change re-normalizes every year"""
+    with open(os.path.abspath(__file__), 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+def _read_text(path):
+    try:
+        with open(path, 'r', newline='', encoding='utf-8') as f:
+            return f.read()
+    except FileNotFoundError:
+        return None
+
+def _write_if_changed(path, text):
+    """Write text atomically unless the file already holds it (keeping its mtime). Returns True if written."""
+    if _read_text(path) == text:
+        return False
+    write_atomic(path, text)
+    return True
+
+def _encode_chunks(entries, secondary):
+    primary = io.StringIO(newline='')
+    csv.DictWriter(primary, fieldnames=FIELDNAMES).writerows(
+        sorted(entries, key=lambda entry: entry['calendar_date']))  # In case the Ordo lists a date late
+    extra = io.StringIO(newline='')
+    csv.writer(extra).writerows(secondary.rows())
+    return primary.getvalue(), extra.getvalue()
+
+def normalize_incremental(sources, workers=1, chunk_dir=CHUNK_DIR,
+                          output_file=OUTPUT_CSV, secondary_file=SECONDARY_CSV, xml_sources=()):
+    """
+    Normalize only the years whose source file (or this normalizer) changed,
+    keeping per-year chunks in chunk_dir, then reassemble the output files
+    in year order. Outputs are only rewritten when their content changed.
+    Years from xml_sources ([(liturgical year, path)]) share one key, the
+    hashes of every XML file: if any changed, all of them are re-streamed.
+    Returns stats dict.
+    """
+    os.makedirs(chunk_dir, exist_ok=True)
+    manifest_path = os.path.join(chunk_dir, MANIFEST_FILE)
+    previous = json.loads(_read_text(manifest_path) or '{}').get('years', {})
+
+    manifest, chunks, stale = {}, {}, []
+    for year, path in sources:
+        key = {'source_sha256': source_hash(path), 'normalizer': normalizer_version()}
+        manifest[str(year)] = key
+        cached = (_read_text(os.path.join(chunk_dir, f"{year}.csv")),
+                  _read_text(os.path.join(chunk_dir, f"{year}.secondary.csv")))
+        if previous.get(str(year)) == key and None not in cached:
+            chunks[year] = cached
+        else:
+            stale.append((year, path))
+
+    for year, entries, secondary in normalize_ordo_sources(stale, workers):
+        chunks[year] = _encode_chunks(entries, secondary)
+        _write_if_changed(os.path.join(chunk_dir, f"{year}.csv"), chunks[year][0])
+        _write_if_changed(os.path.join(chunk_dir, f"{year}.secondary.csv"), chunks[year][1])
+
+    if xml_sources:
+        xml_key = {'xml_sha256': [source_hash(path) for _, path in xml_sources],
+                   'normalizer': normalizer_version(), 'parser': PARSER_VERSION}
+        csv_years = set(manifest)
+        cached = {}
+        for year, key in previous.items():
+            if key == xml_key and year not in csv_years:
+                cached[int(year)] = (_read_text(os.path.join(chunk_dir, f"{year}.csv")),
+                                     _read_text(os.path.join(chunk_dir, f"{year}.secondary.csv")))
+        if cached and all(None not in chunk for chunk in cached.values()):
+            chunks.update(cached)
+            xml_years = sorted(cached)
+        else:
+            xml_years = []
+            for year, entries, secondary in normalize_ordo_xml(xml_sources):
+                if str(year) in csv_years:
+                    continue
+                chunks[year] = _encode_chunks(entries, secondary)
+                _write_if_changed(os.path.join(chunk_dir, f"{year}.csv"), chunks[year][0])
+                _write_if_changed(os.path.join(chunk_dir, f"{year}.secondary.csv"), chunks[year][1])
+                xml_years.append(year)
+            stale.extend((year, 'xml') for year in xml_years)
+        for year in xml_years:
+            manifest[str(year)] = xml_key
+        sources = sorted(list(sources) + [(year, 'xml') for year in xml_years])
+
+    for year in set(previous) - set(manifest):  # Source file removed
+        for name in (f"{year}.csv", f"{year}.secondary.csv"):
+            if os.path.exists(os.path.join(chunk_dir, name)):
+                os.remove(os.path.join(chunk_dir, name))
+
+    header = io.StringIO(newline='')
+    csv.DictWriter(header, fieldnames=FIELDNAMES).writeheader()
+    primary = header.getvalue() + ''.join(chunks[year][0] for year, _ in sources)
+    secondary = 'calendar_date,liturgical_name\r\n' + ''.join(chunks[year][1] for year, _ in sources)
+
+    stats = {
+        'years': len(sources),
+        'xml_years': [year for year, path in sources if path == 'xml'],
+        'normalized': [year for year, _ in stale],
+        'output_written': _write_if_changed(output_file, primary),
+        'secondary_written': _write_if_changed(secondary_file, secondary),
+        'days': {year: chunks[year][0].count('\n') for year, _ in sources},
     }
-    return week_map.get(word.lower())
+    _write_if_changed(manifest_path, json.dumps({'years': manifest}, indent=2, sort_keys=True))
+    return stats
 
 def main():
+    parser = argparse.ArgumentParser(description='Normalize every data/source/<year>.csv (and Ordo XML) file')
+    parser.add_argument('--source-dir', default=SOURCE_DIR,
+                        help=f'Directory of <year>.csv / <year>.xml files (default {SOURCE_DIR})')
+    parser.add_argument('--xml', nargs='+', default=[], metavar='FILE',
+                        help='Extra Ordo XML exports, named with their liturgical year ("ORDO 2027.xml")')
+    parser.add_argument('--workers', type=int, help='Worker processes (default: all cores, 1 = serial)')
+    args = parser.parse_args()
+
     print("="*80)
     print("NORMALIZING ORDO CSV FILES")
     print("="*80)
 
-    all_entries = []
-
-    # Process 2025
-    print("\nProcessing 2025.csv...")
-    entries_2025 = normalize_ordo_csv('data/source/2025.csv', 2025)
-    print(f"  Extracted {len(entries_2025)} primary liturgical days")
-    all_entries.extend(entries_2025)
-
-    # Process 2026
-    print("\nProcessing 2026.csv...")
-    entries_2026 = normalize_ordo_csv('data/source/2026.csv', 2026)
-    print(f"  Extracted {len(entries_2026)} primary liturgical days")
-    all_entries.extend(entries_2026)
+    sources = find_ordo_sources(args.source_dir)
+    xml_sources = find_ordo_xml_sources(args.source_dir)
+    for path in args.xml:
+        match = ORDO_XML_RE.match(os.path.basename(path))
+        if not match:
+            parser.error(f"{path}: name the file <year>.xml or 'ORDO <year>.xml' (its liturgical year)")
+        xml_sources.append((int(match.group(1)), path))
+    xml_sources.sort()
+    workers = args.workers or os.cpu_count() or 1
+    print(f"\nFound {len(sources)} Ordo files in {args.source_dir}/"
+          + (f", {len(xml_sources)} XML exports" if xml_sources else ''))
 
-    # Save to CSV
-    output_file = 'data/generated/ordo_normalized.csv'
-    fieldnames = ['calendar_date', 'year', 'liturgical_season', 'liturgical_week',
-                  'liturgical_name', 'liturgical_rank']
+    stats = normalize_incremental(sources, workers, xml_sources=xml_sources)
+    for year in sorted(stats['days']):
+        label = f"{year} (XML)" if year in stats['xml_years'] else f"{year}.csv"
+        status = 'normalized' if year in stats['normalized'] else 'unchanged (cached chunk)'
+        print(f"  {label}: {stats['days'][year]} primary liturgical days - {status}")
 
-    with open(output_file, 'w', newline='', encoding='utf-8') as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(all_entries)
+    with open(OUTPUT_CSV, 'r', encoding='utf-8') as f:
+        all_entries = list(csv.DictReader(f))
+    secondary = SecondaryCelebrations.load_csv(SECONDARY_CSV)
 
     print(f"\n{'='*80}")
     print(f"COMPLETE!")
     print(f"  Total entries: {len(all_entries)}")
-    print(f"  Saved to: {output_file}")
+    print(f"  {'Saved to' if stats['output_written'] else 'Unchanged'}: {OUTPUT_CSV}")
+    print(f"  Secondary celebrations: {len(secondary)} ({len(set(secondary.names))} distinct names) -> {SECONDARY_CSV}"
+          f"{'' if stats['secondary_written'] else ' (unchanged)'}")
     print(f"{'='*80}")
 
     # Show samples
@@ -0,0 +1,400 @@
+#!/usr/bin/env python3
+"""
+Parse raw Ordo source files (data/source/<year>.csv) once, into a structured form.
+
+Every tool that reads the Ordo (normalize_ordo_csvs.py, validate_all_years.py,
+and through the normalized tables validate_against_authoritative.py) consumes
+the same OrdoDay records:
+
+  OrdoDay(date='2025-01-03', ordinal=739254,
+          celebrations=('Friday before Epiphany', 'Most Holy Name of Jesus'),
+          rank='Feria', season='Christmas', week=None)
+
+The first celebration is the primary one; rank/season/week are detected from
+it by classify_description(), one compiled regex plus module-level tables.
+
+Parsed files are memoized per process and cached on disk in
+data/generated/ordo_parsed/<year>.pickle, keyed by the source file's hash, so a
+validate-plus-normalize run parses each source file exactly once.
+
+Tagged-PDF Ordo XML exports (data/source/<year>.xml or "ORDO <year>.xml", the
+booklet for the liturgical year starting at Advent of <year - 1>) are read by
+iter_ordo_xml(), which streams OrdoDay records off iterparse and clears each
+element once read, so multi-year files parse in bounded memory.
+
+Usage:
+  python scripts/ordo_source.py                  # Parse (or load) every source file, print a summary
+  python scripts/ordo_source.py 2026 --show 5    # First days of one year
+"""
+
+import argparse
+import csv
+import os
+import re
+import xml.etree.ElementTree as ET
+from collections import namedtuple
+from datetime import date
+
+from file_cache import file_hash, load_pickle, save_pickle
+
+SOURCE_DIR = 'data/source'
+ORDO_FILE_RE = re.compile(r'^(\d{4})\.csv$')  # data/source/<year>.csv
+ORDO_XML_RE = re.compile(r'^(?:ORDO )?(\d{4})\.xml$', re.IGNORECASE)  # data/source/<year>.xml, "ORDO 2026.xml"
+PARSED_DIR = 'data/generated/ordo_parsed'
+
+# Bump when parsing or classification rules change so cached parses are rebuilt
+PARSER_VERSION = 1
+
+MONTHS = {
+    'January': 1, 'February': 2, 'March': 3, 'April': 4,
+    'May': 5, 'June': 6, 'July': 7, 'August': 8,
+    'September': 9, 'October': 10, 'November': 11, 'December': 12
+}
+
+DATE_RE = re.compile(r'(\d+)\s+(\w+)')  # "7 August"
+
+WEEK_WORDS = {
+    'first': 1, 'second': 2, 'third': 3, 'fourth': 4, 'fifth': 5,
+    'sixth': 6, 'seventh': 7, 'eighth': 8, 'ninth': 9, 'tenth': 10,
+    'eleventh': 11, 'twelfth': 12, 'thirteenth': 13, 'fourteenth': 14,
+    'fifteenth': 15, 'sixteenth': 16, 'seventeenth': 17, 'eighteenth': 18,
+    'nineteenth': 19, 'twentieth': 20, 'twenty-first': 21, 'twenty-second': 22,
+    'twenty-third': 23, 'twenty-fourth': 24, 'twenty-fifth': 25, 'twenty-sixth': 26,
+    'twenty-seventh': 27, 'twenty-eighth': 28, 'twenty-ninth': 29, 'thirtieth': 30,
+    'thirty-first': 31, 'thirty-second': 32, 'thirty-third': 33, 'thirty-fourth': 34
+}
+
+# Ordo description -> season (and week) in one match, first alternative that applies:
+#   "2 ORDINARY" Sunday markers, "Thursday of the eighteenth week in Ordinary Time" /
+#   "... week of Lent" weekdays, then a bare season word ("Friday after Epiphany").
+DESCRIPTION_RE = re.compile(
+    r'^(?P<sunday_week>\d+)\s+(?P<sunday_season>ORDINARY|LENT|ADVENT|EASTER)'
+    r'|(?i:of the (?P<week_word>\w+(?:-\w+)?) week (?:in|of) )'
+    r'(?P<week_season>Ordinary Time|Lent|Advent|Easter)'
+    r'|(?P<season>Ordinary Time|Lent|Advent|Easter|Christmas|Epiphany|Holy Week)'
+)
+
+SEASON_NAMES = {
+    'ORDINARY': 'Ordinary Time', 'LENT': 'Lent', 'ADVENT': 'Advent', 'EASTER': 'Easter',
+    'Ordinary Time': 'Ordinary Time', 'Lent': 'Lent', 'Advent': 'Advent', 'Easter': 'Easter',
+    'Christmas': 'Christmas', 'Epiphany': 'Christmas', 'Holy Week': 'Holy Week',
+}
+
+OrdoDay = namedtuple('OrdoDay', ['date', 'ordinal', 'celebrations', 'rank', 'season', 'week'])
+
+
+def classify_description(description):
+    """
+    (rank, season, week) of an Ordo description. Sunday markers give the
+    week; otherwise rank comes from the formatting (ALL CAPS = Solemnity,
+    Title Case = Feast/Memorial, "Monday of the..." = Feria).
+    """
+    match = DESCRIPTION_RE.search(description)
+    if match and match.group('sunday_week'):
+        return 'Sunday', SEASON_NAMES[match.group('sunday_season')], int(match.group('sunday_week'))
+
+    if description.isupper():
+        rank = 'Solemnity'
+    elif description[0].isupper() and 'of the' not in description.lower():
+        # Could be Memorial or Feast - would need more data
+        rank = 'Memorial' if 'Saint' in description or 'Blessed' in description else 'Feast'
+    else:
+        rank = 'Feria'
+
+    if not match:
+        return rank, None, None
+    if match.group('week_season'):
+        return rank, SEASON_NAMES[match.group('week_season')], WEEK_WORDS.get(match.group('week_word').lower())
+    return rank, SEASON_NAMES[match.group('season')], None
+
+
+def parse_week_word(word):
+    """Convert week word to number"""
+    return WEEK_WORDS.get(word.lower())
+
+
+def parse_ordo_csv(filename, year):
+    """
+    Parse one raw Ordo CSV into [OrdoDay] in file order.
+
+    Rows with a "7 August" date start a day (their description is the primary
+    celebration); rows without a date add celebrations to the current day.
+    Header rows ("2025,YEAR C"), "YEAR A" section markers and empty
+    descriptions are skipped.
+    """
+    days = []
+    current = None  # [date, ordinal, [celebrations]] of the day being read
+
+    def finish():
+        if current:
+            rank, season, week = classify_description(current[2][0])
+            days.append(OrdoDay(current[0], current[1], tuple(current[2]), rank, season, week))
+
+    with open(filename, 'r', encoding='utf-8') as f:
+        for row in csv.reader(f):
+            if len(row) < 2:
+                continue
+            date_str = row[0].strip()
+            description = row[1].strip()
+            if not description or 'YEAR' in date_str:
+                continue
+
+            if not date_str:
+                if current and 'YEAR' not in description.upper():
+                    current[2].append(description)
+                continue
+
+            match = DATE_RE.match(date_str)
+            if not match or match.group(2) not in MONTHS:
+                continue
+            day, month = int(match.group(1)), MONTHS[match.group(2)]
+            try:
+                ordinal = date(year, month, day).toordinal()
+            except ValueError:
+                ordinal = None
+            finish()
+            current = [f"{year}-{month:02d}-{day:02d}", ordinal, [description]]
+    finish()
+    return days
+
+
+_parsed = {}  # (path, year) -> (stat signature, source hash, days)
+_hashes = {}  # path -> (stat signature, sha256)
+
+
+def _stat_signature(path):
+    stat = os.stat(path)
+    return stat.st_mtime_ns, stat.st_size
+
+
+def source_hash(path):
+    """sha256 of a source file, computed once per process while the file is unchanged"""
+    key = os.path.abspath(path)
+    signature = _stat_signature(path)
+    cached = _hashes.get(key)
+    if cached and cached[0] == signature:
+        return cached[1]
+    digest = file_hash(path)
+    _hashes[key] = (signature, digest)
+    return digest
+
+
+def load_ordo_source(filename, year, cache_dir=PARSED_DIR):
+    """
+    [OrdoDay] for a source file: memoized in this process, then from the
+    on-disk cache if the file's hash matches, else parsed (and cached).
+    cache_dir=None skips the on-disk cache.
+    """
+    key = (os.path.abspath(filename), year)
+    signature = _stat_signature(filename)
+    cached = _parsed.get(key)
+    if cached and cached[0] == signature:
+        return cached[2]
+
+    digest = source_hash(filename)
+    cache_file = os.path.join(cache_dir, f"{year}.pickle") if cache_dir else None
+    stored = load_pickle(cache_file, PARSER_VERSION, digest) if cache_file else None
+    if stored is not None:
+        days = [OrdoDay(*fields) for fields in stored]
+    else:
+        days = parse_ordo_csv(filename, year)
+        if cache_file:
+            # Plain tuples only, so the cache loads regardless of which script pickled it
+            save_pickle(cache_file, PARSER_VERSION, digest, [tuple(day) for day in days])
+
+    _parsed[key] = (signature, digest, days)
+    return days
+
+
+def clear_parsed_cache():
+    """Forget in-process parses (the on-disk cache is untouched)"""
+    _parsed.clear()
+    _hashes.clear()
+
+
+# Tagged-PDF structure elements that delimit text blocks (as in parse-ordo-xml.js);
+# other elements (Span, Link, ...) are inline and their text joins the block
+XML_BLOCK_TAGS = frozenset(['P', 'TD', 'TH', 'TR', 'Table', 'Part', 'Sect',
+                            'H1', 'H2', 'H3', 'H4', 'H5', 'H6', 'L', 'LI', 'Lbl', 'LBody'])
+XML_SKIP_TAGS = frozenset(['xmpmeta', 'bookmark-tree'])  # Metadata, not Ordo text
+
+XML_DAY_RE = re.compile(r'^(\d{1,2})\s+(SUNDAY|Monday|Tuesday|Wednesday|Thursday|Friday|Saturday)\b', re.IGNORECASE)
+XML_MONTH_RE = re.compile(r'\b(' + '|'.join(MONTHS) + r')\b', re.IGNORECASE)
+XML_NOISE_RE = re.compile(
+    r'\b(?:violet|green|white|red|rose|black)\b'  # Vestment colours
+    r'|\s+with\s+octave\b|Preface.*$', re.IGNORECASE)
+# The printed rank follows the name ("Saint Andrew, Apostle Feast red"); a rank word
+# inside a name ("SOLEMNITY OF MARY, ...") is part of the name
+XML_RANK_RE = re.compile(r'\s(Solemnity|Feast|Memorial|Optional(?: Memorial)?)\s*$', re.IGNORECASE)
+XML_SUNDAY_RE = re.compile(r'^(\w+(?:-\w+)?) Sunday (?:of|in) (Advent|Lent|Easter|Ordinary Time)\b', re.IGNORECASE)
+MONTH_NUMBERS = {name.lower(): number for name, number in MONTHS.items()}
+
+
+def _local_name(tag):
+    return tag.rsplit('}', 1)[-1] if isinstance(tag, str) else ''
+
+
+def iter_xml_blocks(filename):
+    """
+    Yield the text of each block of a tagged-PDF XML export, in document order.
+
+    Streams with iterparse: text is read as soon as the parser has attached it
+    (an element's text at the next event after its start, its tail at the next
+    event after its end), then the finished element is cleared and detached,
+    so only the open elements' path is ever held.
+    """
+    buffer = []
+    stack = []    # Open elements, root first
+    skip = 0      # Depth inside XML_SKIP_TAGS
+    last = None   # (event, element) of the previous event
+
+    def flush():
+        text = ''.join(buffer).strip()
+        buffer.clear()
+        return text
+
+    for event, elem in ET.iterparse(filename, events=('start', 'end')):
+        if last is not None:
+            last_event, last_elem = last
+            data = last_elem.text if last_event == 'start' else last_elem.tail
+            if data and not skip:
+                buffer.append(data)
+            if last_event == 'end':
+                last_elem.clear()
+                if stack:
+                    stack[-1].remove(last_elem)
+
+        tag = _local_name(elem.tag)
+        if event == 'start':
+            stack.append(elem)
+            if tag in XML_SKIP_TAGS:
+                skip += 1
+        else:
+            stack.pop()
+            if tag in XML_SKIP_TAGS:
+                skip -= 1
+        if tag in XML_BLOCK_TAGS and not skip:
+            text = flush()
+            if text:
+                yield text
+        last = (event, elem)
+
+    text = flush()
+    if text:
+        yield text
+
+
+def _xml_day(line, iso_date, ordinal):
+    """OrdoDay for an XML day line ("29 SUNDAY NOVEMBER FIRST SUNDAY OF ADVENT violet"), or None if unnamed"""
+    match = XML_DAY_RE.match(line)
+    name = XML_NOISE_RE.sub('', XML_MONTH_RE.sub('', line[match.end():]))
+    name = re.sub(r'^\s*Mass of \d{1,2} \w+', '', name, flags=re.IGNORECASE)
+    rank_word = XML_RANK_RE.search(name)
+    if rank_word:
+        name = name[:rank_word.start()]
+    name = ' '.join(name.split())
+    if not name:
+        return None
+
+    rank, season, week = classify_description(name)
+    if rank_word:
+        # Optional memorials count as memorials, as in the CSV exports
+        rank = 'Memorial' if rank_word.group(1).lower().startswith('optional') else rank_word.group(1).title()
+    elif match.group(2).upper() == 'SUNDAY':
+        rank = 'Sunday'
+        sunday = XML_SUNDAY_RE.match(name)
+        if sunday:
+            season = SEASON_NAMES[sunday.group(2).title()]
+            week = WEEK_WORDS.get(sunday.group(1).lower(), week)
+    return OrdoDay(iso_date, ordinal, (name,), rank, season, week)
+
+
+def iter_ordo_xml(filename, first_year=None, first_month=11):
+    """
+    Stream [OrdoDay] in date order from an Ordo XML export.
+
+    Day lines are blocks starting "<day> <weekday>"; a month name in the line
+    sets the month, otherwise the month advances when the day number drops
+    (and the year at January). Counting starts at first_month of first_year,
+    by default November before the liturgical year in the file name. A date
+    listed twice in a row keeps its last entry. Only the day line is used: the Ordo
+    prints each day's celebration there, so there are no secondary rows.
+    """
+    if first_year is None:
+        match = ORDO_XML_RE.match(os.path.basename(filename))
+        if not match:
+            raise ValueError(f"Cannot tell the year of {filename}: pass first_year")
+        first_year = int(match.group(1)) - 1
+
+    year, month, last_day = first_year, first_month, 0
+    pending = None
+    for block in iter_xml_blocks(filename):
+        match = XML_DAY_RE.match(block)
+        if not match:
+            continue
+        day = int(match.group(1))
+        month_name = XML_MONTH_RE.search(block)
+        if month_name:
+            month = MONTH_NUMBERS[month_name.group(1).lower()]
+            if month == 1 and last_day > 20:
+                year += 1
+        elif day < last_day and last_day > 20:
+            month += 1
+            if month > 12:
+                month, year = 1, year + 1
+        last_day = day
+
+        try:
+            ordinal = date(year, month, day).toordinal()
+        except ValueError:
+            ordinal = None
+        entry = _xml_day(block, f"{year}-{month:02d}-{day:02d}", ordinal)
+        if entry is None:
+            continue
+        if pending is not None and pending.date != entry.date:
+            yield pending
+        pending = entry
+    if pending is not None:
+        yield pending
+
+
+def find_ordo_sources(source_dir=SOURCE_DIR):
+    """[(year, path)] for every <year>.csv in source_dir, in year order"""
+    sources = []
+    for filename in os.listdir(source_dir):
+        match = ORDO_FILE_RE.match(filename)
+        if match:
+            sources.append((int(match.group(1)), os.path.join(source_dir, filename)))
+    return sorted(sources)
+
+
+def find_ordo_xml_sources(source_dir=SOURCE_DIR):
+    """[(liturgical year, path)] for every Ordo XML export in source_dir, in year order"""
+    sources = []
+    for filename in os.listdir(source_dir):
+        match = ORDO_XML_RE.match(filename)
+        if match:
+            sources.append((int(match.group(1)), os.path.join(source_dir, filename)))
+    return sorted(sources)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Parse raw Ordo source files into the shared cached form')
+    parser.add_argument('years', nargs='*', type=int, help='Years to parse (default: every source file)')
+    parser.add_argument('--source-dir', default=SOURCE_DIR, help=f'Directory of <year>.csv files (default {SOURCE_DIR})')
+    parser.add_argument('--show', type=int, default=0, metavar='N', help='Print the first N days of each year')
+    args = parser.parse_args()
+
+    for year, path in find_ordo_sources(args.source_dir):
+        if args.years and year not in args.years:
+            continue
+        days = load_ordo_source(path, year)
+        extra = sum(len(day.celebrations) - 1 for day in days)
+        print(f"{path}: {len(days)} days, {extra} secondary celebrations")
+        for day in days[:args.show]:
+            week = f" Week {day.week}" if day.week else ""
+            print(f"  {day.date}: {' | '.join(day.celebrations)} ({day.rank}, {day.season or '-'}{week})")
+
+
+if __name__ == '__main__':
+    main()
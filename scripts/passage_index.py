@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""
+Reverse passage index: which dates read a given passage?
+
+Joins the parsed verse ranges of every Lectionary row (scripture_refs.py) with
+the generated Ordo-to-Lectionary mapping, and answers overlap queries such as
+"John 6" or "Isaiah 42:1-9" through a static centered interval tree, so a
+query costs O(log n + k) regardless of how many years the mapping covers.
+
+Usage:
+  python scripts/passage_index.py "John 6"                        # Every date reading John 6
+  python scripts/passage_index.py "Isaiah 42" --from 2026-01-01 --to 2026-12-31
+  python scripts/passage_index.py "John 6" --next                 # Next date on or after today
+  python scripts/generate_ordo_lectionary_mapping.py --find-passage "John 6"
+"""
+
+import argparse
+import bisect
+import csv
+import datetime
+
+from generate_ordo_lectionary_mapping import OUTPUT_CSV
+from scripture_refs import (READING_FIELDS, ScriptureReferenceError, format_range, load_lectionary_ranges,
+                            parse_reference)
+
+# Lectionary.csv field -> ordo_lectionary_mapping.csv column
+_MAPPING_COLUMNS = {
+    'First Reading': 'first_reading',
+    'Psalm': 'psalm',
+    'Second Reading': 'second_reading',
+    'Gospel Reading': 'gospel',
+}
+
+
+class _Node:
+    __slots__ = ('center', 'by_start', 'by_end', 'left', 'right')
+
+
+class IntervalTree:
+    """Static centered interval tree over inclusive integer intervals.
+
+    Each node keeps the intervals containing its center twice: sorted by start
+    ascending and by end descending, so a query only walks the prefix it reports.
+    """
+
+    def __init__(self, starts, ends):
+        self.starts = starts
+        self.ends = ends
+        self.root = self._build(list(range(len(starts))))
+
+    def _build(self, ids):
+        if not ids:
+            return None
+        points = sorted(p for i in ids for p in (self.starts[i], self.ends[i]))
+        center = points[len(points) // 2]
+
+        here, left, right = [], [], []
+        for i in ids:
+            if self.ends[i] < center:
+                left.append(i)
+            elif self.starts[i] > center:
+                right.append(i)
+            else:
+                here.append(i)
+
+        node = _Node()
+        node.center = center
+        node.by_start = sorted(here, key=lambda i: self.starts[i])
+        node.by_end = sorted(here, key=lambda i: -self.ends[i])
+        node.left = self._build(left)
+        node.right = self._build(right)
+        return node
+
+    def overlapping(self, q_start, q_end):
+        """Return ids of intervals overlapping [q_start, q_end]."""
+        found = []
+        stack = [self.root]
+        while stack:
+            node = stack.pop()
+            if node is None:
+                continue
+            if q_end < node.center:
+                for i in node.by_start:
+                    if self.starts[i] > q_end:
+                        break
+                    found.append(i)
+                stack.append(node.left)
+            elif q_start > node.center:
+                for i in node.by_end:
+                    if self.ends[i] < q_start:
+                        break
+                    found.append(i)
+                stack.append(node.right)
+            else:
+                found.extend(node.by_start)
+                stack.append(node.left)
+                stack.append(node.right)
+        return found
+
+
+class PassageIndex:
+    """Interval index over Lectionary verse ranges joined with mapped dates."""
+
+    def __init__(self, mapping_file=OUTPUT_CSV):
+        self.ranges = load_lectionary_ranges()
+        self.tree = IntervalTree(self.ranges.starts, self.ranges.ends)
+
+        # lectionary_id -> sorted day ordinals it is read on, plus per-date details
+        self.dates_by_lectionary = {}
+        self.mapping = {}
+        with open(mapping_file, 'r', encoding='utf-8') as f:
+            for row in csv.DictReader(f):
+                if not row['lectionary_id']:
+                    continue
+                ordinal = datetime.date.fromisoformat(row['calendar_date']).toordinal()
+                self.dates_by_lectionary.setdefault(int(row['lectionary_id']), []).append(ordinal)
+                self.mapping[ordinal] = row
+        for ordinals in self.dates_by_lectionary.values():
+            ordinals.sort()
+
+    def find(self, reference, start=None, end=None):
+        """Return date-sorted readings overlapping a reference within [start, end].
+
+        reference: text such as "John 6" or "Isaiah 42:1-9"
+        start, end: datetime.date bounds (inclusive), or None for open-ended
+        """
+        lo = start.toordinal() if start else 0
+        hi = end.toordinal() if end else datetime.date.max.toordinal()
+
+        hits = {}
+        for q_start, q_end in parse_reference(reference):
+            for i in self.tree.overlapping(q_start, q_end):
+                lect_id = self.ranges.row_ids[i]
+                ordinals = self.dates_by_lectionary.get(lect_id, ())
+                first = bisect.bisect_left(ordinals, lo)
+                last = bisect.bisect_right(ordinals, hi)
+                for ordinal in ordinals[first:last]:
+                    key = (ordinal, self.ranges.fields[i])
+                    hits.setdefault(key, []).append(format_range(self.ranges.starts[i], self.ranges.ends[i]))
+
+        results = []
+        for (ordinal, field_index), matched in sorted(hits.items()):
+            row = self.mapping[ordinal]
+            field = READING_FIELDS[field_index]
+            results.append({
+                'date': row['calendar_date'],
+                'ordo_name': row['ordo_name'],
+                'lectionary_id': int(row['lectionary_id']),
+                'lectionary_name': row['lectionary_name'],
+                'field': field,
+                'reading': row[_MAPPING_COLUMNS[field]],
+                'matched': matched,
+            })
+        return results
+
+
+def find_passage_dates(reference, start=None, end=None, mapping_file=OUTPUT_CSV):
+    """Library entry point: dates whose readings overlap a passage."""
+    return PassageIndex(mapping_file).find(reference, start, end)
+
+
+def print_passage_dates(reference, start=None, end=None, next_only=False):
+    """Print the dates that read a passage (used by the CLIs)."""
+    if next_only and not start:
+        start = datetime.date.today()
+    results = find_passage_dates(reference, start, end)
+    if next_only and results:
+        results = [r for r in results if r['date'] == results[0]['date']]
+
+    span = f" from {start or '…'} to {end or '…'}" if (start or end) else ''
+    if not results:
+        print(f"\n❌ No dates read {reference}{span}")
+        return results
+
+    print(f"\n📖 {reference}: {len(results)} reading(s){span}")
+    print("-" * 80)
+    for r in results:
+        print(f"  {r['date']}  {r['field']:<14} {r['reading']:<32} {r['ordo_name']}")
+    return results
+
+
+def _parse_date_arg(value):
+    return datetime.date.fromisoformat(value) if value else None
+
+
+def run_passage_query(reference, date_from=None, date_to=None, next_only=False):
+    """print_passage_dates for command-line strings; a bad date or reference exits 1 with a message."""
+    dates = []
+    for value in (date_from, date_to):
+        try:
+            dates.append(_parse_date_arg(value))
+        except ValueError:
+            print(f"\n❌ Invalid date {value!r} (expected YYYY-MM-DD)")
+            raise SystemExit(1)
+    start, end = dates
+    try:
+        return print_passage_dates(reference, start, end, next_only)
+    except ScriptureReferenceError as e:
+        print(f"\n❌ Cannot read passage {reference!r}: {e}")
+        raise SystemExit(1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Find the dates whose readings include a passage')
+    parser.add_argument('reference', help='Passage, e.g. "John 6" or "Isaiah 42:1-9"')
+    parser.add_argument('--from', dest='date_from', help='Earliest date (YYYY-MM-DD)')
+    parser.add_argument('--to', dest='date_to', help='Latest date (YYYY-MM-DD)')
+    parser.add_argument('--next', action='store_true', help='Only the next date on or after --from (default today)')
+    args = parser.parse_args()
+
+    run_passage_query(args.reference, args.date_from, args.date_to, args.next)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+"""
+Local readings lookup service backed by the generated mapping.
+
+Loads ordo_normalized.csv, ordo_lectionary_mapping.csv and Lectionary.csv into
+memory once and answers the same questions as /api/v1/readings without
+touching Postgres:
+
+  GET /readings?date=2025-12-25
+  GET /readings?from=2025-12-01&to=2025-12-31
+
+Responses are rendered once per distinct query and kept in an LRU cache, and
+every response carries an ETag so clients can revalidate with If-None-Match.
+
+Usage:
+  python scripts/readings_server.py                        # Serve on 127.0.0.1:8787
+  python scripts/readings_server.py --port 9000 --cache-size 4096
+  python scripts/generate_ordo_lectionary_mapping.py --serve
+  python scripts/loadtest_readings_server.py               # Measure latency
+"""
+
+import argparse
+import bisect
+import csv
+import datetime
+import functools
+import hashlib
+import json
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit, parse_qs
+
+from generate_ordo_lectionary_mapping import (
+    LECTIONARY_CSV, ORDO_CSV, OUTPUT_CSV, get_year_letter, load_lectionary, load_ordo
+)
+from key_dates import key_dates
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8787
+DEFAULT_CACHE_SIZE = 2048
+
+# Longest from/to range answered in one request (one liturgical year plus slack)
+MAX_RANGE_DAYS = 400
+
+CORS_HEADERS = {
+    'Access-Control-Allow-Origin': '*',
+    'Access-Control-Allow-Methods': 'GET, OPTIONS',
+}
+
+
+def sunday_cycle(date):
+    """Sunday cycle (A/B/C) of the liturgical year containing an ISO date; it starts on Advent 1."""
+    day = datetime.datetime.fromisoformat(date)
+    first_advent = key_dates(day.year)['first_advent']
+    return get_year_letter(day.year + 1 if day >= first_advent else day.year)
+
+
+def build_reading_record(date, ordo_entry, lect_entry):
+    """Build the public readings record for one date.
+
+    Mirrors the shape returned by /api/v1/readings so the two can be diffed.
+    """
+    week = ordo_entry.get('week') if ordo_entry else None
+    lect_entry = lect_entry or {}
+    return {
+        'date': date,
+        'liturgical_day': ordo_entry.get('name') if ordo_entry else None,
+        'liturgical_rank': ordo_entry.get('rank') if ordo_entry else None,
+        'liturgical_season': (ordo_entry.get('season') or None) if ordo_entry else None,
+        'liturgical_week': int(week) if week else None,
+        'year_cycle': sunday_cycle(date),
+        'lectionary_id': int(lect_entry['Admin Order']) if lect_entry.get('Admin Order') else None,
+        'readings': {
+            'first_reading': lect_entry.get('First Reading') or None,
+            'psalm': lect_entry.get('Psalm') or None,
+            'second_reading': lect_entry.get('Second Reading') or None,
+            'gospel': lect_entry.get('Gospel Reading') or None,
+        },
+    }
+
+
+class ReadingsIndex:
+    """In-memory date -> readings index built from the generated CSVs."""
+
+    def __init__(self, records):
+        self.records = records
+        self.dates = sorted(records)
+
+    @classmethod
+    def load(cls, mapping_file=OUTPUT_CSV):
+        """Join mapping, Ordo and Lectionary once, like the database view does."""
+        ordo = load_ordo()
+        lectionary = {row['Admin Order']: row for row in load_lectionary()}
+
+        records = {}
+        with open(mapping_file, 'r', encoding='utf-8') as f:
+            for row in csv.DictReader(f):
+                date = row['calendar_date']
+                lect_entry = lectionary.get(row['lectionary_id'])
+                if not lect_entry:
+                    continue
+                records[date] = build_reading_record(date, ordo.get(date), lect_entry)
+        return cls(records)
+
+    def get(self, date):
+        return self.records.get(date)
+
+    def between(self, start, end):
+        """Return records for start <= date <= end (ISO strings sort by date)."""
+        lo = bisect.bisect_left(self.dates, start)
+        hi = bisect.bisect_right(self.dates, end)
+        return [self.records[d] for d in self.dates[lo:hi]]
+
+
+def _parse_date(value):
+    try:
+        return datetime.date.fromisoformat(value)
+    except (TypeError, ValueError):
+        return None
+
+
+class ReadingsService:
+    """Renders responses for readings queries, caching the encoded bodies."""
+
+    def __init__(self, index, cache_size=DEFAULT_CACHE_SIZE):
+        self.index = index
+        self.render = functools.lru_cache(maxsize=cache_size)(self._render)
+
+    def _render(self, date=None, start=None, end=None):
+        """Return (status, body_bytes, etag) for a normalized query."""
+        if date is not None:
+            record = self.index.get(date)
+            if record:
+                payload = {'success': True, **record, 'region': 'Australia'}
+                status = 200
+            else:
+                payload = {'success': False, 'error': 'No readings found for this date', 'date': date}
+                status = 404
+        else:
+            days = self.index.between(start, end)
+            payload = {'success': True, 'from': start, 'to': end, 'count': len(days),
+                       'days': days, 'region': 'Australia'}
+            status = 200
+
+        body = json.dumps(payload, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        etag = '"' + hashlib.sha1(body).hexdigest() + '"'
+        return status, body, etag
+
+    def handle_query(self, query):
+        """Validate a parsed query string and return (status, body, etag)."""
+        if 'date' in query:
+            date = _parse_date(query['date'][0])
+            if not date:
+                return self._error(400, 'Invalid date format. Use YYYY-MM-DD (e.g., 2025-12-25)')
+            return self.render(date=date.isoformat())
+
+        if 'from' in query or 'to' in query:
+            start = _parse_date(query.get('from', [None])[0])
+            end = _parse_date(query.get('to', [None])[0])
+            if not start or not end:
+                return self._error(400, 'Both from and to are required as YYYY-MM-DD')
+            if end < start:
+                return self._error(400, 'to must not be before from')
+            if (end - start).days >= MAX_RANGE_DAYS:
+                return self._error(400, f'Range too large (max {MAX_RANGE_DAYS} days)')
+            return self.render(start=start.isoformat(), end=end.isoformat())
+
+        return self._error(400, 'Pass ?date=YYYY-MM-DD or ?from=YYYY-MM-DD&to=YYYY-MM-DD')
+
+    @staticmethod
+    def _error(status, message):
+        body = json.dumps({'success': False, 'error': message}).encode('utf-8')
+        return status, body, None
+
+
+def make_handler(service):
+    """Create a request handler class bound to a ReadingsService."""
+
+    class ReadingsHandler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'  # keep-alive, so load tests measure lookups not handshakes
+        disable_nagle_algorithm = True  # headers and body go out in separate writes
+
+        def do_GET(self):
+            url = urlsplit(self.path)
+            if url.path.rstrip('/') != '/readings':
+                self._send(404, json.dumps({'success': False, 'error': 'Not found'}).encode('utf-8'))
+                return
+
+            status, body, etag = service.handle_query(parse_qs(url.query))
+            if etag and self.headers.get('If-None-Match') == etag:
+                self._send(304, b'', etag)
+            else:
+                self._send(status, body, etag)
+
+        def do_OPTIONS(self):
+            self._send(204, b'', extra={'Access-Control-Allow-Headers': 'Content-Type, If-None-Match'})
+
+        def _send(self, status, body, etag=None, extra=None):
+            self.send_response(status)
+            headers = dict(CORS_HEADERS)
+            if body:
+                headers['Content-Type'] = 'application/json; charset=utf-8'
+            if etag:
+                headers['ETag'] = etag
+                headers['Cache-Control'] = 'public, max-age=3600'
+            headers.update(extra or {})
+            for key, value in headers.items():
+                self.send_header(key, value)
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            if body:
+                self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass  # Per-request logging dominates latency at these speeds
+
+    return ReadingsHandler
+
+
+def serve(host=DEFAULT_HOST, port=DEFAULT_PORT, cache_size=DEFAULT_CACHE_SIZE, mapping_file=OUTPUT_CSV):
+    """Load the readings index and serve it until interrupted."""
+    print(f"Loading readings from {mapping_file}, {ORDO_CSV} and {LECTIONARY_CSV}...")
+    start = time.perf_counter()
+    index = ReadingsIndex.load(mapping_file)
+    print(f"  Indexed {len(index.dates)} dates in {(time.perf_counter() - start) * 1000:.0f}ms")
+
+    service = ReadingsService(index, cache_size=cache_size)
+    server = ThreadingHTTPServer((host, port), make_handler(service))
+    print(f"\n📖 Serving readings on http://{host}:{port}/readings?date=YYYY-MM-DD")
+    print("   Press Ctrl+C to stop")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        info = service.render.cache_info()
+        print(f"\nStopped. Cache hits: {info.hits}, misses: {info.misses}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Serve daily readings from the generated mapping')
+    parser.add_argument('--host', default=DEFAULT_HOST, help=f'Bind address (default {DEFAULT_HOST})')
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT, help=f'Port (default {DEFAULT_PORT})')
+    parser.add_argument('--cache-size', type=int, default=DEFAULT_CACHE_SIZE,
+                        help=f'Responses kept in the LRU cache (default {DEFAULT_CACHE_SIZE})')
+    parser.add_argument('--mapping', default=OUTPUT_CSV, help='Mapping CSV to serve')
+    args = parser.parse_args()
+
+    serve(args.host, args.port, args.cache_size, args.mapping)
+
+
+if __name__ == '__main__':
+    main()
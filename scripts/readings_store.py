@@ -0,0 +1,253 @@
+#!/usr/bin/env python3
+"""
+Compact binary readings store with O(1) date lookup via mmap.
+
+Built once from ordo_lectionary_mapping.csv so batch jobs (DGR emails, schedule
+syncing) can resolve thousands of dates without parsing CSV.
+
+File layout (little-endian):
+
+  header    magic 'RDGS', version, base day ordinal, counts and section offsets
+  days      int32[day_count]       day ordinal - base -> lectionary record index (-1 = none)
+  names     int32[day_count]       day ordinal - base -> Ordo name string id (-1 = none)
+  records   int32[record_count][6] lectionary_id, lectionary name, first reading,
+                                   psalm, second reading, gospel (string ids, -1 = empty)
+  strings   uint32[string_count+1] offsets into the blob, then the UTF-8 blob
+
+Every string (reading references repeat heavily) is stored once.
+
+Usage:
+  python scripts/readings_store.py --build                        # Write data/generated/readings.bin
+  python scripts/readings_store.py --lookup 2025-12-25 2026-04-05
+  python scripts/readings_store.py --bench                        # Time lookups for every date
+"""
+
+import argparse
+import csv
+import datetime
+import mmap
+import os
+import struct
+import sys
+import time
+
+from file_cache import write_atomic
+from generate_ordo_lectionary_mapping import OUTPUT_CSV
+
+STORE_FILE = 'data/generated/readings.bin'
+
+MAGIC = b'RDGS'
+VERSION = 1
+# magic, version, base_ordinal, day_count, record_count, string_count,
+# days_offset, names_offset, records_offset, strings_offset, blob_offset
+HEADER = struct.Struct('<4sIiIIIIIIII')
+RECORD_FIELDS = 6
+READING_FIELDS = ('first_reading', 'psalm', 'second_reading', 'gospel')
+
+
+class _StringTable:
+    """Interns strings to ids in first-seen order."""
+
+    def __init__(self):
+        self.ids = {}
+        self.strings = []
+
+    def add(self, value):
+        if not value:
+            return -1
+        sid = self.ids.get(value)
+        if sid is None:
+            sid = self.ids[value] = len(self.strings)
+            self.strings.append(value)
+        return sid
+
+
+def build_store(mapping_file=OUTPUT_CSV, output_file=STORE_FILE):
+    """Compile the mapping CSV into the binary store. Returns the output path."""
+    with open(mapping_file, 'r', encoding='utf-8') as f:
+        rows = [row for row in csv.DictReader(f)]
+    if not rows:
+        raise ValueError(f"{mapping_file} has no rows")
+
+    ordinals = [datetime.date.fromisoformat(r['calendar_date']).toordinal() for r in rows]
+    base = min(ordinals)
+    day_count = max(ordinals) - base + 1
+
+    strings = _StringTable()
+    record_index = {}
+    records = []
+    days = [-1] * day_count
+    names = [-1] * day_count
+
+    for ordinal, row in zip(ordinals, rows):
+        slot = ordinal - base
+        names[slot] = strings.add(row['ordo_name'])
+        if not row['lectionary_id']:
+            continue
+        lect_id = int(row['lectionary_id'])
+        if lect_id not in record_index:
+            record_index[lect_id] = len(records)
+            records.append([lect_id, strings.add(row['lectionary_name'])] +
+                           [strings.add(row[field]) for field in READING_FIELDS])
+        days[slot] = record_index[lect_id]
+
+    blob = bytearray()
+    offsets = [0]
+    for value in strings.strings:
+        blob += value.encode('utf-8')
+        offsets.append(len(blob))
+
+    days_offset = HEADER.size
+    names_offset = days_offset + 4 * day_count
+    records_offset = names_offset + 4 * day_count
+    strings_offset = records_offset + 4 * RECORD_FIELDS * len(records)
+    blob_offset = strings_offset + 4 * len(offsets)
+
+    header = HEADER.pack(MAGIC, VERSION, base, day_count, len(records), len(strings.strings),
+                         days_offset, names_offset, records_offset, strings_offset, blob_offset)
+
+    write_atomic(output_file, (
+        header,
+        struct.pack(f'<{day_count}i', *days),
+        struct.pack(f'<{day_count}i', *names),
+        struct.pack(f'<{RECORD_FIELDS * len(records)}i', *(v for rec in records for v in rec)),
+        struct.pack(f'<{len(offsets)}I', *offsets),
+        blob,
+    ), binary=True)
+
+    print(f"✅ Readings store saved to: {output_file} ({os.path.getsize(output_file):,} bytes)")
+    print(f"   {day_count} days, {len(records)} lectionary records, {len(strings.strings)} unique strings")
+    return output_file
+
+
+class ReadingsStore:
+    """Read-only mmap view of a readings store built by build_store()."""
+
+    def __init__(self, path=STORE_FILE):
+        if sys.byteorder != 'little':
+            raise ValueError("ReadingsStore reads the little-endian layout natively")
+        self._file = open(path, 'rb')
+        self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        mv = memoryview(self._mm)
+
+        (magic, version, self.base_ordinal, self.day_count, record_count, string_count,
+         days_off, names_off, records_off, strings_off, blob_off) = HEADER.unpack_from(mv)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not a version {VERSION} readings store")
+
+        # Zero-copy typed views over the mapped file
+        self._days = mv[days_off:days_off + 4 * self.day_count].cast('i')
+        self._names = mv[names_off:names_off + 4 * self.day_count].cast('i')
+        self._records = mv[records_off:records_off + 4 * RECORD_FIELDS * record_count].cast('i')
+        self._offsets = mv[strings_off:strings_off + 4 * (string_count + 1)].cast('I')
+        self._blob = mv[blob_off:]
+        self._views = [self._days, self._names, self._records, self._offsets, self._blob, mv]
+
+    def close(self):
+        for view in self._views:
+            view.release()
+        self._mm.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def string(self, sid):
+        if sid < 0:
+            return ''
+        return str(self._blob[self._offsets[sid]:self._offsets[sid + 1]], 'utf-8')
+
+    def lookup(self, date):
+        """Return the readings dict for a date (date or 'YYYY-MM-DD'), or None."""
+        if isinstance(date, str):
+            date = datetime.date.fromisoformat(date)
+        slot = date.toordinal() - self.base_ordinal
+        if not 0 <= slot < self.day_count:
+            return None
+        record = self._days[slot]
+        if record < 0:
+            return None
+        base = record * RECORD_FIELDS
+        fields = self._records[base:base + RECORD_FIELDS]
+        result = {
+            'calendar_date': date.isoformat(),
+            'ordo_name': self.string(self._names[slot]),
+            'lectionary_id': fields[0],
+            'lectionary_name': self.string(fields[1]),
+        }
+        for name, sid in zip(READING_FIELDS, fields[2:]):
+            result[name] = self.string(sid)
+        return result
+
+    def lookup_many(self, dates):
+        return {d if isinstance(d, str) else d.isoformat(): self.lookup(d) for d in dates}
+
+    def dates(self):
+        """Yield every date in the store that has readings."""
+        for slot in range(self.day_count):
+            if self._days[slot] >= 0:
+                yield datetime.date.fromordinal(self.base_ordinal + slot)
+
+
+def bench(path=STORE_FILE, rounds=20):
+    """Time opening the store and resolving every date it covers."""
+    start = time.perf_counter()
+    store = ReadingsStore(path)
+    open_ms = (time.perf_counter() - start) * 1000
+
+    dates = list(store.dates())
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for d in dates:
+            store.lookup(d)
+    per_lookup_us = (time.perf_counter() - start) / (rounds * len(dates)) * 1e6
+    store.close()
+
+    print(f"Opened {path} in {open_ms:.2f}ms")
+    print(f"Resolved {len(dates)} dates x {rounds}: {per_lookup_us:.2f}µs per lookup")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Build or query the binary readings store')
+    parser.add_argument('--build', action='store_true', help='Compile the mapping CSV into the store')
+    parser.add_argument('--mapping', default=OUTPUT_CSV, help='Mapping CSV to compile (for --build)')
+    parser.add_argument('--store', default=STORE_FILE, help=f'Store path (default {STORE_FILE})')
+    parser.add_argument('--lookup', nargs='+', metavar='DATE', help='Print readings for dates (YYYY-MM-DD)')
+    parser.add_argument('--bench', action='store_true', help='Time lookups over every stored date')
+    args = parser.parse_args()
+
+    if args.build:
+        build_store(args.mapping, args.store)
+
+    not_found = 0
+    if args.lookup:
+        with ReadingsStore(args.store) as store:
+            for date in args.lookup:
+                try:
+                    result = store.lookup(date)
+                except ValueError:  # Malformed or impossible date ("2026-02-30")
+                    result = None
+                if not result:
+                    print(f"❌ {date}: no readings")
+                    not_found += 1
+                    continue
+                print(f"\n{date}: {result['ordo_name']}")
+                print(f"  → {result['lectionary_name']} (#{result['lectionary_id']})")
+                for field in READING_FIELDS:
+                    print(f"    {field}: {result[field] or 'N/A'}")
+
+    if args.bench:
+        bench(args.store)
+
+    if not (args.build or args.lookup or args.bench):
+        parser.print_help()
+
+    if not_found:
+        raise SystemExit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,336 @@
+#!/usr/bin/env python3
+"""
+Parse Lectionary scripture references into packed integer verse ranges.
+
+"Isaiah 42:1-4, 6-7" becomes two ranges, each an inclusive (start, end) pair of
+packed verse numbers:
+
+    packed = book_id * 1_000_000 + chapter * 1_000 + verse
+
+so ranges within and across chapters compare as plain integers. Whole chapters
+("Psalm 130") span verses 1..999. Book ids follow the Catholic canon order in
+BOOKS (Genesis = 1 ... Revelation = 73).
+
+All First Reading / Psalm / Second Reading / Gospel fields of Lectionary.csv are
+parsed once into parallel arrays and cached in data/generated/, keyed by the
+CSV's hash, so later runs only unpickle the arrays.
+
+Usage:
+  python scripts/scripture_refs.py --parse "Isaiah 8:23 – 9:3"
+  python scripts/scripture_refs.py --build          # Parse Lectionary.csv and write the cache
+  python scripts/scripture_refs.py --failures       # References that could not be parsed
+  python scripts/scripture_refs.py --bench          # Time parsing vs cache load vs queries
+"""
+
+import argparse
+import csv
+import json
+import os
+import re
+import time
+from array import array
+
+from file_cache import file_hash, load_pickle, save_pickle
+
+LECTIONARY_CSV = 'data/source/Lectionary.csv'
+BOOK_ALIASES_JSON = 'src/lib/data/bible-books.json'
+CACHE_FILE = 'data/generated/scripture_ranges.pickle'
+
+# Bump when parsing rules change so cached artifacts are rebuilt
+PARSER_VERSION = 1
+
+READING_FIELDS = ('First Reading', 'Psalm', 'Second Reading', 'Gospel Reading')
+
+BOOK_FACTOR = 1_000_000
+CHAPTER_FACTOR = 1_000
+VERSE_MAX = 999
+
+BOOKS = (
+    'Genesis', 'Exodus', 'Leviticus', 'Numbers', 'Deuteronomy', 'Joshua', 'Judges', 'Ruth',
+    '1 Samuel', '2 Samuel', '1 Kings', '2 Kings', '1 Chronicles', '2 Chronicles', 'Ezra',
+    'Nehemiah', 'Tobit', 'Judith', 'Esther', '1 Maccabees', '2 Maccabees', 'Job', 'Psalm',
+    'Proverbs', 'Ecclesiastes', 'Song of Songs', 'Wisdom', 'Sirach', 'Isaiah', 'Jeremiah',
+    'Lamentations', 'Baruch', 'Ezekiel', 'Daniel', 'Hosea', 'Joel', 'Amos', 'Obadiah', 'Jonah',
+    'Micah', 'Nahum', 'Habakkuk', 'Zephaniah', 'Haggai', 'Zechariah', 'Malachi',
+    'Matthew', 'Mark', 'Luke', 'John', 'Acts', 'Romans', '1 Corinthians', '2 Corinthians',
+    'Galatians', 'Ephesians', 'Philippians', 'Colossians', '1 Thessalonians', '2 Thessalonians',
+    '1 Timothy', '2 Timothy', 'Titus', 'Philemon', 'Hebrews', 'James', '1 Peter', '2 Peter',
+    '1 John', '2 John', '3 John', 'Jude', 'Revelation',
+)
+BOOK_IDS = {name: i for i, name in enumerate(BOOKS, start=1)}
+
+# Books with one chapter: "Philemon 9-10" means chapter 1, verses 9-10
+SINGLE_CHAPTER_BOOKS = {BOOK_IDS[b] for b in ('Obadiah', 'Philemon', '2 John', '3 John', 'Jude')}
+
+# Names used by bible-books.json that differ from BOOKS
+_ALIAS_TARGETS = {'Song of Solomon': 'Song of Songs', 'Ecclesiasticus': 'Sirach', 'Psalms': 'Psalm'}
+
+_BOOK_RE = re.compile(r'^\s*((?:[1-4]\s*)?[A-Za-z][A-Za-z .]*?)\.?\s*(?=\d)')
+_DASHES_RE = re.compile(r'\s*[–—‑-]\s*')
+_CHAPTER_WITHOUT_COLON_RE = re.compile(r'^(\d+[A-Za-z]?) +(\d)')
+_PART_RE = re.compile(
+    r'^(?:(\d+)[A-Za-z]?:)?(\d+)[a-e]?'         # [chapter:]verse  (or chapter alone)
+    r'(?:-(?:(\d+)[A-Za-z]?:)?(\d+)[a-e]?)?$'   # -[chapter:]verse
+)
+
+
+class ScriptureReferenceError(ValueError):
+    """Raised when a scripture reference cannot be parsed."""
+
+
+def _alias_key(name):
+    return re.sub(r'[^a-z0-9]', '', name.lower())
+
+
+def _load_book_aliases():
+    aliases = {_alias_key(name): book_id for name, book_id in BOOK_IDS.items()}
+    aliases[_alias_key('Psalms')] = BOOK_IDS['Psalm']
+    if os.path.exists(BOOK_ALIASES_JSON):
+        with open(BOOK_ALIASES_JSON, 'r', encoding='utf-8') as f:
+            for alias, name in json.load(f).items():
+                book_id = BOOK_IDS.get(_ALIAS_TARGETS.get(name, name))
+                if book_id:
+                    aliases.setdefault(_alias_key(alias), book_id)
+    return aliases
+
+
+BOOK_ALIASES = _load_book_aliases()
+
+
+def pack_verse(book_id, chapter, verse):
+    return book_id * BOOK_FACTOR + chapter * CHAPTER_FACTOR + verse
+
+
+def unpack_verse(packed):
+    """Return (book_id, chapter, verse) for a packed verse number."""
+    book_id, rest = divmod(packed, BOOK_FACTOR)
+    chapter, verse = divmod(rest, CHAPTER_FACTOR)
+    return book_id, chapter, verse
+
+
+def format_range(start, end):
+    """Render a packed range back to a readable reference."""
+    book, c1, v1 = unpack_verse(start)
+    _, c2, v2 = unpack_verse(end)
+    name = BOOKS[book - 1]
+    if v1 == 1 and v2 == VERSE_MAX:
+        return f"{name} {c1}" if c1 == c2 else f"{name} {c1}-{c2}"
+    if c1 == c2:
+        return f"{name} {c1}:{v1}" if v1 == v2 else f"{name} {c1}:{v1}-{v2}"
+    return f"{name} {c1}:{v1}-{c2}:{v2}"
+
+
+def resolve_book(name):
+    book_id = BOOK_ALIASES.get(_alias_key(name))
+    if not book_id:
+        raise ScriptureReferenceError(f"unknown book '{name.strip()}'")
+    return book_id
+
+
+def _parse_book_passage(book_id, passage, ranges):
+    """Parse "42:1-4,6-7" style text for one book, appending packed ranges."""
+    passage = re.sub(r'\([^)]*\)', '', passage)           # "Psalm 86 (87)": drop alternate numbering
+    passage = _DASHES_RE.sub('-', passage.strip())
+    passage = _CHAPTER_WITHOUT_COLON_RE.sub(r'\1:\2', passage)  # "Psalm 89 2-4"
+    passage = re.sub(r'\s+', '', passage)
+
+    chapter = None
+    for part in re.split(r'[,.]', passage):
+        if not part:
+            continue
+        match = _PART_RE.match(part)
+        if not match:
+            raise ScriptureReferenceError(f"cannot parse '{part}'")
+        start_chapter, start_verse, end_chapter, end_verse = match.groups()
+
+        if start_chapter:
+            chapter = int(start_chapter)
+        elif chapter is None:
+            if book_id in SINGLE_CHAPTER_BOOKS:
+                chapter = 1
+            else:
+                # Whole chapter(s) with no verses: "Psalm 130"
+                first = int(start_verse)
+                last = int(end_verse) if end_verse and not end_chapter else first
+                if last < first:
+                    raise ScriptureReferenceError(f"chapter range '{part}' ends before it starts")
+                ranges.append((pack_verse(book_id, first, 1), pack_verse(book_id, last, VERSE_MAX)))
+                chapter = last
+                continue
+
+        if end_verse and not end_chapter and len(end_verse) < len(start_verse) and int(end_verse) < int(start_verse):
+            # Abbreviated end verse: "171-2" means 171-172
+            end_verse = start_verse[:len(start_verse) - len(end_verse)] + end_verse
+
+        start = pack_verse(book_id, chapter, int(start_verse))
+        if end_chapter:
+            chapter = int(end_chapter)
+        end = pack_verse(book_id, chapter, int(end_verse)) if end_verse else start
+        if end < start:
+            raise ScriptureReferenceError(f"range '{part}' ends before it starts")
+        ranges.append((start, end))
+
+
+def parse_reference(text):
+    """Parse a reference into a list of packed (start, end) verse ranges.
+
+    Handles the Lectionary's formats: "Isaiah 42:1-4, 6-7", "Zephaniah 2:3; 3:12-13",
+    "Isaiah 8:23 – 9:3", "1 Samuel 2:1.4-8", "Psalm 130", "Philemon 9-10".
+    Raises ScriptureReferenceError for text it cannot interpret.
+    """
+    if not text or not text.strip():
+        return []
+    ranges = []
+    book_id = None
+    for segment in text.strip().rstrip(',;.').split(';'):
+        match = _BOOK_RE.match(segment)
+        if match and re.search(r'[A-Za-z]{2}', match.group(1)):
+            book_id = resolve_book(match.group(1))
+            segment = segment[match.end():]
+        elif book_id is None:
+            raise ScriptureReferenceError(f"no book name in '{text}'")
+        _parse_book_passage(book_id, segment, ranges)
+    return ranges
+
+
+class LectionaryRanges:
+    """Parsed verse ranges for every reading of every Lectionary row.
+
+    Parallel arrays, one slot per range, grouped by row in file order:
+      row_ids[i]  Admin Order of the Lectionary row
+      fields[i]   index into READING_FIELDS
+      starts[i], ends[i]  packed inclusive verse range
+    """
+
+    def __init__(self, row_ids, fields, starts, ends, failures, source_hash):
+        self.row_ids = row_ids
+        self.fields = fields
+        self.starts = starts
+        self.ends = ends
+        self.failures = failures
+        self.source_hash = source_hash
+        self._row_slices = None
+
+    def __len__(self):
+        return len(self.starts)
+
+    def ranges_for(self, admin_order, field=None):
+        """Return [(start, end)] for a Lectionary row, optionally one field only."""
+        if self._row_slices is None:
+            self._row_slices = {}
+            for i, row_id in enumerate(self.row_ids):
+                lo, _ = self._row_slices.get(row_id, (i, i))
+                self._row_slices[row_id] = (lo, i + 1)
+        lo, hi = self._row_slices.get(int(admin_order), (0, 0))
+        field_index = READING_FIELDS.index(field) if field else None
+        return [(self.starts[i], self.ends[i]) for i in range(lo, hi)
+                if field_index is None or self.fields[i] == field_index]
+
+    def to_state(self):
+        # Plain arrays/lists only, so the cache loads regardless of which script pickled it
+        return {'row_ids': self.row_ids, 'fields': self.fields, 'starts': self.starts,
+                'ends': self.ends, 'failures': self.failures, 'source_hash': self.source_hash}
+
+
+def parse_lectionary(lectionary_file=LECTIONARY_CSV):
+    """Parse every reading field of Lectionary.csv into a LectionaryRanges."""
+    row_ids, fields = array('i'), array('b')
+    starts, ends = array('i'), array('i')
+    failures = []
+
+    with open(lectionary_file, 'r', encoding='utf-8-sig') as f:
+        for row in csv.DictReader(f):
+            admin_order = int(row['Admin Order'])
+            for field_index, field in enumerate(READING_FIELDS):
+                text = row.get(field, '')
+                try:
+                    ranges = parse_reference(text)
+                except ScriptureReferenceError as e:
+                    failures.append((admin_order, field, text, str(e)))
+                    continue
+                for start, end in ranges:
+                    row_ids.append(admin_order)
+                    fields.append(field_index)
+                    starts.append(start)
+                    ends.append(end)
+
+    return LectionaryRanges(row_ids, fields, starts, ends, failures, file_hash(lectionary_file))
+
+
+def load_lectionary_ranges(lectionary_file=LECTIONARY_CSV, cache_file=CACHE_FILE, rebuild=False):
+    """Return cached LectionaryRanges, reparsing only when the CSV or parser changed."""
+    source_hash = file_hash(lectionary_file)
+    cached = None if rebuild else load_pickle(cache_file, PARSER_VERSION, source_hash)
+    if cached is not None:
+        return LectionaryRanges(**cached)
+
+    ranges = parse_lectionary(lectionary_file)
+    save_pickle(cache_file, PARSER_VERSION, source_hash, ranges.to_state())
+    return ranges
+
+
+def bench(rounds=5):
+    """Compare parsing, cache loading and an integer overlap scan."""
+    start = time.perf_counter()
+    for _ in range(rounds):
+        ranges = parse_lectionary()
+    parse_ms = (time.perf_counter() - start) / rounds * 1000
+
+    load_lectionary_ranges(rebuild=True)
+    start = time.perf_counter()
+    for _ in range(rounds):
+        load_lectionary_ranges()
+    load_ms = (time.perf_counter() - start) / rounds * 1000
+
+    (q_start, q_end), = parse_reference('John 6')
+    start = time.perf_counter()
+    for _ in range(rounds * 20):
+        hits = [i for i in range(len(ranges)) if ranges.starts[i] <= q_end and ranges.ends[i] >= q_start]
+    scan_us = (time.perf_counter() - start) / (rounds * 20) * 1e6
+
+    rows = len(set(ranges.row_ids))
+    print(f"Parsed {len(ranges)} ranges from {rows} Lectionary rows ({len(ranges.failures)} unparseable fields)")
+    print(f"  Full parse:   {parse_ms:8.2f}ms")
+    print(f"  Cache load:   {load_ms:8.2f}ms")
+    print(f"  Overlap scan: {scan_us:8.1f}µs over all ranges ('John 6': {len(hits)} ranges)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Parse Lectionary scripture references into verse ranges')
+    parser.add_argument('--parse', nargs='+', metavar='REF', help='Parse references and print their ranges')
+    parser.add_argument('--build', action='store_true', help=f'Parse Lectionary.csv and write {CACHE_FILE}')
+    parser.add_argument('--failures', action='store_true', help='List references that could not be parsed')
+    parser.add_argument('--bench', action='store_true', help='Benchmark parsing, cache load and queries')
+    args = parser.parse_args()
+
+    if args.parse:
+        for text in args.parse:
+            try:
+                ranges = parse_reference(text)
+            except ScriptureReferenceError as e:
+                print(f"❌ {text}: {e}")
+                continue
+            print(f"{text}")
+            for start, end in ranges:
+                print(f"  {start:>9} – {end:<9} {format_range(start, end)}")
+
+    if args.build:
+        ranges = load_lectionary_ranges(rebuild=True)
+        print(f"✅ {len(ranges)} verse ranges saved to: {CACHE_FILE}")
+
+    if args.failures:
+        ranges = load_lectionary_ranges()
+        print(f"\n❌ UNPARSEABLE REFERENCES ({len(ranges.failures)}):")
+        print("-" * 60)
+        for admin_order, field, text, error in ranges.failures:
+            print(f"  #{admin_order} {field}: '{text}' ({error})")
+
+    if args.bench:
+        bench()
+
+    if not (args.parse or args.build or args.failures or args.bench):
+        parser.print_help()
+
+
+if __name__ == '__main__':
+    main()
@@ -1,82 +1,31 @@
 #!/usr/bin/env python3
 """
 Validate our generated liturgical calendar against the authoritative 2025.csv and 2026.csv files
+(as normalized by normalize_ordo_csvs.py: run that first after editing the Ordo)
+Human-readable summary; validate_calendar.py writes the complete report for CI.
 """
 
 import csv
-import re
 from datetime import datetime
-from difflib import SequenceMatcher
-
-def normalize_name(name):
-    """Normalize liturgical names for comparison"""
-    name = name.upper().strip()
-    # Remove common variations
-    name = re.sub(r'\s+', ' ', name)  # Multiple spaces to single
-    name = re.sub(r'[,.]', '', name)  # Remove commas and periods
-    name = re.sub(r'\bST\b', 'SAINT', name)
-    name = re.sub(r'\bSS\b', 'SAINTS', name)
-    name = re.sub(r'\bTHE\b', '', name)
-    name = re.sub(r'\bOF\b', '', name)
-    name = re.sub(r'\bIN\b', '', name)
-    name = re.sub(r'\bAND\b', '&', name)
-    # Remove extra words
-    name = re.sub(r'\(.*?\)', '', name)  # Remove parentheses content
-    name = re.sub(r'\s+', ' ', name).strip()
-    return name
-
-def similarity_ratio(str1, str2):
-    """Calculate similarity ratio between two strings"""
-    return SequenceMatcher(None, str1, str2).ratio()
-
-def parse_authoritative_csv(filename, year):
-    """Parse authoritative calendar CSV file"""
-    calendar = {}
 
-    with open(filename, 'r', encoding='utf-8') as f:
-        reader = csv.reader(f)
-        next(reader)  # Skip header row
+from normalize_ordo_csvs import OUTPUT_CSV, SECONDARY_CSV, SecondaryCelebrations
+from validate_calendar import FUZZY_THRESHOLD, match_name
 
-        current_date = None
-        current_names = []
+def load_authoritative_calendar(year, ordo_file=OUTPUT_CSV, secondary_file=SECONDARY_CSV):
+    """
+    Authoritative names per date for a year: the primary celebration from
+    ordo_normalized.csv followed by the secondary ones from ordo_secondary.csv
+    (both written by normalize_ordo_csvs.py; the raw Ordo is not re-read).
+    """
+    calendar = {}
+    with open(ordo_file, 'r', encoding='utf-8') as f:
+        for row in csv.DictReader(f):
+            if row['year'] == str(year):
+                calendar[row['calendar_date']] = [row['liturgical_name']]
 
-        for row in reader:
-            if not row or len(row) < 2:
-                continue
-
-            date_str = row[0].strip() if row[0] else ''
-            name_str = row[1].strip() if len(row) > 1 and row[1] else ''
-
-            # Skip empty rows and section headers
-            if not date_str and not name_str:
-                continue
-            if 'YEAR' in name_str.upper() and not date_str:
-                continue
-
-            # If we have a date, save previous date's data and start new date
-            if date_str and not date_str.startswith(','):
-                # Save previous date
-                if current_date and current_names:
-                    calendar[current_date] = current_names
-
-                # Parse new date
-                try:
-                    # Handle "1 January", "2 February", etc.
-                    date_obj = datetime.strptime(f"{date_str} {year}", "%d %B %Y")
-                    current_date = date_obj.strftime('%Y-%m-%d')
-                    current_names = [name_str] if name_str else []
-                except ValueError:
-                    # Not a valid date, might be a continuation
-                    if current_date and name_str:
-                        current_names.append(name_str)
-            else:
-                # Row without date - this is an additional name for current date
-                if current_date and name_str:
-                    current_names.append(name_str)
-
-        # Save last date
-        if current_date and current_names:
-            calendar[current_date] = current_names
+    for date, names in SecondaryCelebrations.load_csv(secondary_file, year).names_by_date().items():
+        if date in calendar:
+            calendar[date].extend(names)
 
     return calendar
 
@@ -114,34 +63,12 @@ def compare_calendars(auth_calendar, our_calendar, year):
 
         our_name = our_calendar[date]
 
-        # Check for exact match with any of the authoritative names
-        exact_match = False
-        best_match = None
-        best_ratio = 0
-
-        for auth_name in auth_names:
-            # Exact match
-            if our_name == auth_name:
-                exact_match = True
-                break
-
-            # Fuzzy match
-            norm_auth = normalize_name(auth_name)
-            norm_our = normalize_name(our_name)
-
-            if norm_auth == norm_our:
-                exact_match = True
-                break
-
-            # Calculate similarity
-            ratio = similarity_ratio(norm_auth, norm_our)
-            if ratio > best_ratio:
-                best_ratio = ratio
-                best_match = auth_name
+        # Exact (or normalized) match with any of the authoritative names, else best similarity
+        exact_match, best_ratio = match_name(auth_names, our_name)
 
         if exact_match:
             results['exact_matches'] += 1
-        elif best_ratio >= 0.6:  # 60% similarity threshold
+        elif best_ratio >= FUZZY_THRESHOLD:  # 60% similarity threshold
             results['fuzzy_matches'] += 1
             results['mismatches'].append({
                 'date': date,
@@ -173,10 +100,10 @@ def main():
 
     # Load authoritative calendars
     print("\nLoading authoritative calendars...")
-    auth_calendar_2025 = parse_authoritative_csv('data/source/2025.csv', 2025)
-    auth_calendar_2026 = parse_authoritative_csv('data/source/2026.csv', 2026)
-    print(f"  2025.csv: {len(auth_calendar_2025)} dates")
-    print(f"  2026.csv: {len(auth_calendar_2026)} dates")
+    auth_calendar_2025 = load_authoritative_calendar(2025)
+    auth_calendar_2026 = load_authoritative_calendar(2026)
+    print(f"  2025: {len(auth_calendar_2025)} dates")
+    print(f"  2026: {len(auth_calendar_2026)} dates")
 
     # Compare 2025
     print("\n" + "=" * 80)
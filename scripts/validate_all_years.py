@@ -1,121 +1,35 @@
 #!/usr/bin/env python3
 """
 Comprehensive validation of generated calendar against authoritative source files
-Compares 2025.csv and 2026.csv against generated liturgical_calendar_full.csv
+Compares every data/source/<year>.csv against generated liturgical_calendar_full.csv
+(human-readable; validate_calendar.py writes the complete report for CI)
+
+The generated calendar is read once into a year-partitioned index; each year's
+comparison runs in a process pool (--workers), and reports print in year order.
+
+Usage:
+  python scripts/validate_all_years.py               # Every authoritative year
+  python scripts/validate_all_years.py 2026          # Selected years
+  python scripts/validate_all_years.py --workers 1   # Serial
 """
+from concurrent.futures import ProcessPoolExecutor
+import argparse
 import csv
-import re
-from datetime import datetime, timedelta
+import os
 from collections import defaultdict
 
-def parse_authoritative_csv(filename, year):
-    """Parse authoritative CSV and extract key information"""
-    entries = {}
-    current_week = None
-    current_season = 'Ordinary Time'
+from ordo_source import SOURCE_DIR, find_ordo_sources
+from validate_calendar import CALENDAR_CSV, parse_authoritative_csv, season_week_error
 
+def load_generated_calendar(filename=CALENDAR_CSV):
+    """Load generated calendar, partitioned by year: {year: {date: entry}}"""
+    entries = defaultdict(dict)
     with open(filename, 'r', encoding='utf-8') as f:
-        reader = csv.reader(f)
-        for row in reader:
-            if len(row) < 2:
-                continue
-
-            date_str = row[0].strip()
-            description = row[1].strip() if len(row) > 1 else ''
-
-            # Skip header rows and empty descriptions
-            if not date_str or not description or 'YEAR' in date_str:
-                continue
-
-            # Parse date (format: "1 January" or just empty if continuation)
-            if date_str:
-                # Extract day and month
-                match = re.match(r'(\d+)\s+(\w+)', date_str)
-                if match:
-                    day = int(match.group(1))
-                    month_name = match.group(2)
-
-                    # Convert month name to number
-                    month_map = {
-                        'January': 1, 'February': 2, 'March': 3, 'April': 4,
-                        'May': 5, 'June': 6, 'July': 7, 'August': 8,
-                        'September': 9, 'October': 10, 'November': 11, 'December': 12
-                    }
-
-                    if month_name in month_map:
-                        month = month_map[month_name]
-                        date_key = f"{year}-{month:02d}-{day:02d}"
-
-                        # Detect week numbers from description
-                        # Format: "2 ORDINARY", "3 LENT", "FIRST SUNDAY OF ADVENT"
-                        week_match = re.match(r'^(\d+)\s+(ORDINARY|LENT|ADVENT|EASTER)', description)
-                        if week_match:
-                            current_week = int(week_match.group(1))
-                            current_season = week_match.group(2).title()
-                            if current_season == 'Ordinary':
-                                current_season = 'Ordinary Time'
-                        elif 'FIRST SUNDAY OF ADVENT' in description.upper():
-                            current_week = 1
-                            current_season = 'Advent'
-                        elif 'PASSION SUNDAY' in description.upper() or 'PALM SUNDAY' in description.upper():
-                            current_season = 'Holy Week'
-                            current_week = None
-                        elif 'EASTER SUNDAY' in description.upper():
-                            current_season = 'Easter'
-                            current_week = 1
-                        elif 'Christmas' in description or 'NATIVITY OF THE LORD' in description.upper():
-                            current_season = 'Christmas'
-                            current_week = None
-
-                        # Extract week from description for weekdays
-                        # Format: "Monday of the first week in Ordinary Time"
-                        weekday_match = re.search(r'of the (\w+) week in Ordinary Time', description, re.IGNORECASE)
-                        if weekday_match:
-                            week_word = weekday_match.group(1)
-                            week_map = {
-                                'first': 1, 'second': 2, 'third': 3, 'fourth': 4, 'fifth': 5,
-                                'sixth': 6, 'seventh': 7, 'eighth': 8, 'ninth': 9, 'tenth': 10,
-                                'eleventh': 11, 'twelfth': 12, 'thirteenth': 13, 'fourteenth': 14,
-                                'fifteenth': 15, 'sixteenth': 16, 'seventeenth': 17, 'eighteenth': 18,
-                                'nineteenth': 19, 'twentieth': 20, 'twenty-first': 21, 'twenty-second': 22,
-                                'twenty-third': 23, 'twenty-fourth': 24, 'twenty-fifth': 25, 'twenty-sixth': 26,
-                                'twenty-seventh': 27, 'twenty-eighth': 28, 'twenty-ninth': 29, 'thirtieth': 30,
-                                'thirty-first': 31, 'thirty-second': 32, 'thirty-third': 33, 'thirty-fourth': 34
-                            }
-                            if week_word in week_map:
-                                current_week = week_map[week_word]
-
-                        # Similar for other seasons
-                        for season_name in ['Lent', 'Advent', 'Easter']:
-                            weekday_match = re.search(rf'of the (\w+(?:-\w+)?) week (?:in|of) {season_name}', description, re.IGNORECASE)
-                            if weekday_match:
-                                week_word = weekday_match.group(1)
-                                week_map = {
-                                    'first': 1, 'second': 2, 'third': 3, 'fourth': 4, 'fifth': 5,
-                                    'sixth': 6, 'seventh': 7
-                                }
-                                if week_word in week_map:
-                                    current_week = week_map[week_word]
-                                    current_season = season_name
-
-                        entries[date_key] = {
-                            'date': date_key,
-                            'season': current_season,
-                            'week': current_week,
-                            'description': description
-                        }
-
-    return entries
-
-def load_generated_calendar():
-    """Load generated calendar"""
-    entries = {}
-    with open('data/generated/liturgical_calendar_full.csv', 'r', encoding='utf-8') as f:
         reader = csv.DictReader(f)
         for row in reader:
             date_key = row['calendar_date']
             week_val = row['liturgical_week']
-            entries[date_key] = {
+            entries[int(date_key[:4])][date_key] = {
                 'date': date_key,
                 'season': row['liturgical_season'],
                 'week': int(week_val) if week_val and week_val != '' else None,
@@ -124,33 +38,13 @@ def load_generated_calendar():
             }
     return entries
 
-def validate_year(year, auth_file):
-    """Validate a specific year"""
-    print(f"\n{'='*80}")
-    print(f"VALIDATING {year}")
-    print(f"{'='*80}\n")
-
-    # Load data
-    print(f"Loading authoritative data from {auth_file}...")
+def check_year(year, auth_file, gen_year_data):
+    """Compare one authoritative year with its generated entries. Returns (auth entry count, mismatches)"""
     auth_data = parse_authoritative_csv(auth_file, year)
-    print(f"  Found {len(auth_data)} entries")
-
-    print(f"Loading generated calendar...")
-    gen_data = load_generated_calendar()
-    gen_year_data = {k: v for k, v in gen_data.items() if k.startswith(str(year))}
-    print(f"  Found {len(gen_year_data)} entries for {year}")
-
-    # Validation
     mismatches = []
-    season_errors = 0
-    week_errors = 0
-    missing_dates = 0
-
-    print(f"\nValidating dates...\n")
 
     for date_key, auth_entry in sorted(auth_data.items()):
         if date_key not in gen_year_data:
-            missing_dates += 1
             mismatches.append({
                 'date': date_key,
                 'type': 'MISSING',
@@ -161,36 +55,49 @@ def validate_year(year, auth_file):
 
         gen_entry = gen_year_data[date_key]
 
-        # Compare season
-        season_match = auth_entry['season'] == gen_entry['season']
-
-        # Compare week (more lenient - only compare if auth has a week)
-        week_match = True
-        if auth_entry['week'] is not None:
-            week_match = auth_entry['week'] == gen_entry['week']
-
-        if not season_match:
-            season_errors += 1
-            mismatches.append({
-                'date': date_key,
-                'type': 'SEASON',
-                'auth': auth_entry,
-                'gen': gen_entry
-            })
-        elif not week_match:
-            week_errors += 1
+        # Compare season, then week (more lenient - only compared if auth has a week)
+        error = season_week_error(auth_entry, gen_entry)
+        if error:
             mismatches.append({
                 'date': date_key,
-                'type': 'WEEK',
+                'type': error,
                 'auth': auth_entry,
                 'gen': gen_entry
             })
 
+    return len(auth_data), mismatches
+
+def _check_year(task):
+    return check_year(*task)
+
+def check_years(tasks, workers=1):
+    """Yield check_year results for [(year, auth_file, gen_year_data)] in order, in a process pool"""
+    if workers <= 1 or len(tasks) <= 1:
+        yield from map(_check_year, tasks)
+        return
+    with ProcessPoolExecutor(max_workers=min(workers, len(tasks))) as pool:
+        yield from pool.map(_check_year, tasks)
+
+def report_year(year, auth_file, auth_count, gen_count, mismatches):
+    """Print one year's validation results"""
+    print(f"\n{'='*80}")
+    print(f"VALIDATING {year}")
+    print(f"{'='*80}\n")
+
+    print(f"Loaded authoritative data from {auth_file}")
+    print(f"  Found {auth_count} entries")
+    print(f"  Found {gen_count} generated entries for {year}")
+
+    counts = defaultdict(int)
+    for m in mismatches:
+        counts[m['type']] += 1
+    missing_dates, season_errors, week_errors = counts['MISSING'], counts['SEASON'], counts['WEEK']
+
     # Report results
     print(f"{'='*80}")
     print(f"VALIDATION RESULTS FOR {year}")
     print(f"{'='*80}")
-    print(f"Total dates checked: {len(auth_data)}")
+    print(f"Total dates checked: {auth_count}")
     print(f"Missing dates: {missing_dates}")
     print(f"Season mismatches: {season_errors}")
     print(f"Week mismatches: {week_errors}")
@@ -231,30 +138,42 @@ def validate_year(year, auth_file):
     return len(mismatches) == 0
 
 def main():
+    parser = argparse.ArgumentParser(description='Validate the generated calendar against every authoritative Ordo year')
+    parser.add_argument('years', nargs='*', type=int, help='Years to validate (default: every source file)')
+    parser.add_argument('--source-dir', default=SOURCE_DIR, help=f'Directory of <year>.csv files (default {SOURCE_DIR})')
+    parser.add_argument('--calendar', default=CALENDAR_CSV, help=f'Generated calendar CSV (default {CALENDAR_CSV})')
+    parser.add_argument('--workers', type=int, help='Worker processes (default: all cores, 1 = serial)')
+    args = parser.parse_args()
+
     print("="*80)
     print("COMPREHENSIVE LITURGICAL CALENDAR VALIDATION")
     print("="*80)
 
-    all_pass = True
+    sources = [(year, path) for year, path in find_ordo_sources(args.source_dir)
+               if not args.years or year in args.years]
+    for year in sorted(set(args.years) - {year for year, _ in sources}):
+        print(f"\n⚠️  {year}.csv not found - skipping {year} validation")
 
-    # Validate 2025
-    if not validate_year(2025, 'data/source/2025.csv'):
-        all_pass = False
+    print(f"\nLoading generated calendar from {args.calendar}...")
+    generated = load_generated_calendar(args.calendar)
+    print(f"  {sum(map(len, generated.values()))} entries, years {min(generated, default='-')}-{max(generated, default='-')}")
 
-    # Validate 2026 if file exists
-    try:
-        if not validate_year(2026, 'data/source/2026.csv'):
+    tasks = [(year, path, generated.get(year, {})) for year, path in sources]
+    workers = args.workers or os.cpu_count() or 1
+    all_pass = True
+    for (year, path, gen_year_data), (auth_count, mismatches) in zip(tasks, check_years(tasks, workers)):
+        if not report_year(year, path, auth_count, len(gen_year_data), mismatches):
             all_pass = False
-    except FileNotFoundError:
-        print("\n⚠️  2026.csv not found - skipping 2026 validation")
 
     # Final summary
     print("\n" + "="*80)
     if all_pass:
-        print("✅ ALL YEARS VALIDATED SUCCESSFULLY!")
+        print(f"✅ ALL {len(sources)} YEARS VALIDATED SUCCESSFULLY!")
     else:
         print("❌ VALIDATION FAILED - See errors above")
     print("="*80)
+    if not all_pass:
+        raise SystemExit(1)
 
 if __name__ == '__main__':
     main()
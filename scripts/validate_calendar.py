@@ -0,0 +1,319 @@
+#!/usr/bin/env python3
+"""
+Validate the generated liturgical calendar against the authoritative Ordo, for CI.
+
+One pass: the authoritative days of every data/source/<year>.csv (parsed once by
+ordo_source) and the rows of liturgical_calendar_full.csv are both date-sorted
+streams, merge-joined by date in O(n). Every mismatch is reported, with its type:
+
+  MISSING      Authoritative date absent from the generated calendar
+  EXTRA        Generated date, in an authoritative year, that the Ordo does not list
+  SEASON       Season differs
+  WEEK         Week differs (only checked when the season matches and the Ordo gives a week)
+  NAME_FUZZY   Name matches no Ordo celebration exactly, but one at >= 60% similarity
+  NAME         Name matches no Ordo celebration
+
+The complete report is written as JSON and CSV (no timestamps, so reports from
+two runs can be diffed). Exit status: 0 when clean, 1 when mismatches remain
+(after --ignore, or new since --baseline), 2 on unreadable or unsorted input.
+
+validate_all_years.py and validate_against_authoritative.py print human
+reports from the same rules (parse_authoritative_csv, season_week_error,
+match_name).
+
+Usage:
+  python scripts/validate_calendar.py                          # Every authoritative year
+  python scripts/validate_calendar.py 2026 --ignore NAME_FUZZY
+  python scripts/validate_calendar.py --baseline last_report.json   # Fail only on new mismatches
+"""
+
+import argparse
+import csv
+import io
+import json
+import re
+import sys
+from collections import Counter
+from difflib import SequenceMatcher
+from functools import lru_cache
+
+from file_cache import write_atomic
+from ordo_source import SOURCE_DIR, find_ordo_sources, load_ordo_source
+
+CALENDAR_CSV = 'data/generated/liturgical_calendar_full.csv'
+REPORT_JSON = 'data/generated/validation_report.json'
+REPORT_CSV = 'data/generated/validation_report.csv'
+MISMATCH_TYPES = ['MISSING', 'EXTRA', 'SEASON', 'WEEK', 'NAME_FUZZY', 'NAME']
+FUZZY_THRESHOLD = 0.6
+REPORT_FIELDS = ['date', 'type', 'expected_season', 'expected_week', 'actual_season', 'actual_week',
+                 'expected_names', 'actual_name', 'actual_rank', 'similarity']
+
+
+def parse_authoritative_csv(filename, year):
+    """Season/week state of each date of an authoritative Ordo file (parsed once by ordo_source)"""
+    entries = {}
+    current_week = None
+    current_season = 'Ordinary Time'
+
+    for day in load_ordo_source(filename, year):
+        description = day.celebrations[0]
+        upper = description.upper()
+
+        # Detect week numbers from description
+        # Format: "2 ORDINARY", "3 LENT", "FIRST SUNDAY OF ADVENT"
+        if day.rank == 'Sunday':
+            current_week = day.week
+            current_season = day.season
+        elif 'FIRST SUNDAY OF ADVENT' in upper:
+            current_week = 1
+            current_season = 'Advent'
+        elif 'PASSION SUNDAY' in upper or 'PALM SUNDAY' in upper:
+            current_season = 'Holy Week'
+            current_week = None
+        elif 'EASTER SUNDAY' in upper:
+            current_season = 'Easter'
+            current_week = 1
+        elif 'Christmas' in description or 'NATIVITY OF THE LORD' in upper:
+            current_season = 'Christmas'
+            current_week = None
+
+        # Weekdays carry their week: "Monday of the first week in Ordinary Time",
+        # "Friday of the fifth week of Lent"
+        if day.rank != 'Sunday' and day.week is not None:
+            current_week = day.week
+            if day.season != 'Ordinary Time':
+                current_season = day.season
+
+        entries[day.date] = {
+            'date': day.date,
+            'season': current_season,
+            'week': current_week,
+            'description': description,
+            'names': day.celebrations
+        }
+
+    return entries
+
+
+@lru_cache(maxsize=None)
+def normalize_name(name):
+    """Normalize liturgical names for comparison"""
+    name = name.upper().strip()
+    # Remove common variations
+    name = re.sub(r'\s+', ' ', name)  # Multiple spaces to single
+    name = re.sub(r'[,.]', '', name)  # Remove commas and periods
+    name = re.sub(r'\bST\b', 'SAINT', name)
+    name = re.sub(r'\bSS\b', 'SAINTS', name)
+    name = re.sub(r'\bTHE\b', '', name)
+    name = re.sub(r'\bOF\b', '', name)
+    name = re.sub(r'\bIN\b', '', name)
+    name = re.sub(r'\bAND\b', '&', name)
+    # Remove extra words
+    name = re.sub(r'\(.*?\)', '', name)  # Remove parentheses content
+    name = re.sub(r'\s+', ' ', name).strip()
+    return name
+
+
+def similarity_ratio(str1, str2):
+    """Calculate similarity ratio between two strings"""
+    return SequenceMatcher(None, str1, str2).ratio()
+
+
+def season_week_error(auth_entry, gen_entry):
+    """'SEASON', 'WEEK' or None for an authoritative/generated pair (week only checked if the Ordo has one)"""
+    if auth_entry['season'] != gen_entry['season']:
+        return 'SEASON'
+    if auth_entry['week'] is not None and auth_entry['week'] != gen_entry['week']:
+        return 'WEEK'
+    return None
+
+
+def match_name(auth_names, our_name):
+    """(exact, best similarity ratio) of a generated name against a date's Ordo celebrations"""
+    best_ratio = 0
+    norm_our = normalize_name(our_name)
+    for auth_name in auth_names:
+        if our_name == auth_name:
+            return True, 1.0
+        norm_auth = normalize_name(auth_name)
+        if norm_auth == norm_our:
+            return True, 1.0
+        best_ratio = max(best_ratio, similarity_ratio(norm_auth, norm_our))
+    return False, best_ratio
+
+
+def iter_authoritative(sources):
+    """Authoritative entries of [(year, path)] in date order"""
+    for year, path in sources:
+        # Per-year sort: the season state follows file order, but the Ordo may list a date late
+        yield from sorted(parse_authoritative_csv(path, year).values(), key=lambda entry: entry['date'])
+
+
+def iter_generated(filename=CALENDAR_CSV):
+    """Generated calendar rows in file (date) order"""
+    with open(filename, 'r', encoding='utf-8', newline='') as f:
+        for row in csv.DictReader(f):
+            week = row['liturgical_week']
+            yield {
+                'date': row['calendar_date'],
+                'season': row['liturgical_season'],
+                'week': int(week) if week else None,
+                'name': row['liturgical_name'],
+                'rank': row['liturgical_rank']
+            }
+
+
+def _ascending(entries, label):
+    previous = ''
+    for entry in entries:
+        if entry['date'] <= previous:
+            raise ValueError(f"{label} is not sorted by date: {entry['date']} after {previous}")
+        previous = entry['date']
+        yield entry
+
+
+def join_by_date(auth_entries, gen_entries):
+    """Full outer merge-join of two date-sorted streams: yields (date, auth or None, gen or None)"""
+    gen_entries = iter(gen_entries)
+    gen = next(gen_entries, None)
+    for auth in auth_entries:
+        while gen is not None and gen['date'] < auth['date']:
+            yield gen['date'], None, gen
+            gen = next(gen_entries, None)
+        if gen is not None and gen['date'] == auth['date']:
+            yield auth['date'], auth, gen
+            gen = next(gen_entries, None)
+        else:
+            yield auth['date'], auth, None
+    while gen is not None:
+        yield gen['date'], None, gen
+        gen = next(gen_entries, None)
+
+
+def _mismatch(date, mismatch_type, auth, gen, similarity=None):
+    return {
+        'date': date,
+        'type': mismatch_type,
+        'expected_season': auth['season'] if auth else None,
+        'expected_week': auth['week'] if auth else None,
+        'actual_season': gen['season'] if gen else None,
+        'actual_week': gen['week'] if gen else None,
+        'expected_names': list(auth['names']) if auth else [],
+        'actual_name': gen['name'] if gen else None,
+        'actual_rank': gen['rank'] if gen else None,
+        'similarity': round(similarity, 3) if similarity is not None else None,
+    }
+
+
+def validate(sources, calendar_file=CALENDAR_CSV):
+    """(summary, mismatches) for the authoritative [(year, path)] against the generated calendar"""
+    years = {str(year) for year, _ in sources}
+    auth_entries = _ascending(iter_authoritative(sources), 'Authoritative Ordo')
+    gen_entries = _ascending(iter_generated(calendar_file), calendar_file)
+
+    mismatches = []
+    checked = Counter()
+    for date, auth, gen in join_by_date(auth_entries, gen_entries):
+        year = date[:4]
+        if auth is None:
+            if year in years:
+                mismatches.append(_mismatch(date, 'EXTRA', None, gen))
+            continue
+        checked[year] += 1
+        if gen is None:
+            mismatches.append(_mismatch(date, 'MISSING', auth, None))
+            continue
+        error = season_week_error(auth, gen)
+        if error:
+            mismatches.append(_mismatch(date, error, auth, gen))
+        exact, ratio = match_name(auth['names'], gen['name'])
+        if not exact:
+            mismatches.append(_mismatch(date, 'NAME_FUZZY' if ratio >= FUZZY_THRESHOLD else 'NAME', auth, gen, ratio))
+
+    by_year = {}
+    for year in sorted(checked):
+        counts = Counter(m['type'] for m in mismatches if m['date'].startswith(year))
+        by_year[year] = {'dates': checked[year], **{t: counts[t] for t in MISMATCH_TYPES}}
+    counts = Counter(m['type'] for m in mismatches)
+    summary = {
+        'calendar': calendar_file,
+        'sources': [path for _, path in sources],
+        'dates': sum(checked.values()),
+        'mismatches': len(mismatches),
+        'by_type': {t: counts[t] for t in MISMATCH_TYPES},
+        'by_year': by_year,
+    }
+    return summary, mismatches
+
+
+def write_json_report(summary, mismatches, filename=REPORT_JSON):
+    report = json.dumps({'summary': summary, 'mismatches': mismatches}, indent=2, ensure_ascii=False)
+    write_atomic(filename, report + '\n')
+
+
+def write_csv_report(mismatches, filename=REPORT_CSV):
+    buffer = io.StringIO(newline='')
+    writer = csv.DictWriter(buffer, fieldnames=REPORT_FIELDS)
+    writer.writeheader()
+    for mismatch in mismatches:
+        writer.writerow(dict(mismatch, expected_names=' | '.join(mismatch['expected_names'])))
+    write_atomic(filename, buffer.getvalue())
+
+
+def load_report_keys(filename):
+    """{(date, type)} of a previous JSON report"""
+    with open(filename, 'r', encoding='utf-8') as f:
+        return {(m['date'], m['type']) for m in json.load(f)['mismatches']}
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Validate the generated calendar against the authoritative Ordo (CI)')
+    parser.add_argument('years', nargs='*', type=int, help='Years to validate (default: every source file)')
+    parser.add_argument('--source-dir', default=SOURCE_DIR, help=f'Directory of <year>.csv files (default {SOURCE_DIR})')
+    parser.add_argument('--calendar', default=CALENDAR_CSV, help=f'Generated calendar CSV (default {CALENDAR_CSV})')
+    parser.add_argument('--json', default=REPORT_JSON, help=f'JSON report (default {REPORT_JSON})')
+    parser.add_argument('--csv', default=REPORT_CSV, help=f'CSV report (default {REPORT_CSV})')
+    parser.add_argument('--ignore', nargs='+', default=[], choices=MISMATCH_TYPES, metavar='TYPE',
+                        help=f'Mismatch types reported but not failing ({", ".join(MISMATCH_TYPES)})')
+    parser.add_argument('--baseline', help='Previous JSON report: fail only on mismatches not in it')
+    args = parser.parse_args()
+
+    sources = [(year, path) for year, path in find_ordo_sources(args.source_dir)
+               if not args.years or year in args.years]
+    missing_years = sorted(set(args.years) - {year for year, _ in sources})
+    if not sources or missing_years:
+        print(f"❌ No authoritative Ordo file for {', '.join(map(str, missing_years)) or 'any year'} "
+              f"in {args.source_dir}/", file=sys.stderr)
+        raise SystemExit(2)
+
+    try:
+        baseline = load_report_keys(args.baseline) if args.baseline else None
+        summary, mismatches = validate(sources, args.calendar)
+    except (OSError, ValueError, KeyError) as e:
+        print(f"❌ {e}", file=sys.stderr)
+        raise SystemExit(2)
+
+    write_json_report(summary, mismatches, args.json)
+    write_csv_report(mismatches, args.csv)
+
+    print(f"Validated {summary['dates']:,} dates ({', '.join(summary['by_year'])}) against {args.calendar}")
+    print(f"  {'Year':<6} {'Dates':>6} " + ' '.join(f"{t:>10}" for t in MISMATCH_TYPES))
+    for year, row in summary['by_year'].items():
+        print(f"  {year:<6} {row['dates']:>6} " + ' '.join(f"{row[t]:>10}" for t in MISMATCH_TYPES))
+    print(f"  Report: {args.json}, {args.csv} ({len(mismatches)} mismatches)")
+
+    failing = [m for m in mismatches if m['type'] not in args.ignore]
+    if baseline is not None:
+        current = {(m['date'], m['type']) for m in mismatches}
+        failing = [m for m in failing if (m['date'], m['type']) not in baseline]
+        print(f"  Baseline {args.baseline}: {len(failing)} new, {len(baseline - current)} resolved")
+
+    if failing:
+        counts = Counter(m['type'] for m in failing)
+        print(f"❌ {len(failing)} failing mismatches: " + ', '.join(f"{t} {counts[t]}" for t in MISMATCH_TYPES if counts[t]))
+        raise SystemExit(1)
+    print("✅ No failing mismatches")
+
+
+if __name__ == '__main__':
+    main()